@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 
-from .models import User
+from .models import RevokedToken, User
 
 
 @admin.register(User)
@@ -17,3 +17,10 @@ class UserAdmin(BaseUserAdmin):
     add_fieldsets = BaseUserAdmin.add_fieldsets + (
         (None, {"classes": ("wide",), "fields": ("role",)}),
     )
+
+
+@admin.register(RevokedToken)
+class RevokedTokenAdmin(admin.ModelAdmin):
+    list_display = ("jti", "user", "expires_at", "created_at")
+    search_fields = ("jti", "user__username")
+    readonly_fields = ("jti", "user", "expires_at", "created_at")
@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+# Everything request handling reads from the user besides its id.
+USER_CLAIMS = ("role", "is_staff", "is_active")
+
+
+def add_user_claims(token, user):
+    """Copy ``USER_CLAIMS`` from ``user`` onto ``token`` and stamp it as issued now."""
+    for claim in USER_CLAIMS:
+        token[claim] = getattr(user, claim)
+    token.set_iat()
+    return token
+
+
+class UserClaimsCache:
+    """
+    Bounded, per-process LRU of ``{user id: claims}`` read from the database.
+
+    Holds up to ``AUTH_USER_CACHE_SIZE`` users, each for
+    ``AUTH_USER_CACHE_SECONDS``. Saving or deleting a user evicts it in the
+    current process; other workers pick the change up on expiry.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id, load):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and now - entry[0] < settings.AUTH_USER_CACHE_SECONDS:
+                self._entries.move_to_end(user_id)
+                return entry[1]
+        claims = load(user_id)
+        if claims is not None:
+            with self._lock:
+                self._entries[user_id] = (now, claims)
+                self._entries.move_to_end(user_id)
+                while len(self._entries) > settings.AUTH_USER_CACHE_SIZE:
+                    self._entries.popitem(last=False)
+        return claims
+
+    def evict(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+user_claims_cache = UserClaimsCache()
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    ``JWTAuthentication`` that builds ``request.user`` without a query.
+
+    Tokens issued by the login and refresh endpoints carry ``USER_CLAIMS``.
+    While a token is younger than ``AUTH_USER_CACHE_SECONDS`` the user is
+    built from those claims; older tokens, and tokens without the claims,
+    are resolved through ``user_claims_cache``, which costs at most one query
+    per user per interval in each worker. Either way, a role change or
+    deactivation takes effect within ``AUTH_USER_CACHE_SECONDS``.
+
+    The user is a real ``User`` instance holding only the id and claim fields;
+    any other attribute is loaded from the database on first access. Tokens
+    revoked through ``accounts.revocation`` are rejected.
+    """
+
+    def get_validated_token(self, raw_token):
+        from .revocation import revocations
+
+        validated_token = super().get_validated_token(raw_token)
+        if revocations.is_revoked(validated_token.get(api_settings.JTI_CLAIM)):
+            raise InvalidToken(_("Token has been revoked"))
+        return validated_token
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # Needs the stored password hash, so always hits the database.
+            return super().get_user(validated_token)
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        claims = self.token_claims(validated_token)
+        if claims is None:
+            claims = user_claims_cache.get(user_id, self.load_claims)
+        if claims is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if not claims["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        # ``from_db`` takes the values in the model's field order.
+        loaded = {api_settings.USER_ID_FIELD: user_id, **claims}
+        fields = [
+            field.attname
+            for field in self.user_model._meta.concrete_fields
+            if field.attname in loaded
+        ]
+        return self.user_model.from_db(
+            router.db_for_read(self.user_model), fields, [loaded[name] for name in fields]
+        )
+
+    def token_claims(self, validated_token):
+        issued_at = validated_token.get("iat")
+        if issued_at is None or time.time() - issued_at >= settings.AUTH_USER_CACHE_SECONDS:
+            return None
+        try:
+            return {claim: validated_token[claim] for claim in USER_CLAIMS}
+        except KeyError:
+            return None
+
+    def load_claims(self, user_id):
+        users = self.user_model.objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+        return users.values(*USER_CLAIMS).first()
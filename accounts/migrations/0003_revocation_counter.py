@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+def create_counter(apps, schema_editor):
+    RevocationCounter = apps.get_model("accounts", "RevocationCounter")
+    RevocationCounter.objects.using(schema_editor.connection.alias).get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_revoked_token'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevocationCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(create_counter, migrations.RunPython.noop),
+    ]
@@ -14,3 +14,35 @@ class User(AbstractUser):
         if self.role == self.RoleChoices.ADMIN:
             self.is_staff = True
         super().save(*args, **kwargs)
+
+
+class RevokedToken(models.Model):
+    """A revoked JWT, kept until the token would have expired anyway."""
+
+    jti = models.CharField(max_length=255, unique=True)
+    user = models.ForeignKey(
+        User, null=True, blank=True, on_delete=models.CASCADE, related_name="revoked_tokens"
+    )
+    expires_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["expires_at"]),
+            models.Index(fields=["created_at"]),
+        ]
+
+    def __str__(self):
+        return self.jti
+
+
+class RevocationCounter(models.Model):
+    """
+    Single row counting revocations.
+
+    Workers poll it to learn that their revocation filters are out of date.
+    It lives in the database, next to the rows it counts, so every worker sees
+    it whatever cache is configured.
+    """
+
+    value = models.BigIntegerField(default=0)
@@ -0,0 +1,182 @@
+import math
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from .models import RevocationCounter, RevokedToken, User
+
+# Incremental syncs re-read this much history so rows from transactions that
+# committed out of order are not missed; adding a jti twice is harmless.
+SYNC_OVERLAP = timedelta(minutes=5)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Positions come from Python's built-in ``hash`` with double hashing. That
+    hash is salted per process, which is fine because every worker builds its
+    own filter.
+    """
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = max(capacity, 1)
+        self.size = max(int(-self.capacity * math.log(error_rate) / math.log(2) ** 2), 64)
+        self.hashes = max(round(self.size / self.capacity * math.log(2)), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def add(self, key):
+        value = hash(key)
+        first, step = value & 0xFFFFFFFF, (value >> 32) | 1
+        for index in range(self.hashes):
+            position = (first + index * step) % self.size
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        if not self.count:
+            return False
+        value = hash(key)
+        first, step = value & 0xFFFFFFFF, (value >> 32) | 1
+        bits, size = self.bits, self.size
+        for index in range(self.hashes):
+            position = (first + index * step) % size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+class RevocationVersion:
+    """
+    The ``RevocationCounter`` value, re-read at most every ``SHARED_VERSION_CHECK_SECONDS``.
+
+    ``bump()`` runs inside the revoking transaction, so the new value becomes
+    visible together with the ``RevokedToken`` row. The calling process does
+    not take the new value for itself: it may not have seen revocations other
+    workers made, and its next read picks them up along with its own.
+    """
+
+    def __init__(self):
+        self._value = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def current(self):
+        now = time.monotonic()
+        if self._value is None or now - self._checked_at >= settings.SHARED_VERSION_CHECK_SECONDS:
+            value = RevocationCounter.objects.values_list("value", flat=True).first() or 0
+            with self._lock:
+                self._value, self._checked_at = value, now
+        return self._value
+
+    def bump(self):
+        counters = RevocationCounter.objects.filter(pk=1)
+        if not counters.update(value=F("value") + 1):
+            # The row is created by a migration; recreate it after a flush.
+            RevocationCounter.objects.get_or_create(pk=1)
+            counters.update(value=F("value") + 1)
+
+
+revocation_version = RevocationVersion()
+
+
+class RevocationList:
+    """
+    Per-process view of ``RevokedToken`` with a Bloom filter in front.
+
+    ``is_revoked`` answers from the filter alone for tokens that were never
+    revoked, and only queries the database on a filter hit. ``revoke`` bumps
+    the ``RevocationCounter`` row in the same transaction. A worker that sees
+    a new value (checked at most every ``SHARED_VERSION_CHECK_SECONDS``) adds
+    the rows revoked since its last sync. The filter is rebuilt from unexpired rows every
+    ``TOKEN_REVOCATION_REBUILD_SECONDS``, or when it outgrows its capacity,
+    so pruned entries stop producing false positives.
+    """
+
+    def __init__(self):
+        self._filter = None
+        self._version = None
+        self._synced_at = None
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+    def is_revoked(self, jti):
+        self.sync()
+        if jti not in self._filter:
+            return False
+        return RevokedToken.objects.filter(jti=jti, expires_at__gt=timezone.now()).exists()
+
+    def sync(self):
+        version = revocation_version.current()
+        stale = time.monotonic() - self._built_at >= settings.TOKEN_REVOCATION_REBUILD_SECONDS
+        if version == self._version and not stale:
+            return
+        with self._lock:
+            if self._filter is None or stale or self._filter.count >= self._filter.capacity:
+                self._rebuild(version)
+            elif version != self._version:
+                self._add_since(self._synced_at - SYNC_OVERLAP, version)
+
+    def reset(self):
+        with self._lock:
+            self._filter, self._version, self._built_at = None, None, 0.0
+
+    def _rebuild(self, version):
+        synced_at = timezone.now()
+        jtis = list(
+            RevokedToken.objects.filter(expires_at__gt=synced_at).values_list("jti", flat=True)
+        )
+        bloom = BloomFilter(
+            max(settings.TOKEN_REVOCATION_CAPACITY, 2 * len(jtis)),
+            settings.TOKEN_REVOCATION_ERROR_RATE,
+        )
+        for jti in jtis:
+            bloom.add(jti)
+        self._filter, self._version, self._synced_at = bloom, version, synced_at
+        self._built_at = time.monotonic()
+
+    def _add_since(self, since, version):
+        synced_at = timezone.now()
+        for jti in RevokedToken.objects.filter(created_at__gte=since).values_list(
+            "jti", flat=True
+        ):
+            self._filter.add(jti)
+        self._version, self._synced_at = version, synced_at
+
+    def revoke(self, token):
+        """
+        Revoke a validated simplejwt token and prune expired revocations.
+
+        The token's ``jti`` is added to this process's filter at once; other
+        workers see it after their next version check.
+        """
+        jti = token[api_settings.JTI_CLAIM]
+        # The user may already have been deleted (a departed collector).
+        users = User.objects.filter(
+            **{api_settings.USER_ID_FIELD: token.get(api_settings.USER_ID_CLAIM)}
+        )
+        user_id = users.values_list("pk", flat=True).first()
+        with transaction.atomic():
+            RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+            RevokedToken.objects.get_or_create(
+                jti=jti,
+                defaults={
+                    "user_id": user_id,
+                    "expires_at": datetime_from_epoch(token["exp"]),
+                },
+            )
+            revocation_version.bump()
+        with self._lock:
+            if self._filter is not None:
+                self._filter.add(jti)
+
+
+revocations = RevocationList()
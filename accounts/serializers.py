@@ -1,5 +1,12 @@
 from django.contrib.auth import get_user_model
-from rest_framework import serializers
+from rest_framework import exceptions, serializers
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import UntypedToken
+
+from .authentication import add_user_claims
+from .revocation import revocations
 
 User = get_user_model()
 
@@ -27,3 +34,63 @@ class RegisterSerializer(serializers.ModelSerializer):
         user.set_password(validated_data["password"])
         user.save()
         return user
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Login that embeds the user's role and status claims in both tokens."""
+
+    @classmethod
+    def get_token(cls, user):
+        return add_user_claims(super().get_token(user), user)
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh that re-reads the user, so the new access token carries current
+    claims and a fresh ``iat``; deactivated or deleted users cannot refresh.
+    """
+
+    default_error_messages = {
+        "no_active_account": "No active account found with the given credentials"
+    }
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        if revocations.is_revoked(refresh.get(api_settings.JTI_CLAIM)):
+            raise InvalidToken("Token has been revoked")
+        user = User.objects.filter(
+            **{api_settings.USER_ID_FIELD: refresh.get(api_settings.USER_ID_CLAIM)}
+        ).first()
+        if not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise exceptions.AuthenticationFailed(
+                self.error_messages["no_active_account"], "no_active_account"
+            )
+        add_user_claims(refresh, user)
+
+        data = {"access": str(refresh.access_token)}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                try:
+                    refresh.blacklist()
+                except AttributeError:
+                    pass
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+        return data
+
+
+class RevokeTokenSerializer(serializers.Serializer):
+    token = serializers.CharField(required=False)
+
+    def validate_token(self, value):
+        try:
+            token = UntypedToken(value)
+        except TokenError as exc:
+            raise serializers.ValidationError(str(exc))
+        user = self.context["request"].user
+        is_admin = user.is_staff or user.role == User.RoleChoices.ADMIN
+        if token.get(api_settings.USER_ID_CLAIM) != user.pk and not is_admin:
+            raise exceptions.PermissionDenied("You can only revoke your own tokens.")
+        return token
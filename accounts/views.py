@@ -1,8 +1,30 @@
-from rest_framework import generics, permissions
+from rest_framework import generics, permissions, response, status
 
-from .serializers import RegisterSerializer
+from .revocation import revocations
+from .serializers import RegisterSerializer, RevokeTokenSerializer
 
 
 class RegisterView(generics.CreateAPIView):
     serializer_class = RegisterSerializer
     permission_classes = [permissions.AllowAny]
+
+
+class RevokeTokenView(generics.GenericAPIView):
+    """
+    Revoke ``token`` (an access or refresh token), or the access token used
+    for this request when none is given. Admins may revoke anyone's tokens.
+    """
+
+    serializer_class = RevokeTokenSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        token = serializer.validated_data.get("token") or request.auth
+        if token is None:
+            return response.Response(
+                {"token": ["This field is required."]}, status=status.HTTP_400_BAD_REQUEST
+            )
+        revocations.revoke(token)
+        return response.Response(status=status.HTTP_204_NO_CONTENT)
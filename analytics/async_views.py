@@ -0,0 +1,165 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views import View
+from rest_framework import exceptions
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from ewaste_api.exports import parse_date_range
+from suppliers.models import Supplier
+
+from .cache import acached_result
+from .queries import (
+    TOTALS,
+    monthly_entry,
+    monthly_queryset,
+    summary_payload,
+    summary_queries,
+    summary_totals,
+    today_payload,
+    today_queryset,
+)
+from .views import SupplierRankingPagination, SupplierRankingView
+
+
+async def today_data():
+    today = timezone.localdate()
+
+    async def compute():
+        return today_payload(today, await today_queryset(today).aaggregate(**TOTALS))
+
+    return await acached_result("today", {"date": today}, compute)
+
+
+async def monthly_data():
+    async def compute():
+        return {"monthly": [monthly_entry(entry) async for entry in monthly_queryset()]}
+
+    return await acached_result("monthly", {}, compute)
+
+
+async def summary_data():
+    today = timezone.localdate()
+
+    async def compute():
+        results = await asyncio.gather(
+            *(queryset.aaggregate(**sums) for queryset, sums in summary_queries(today))
+        )
+        return summary_payload(today, summary_totals(*results))
+
+    return await acached_result("summary", {"date": today}, compute)
+
+
+async def top_suppliers_data(limit):
+    async def compute():
+        suppliers = Supplier.objects.order_by(*SupplierRankingPagination.ordering)[:limit]
+        return [
+            {
+                "supplier_id": supplier.id,
+                "supplier_name": supplier.supplier_name,
+                "total_estimated_value": float(supplier.total_estimated_value),
+                "total_weight_kg": float(supplier.total_weight_kg),
+                "item_count": supplier.item_count,
+                "last_collected": supplier.last_collected,
+            }
+            async for supplier in suppliers
+        ]
+
+    return await acached_result("top-suppliers", {"limit": limit}, compute)
+
+
+class AsyncAnalyticsView(View):
+    """
+    Base for the native async analytics views.
+
+    DRF 3.14 views are sync-only, so these are plain Django async views that
+    authenticate with ``DEFAULT_AUTHENTICATION_CLASSES`` and answer with the
+    same payloads and error bodies as their DRF counterparts. Subclasses
+    define ``async compute(request)``, which returns the response payload.
+    """
+
+    http_method_names = ["get", "options"]
+
+    async def get(self, request, *args, **kwargs):
+        authenticators = [auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+        drf_request = Request(request, authenticators=authenticators)
+        try:
+            # Authenticators may hit the database (JWT user lookup).
+            user = await sync_to_async(lambda: drf_request.user)()
+            if not (user and user.is_authenticated):
+                raise exceptions.NotAuthenticated()
+            data = await self.compute(drf_request)
+        except exceptions.APIException as exc:
+            return self.error_response(exc, drf_request, authenticators)
+        return JsonResponse(data)
+
+    def error_response(self, exc, request, authenticators):
+        detail = exc.detail if isinstance(exc.detail, (dict, list)) else {"detail": exc.detail}
+        status = exc.status_code
+        response = JsonResponse(detail, status=status, safe=False)
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            header = authenticators[0].authenticate_header(request) if authenticators else None
+            if header:
+                response["WWW-Authenticate"] = header
+            else:
+                response.status_code = 403
+        return response
+
+
+class AsyncTodayAnalyticsView(AsyncAnalyticsView):
+    async def compute(self, request):
+        return await today_data()
+
+
+class AsyncMonthlyAnalyticsView(AsyncAnalyticsView):
+    async def compute(self, request):
+        return await monthly_data()
+
+
+class AsyncSummaryAnalyticsView(AsyncAnalyticsView):
+    async def compute(self, request):
+        return await summary_data()
+
+
+class AsyncSupplierRankingView(AsyncAnalyticsView):
+    """
+    ``SupplierRankingView`` under ASGI.
+
+    Keyset pagination is synchronous, so the page is computed in the ORM's
+    thread executor; the cache round trips stay on the event loop.
+    """
+
+    async def compute(self, request):
+        start, end = parse_date_range(request.query_params)
+        ranking = SupplierRankingView()
+        params = {"url": request.build_absolute_uri()}
+        return await acached_result(
+            "supplier-ranking",
+            params,
+            lambda: sync_to_async(ranking.compute)(request, start, end),
+        )
+
+
+class AsyncDashboardView(AsyncAnalyticsView):
+    """
+    Today, summary, monthly and the top suppliers in one response.
+
+    The four results are independent, so they are awaited together with
+    ``asyncio.gather``. Today, summary and monthly share their cache entries
+    with the standalone endpoints.
+    """
+
+    async def compute(self, request):
+        limit = SupplierRankingPagination.page_size
+        today, summary, monthly, suppliers = await asyncio.gather(
+            today_data(), summary_data(), monthly_data(), top_suppliers_data(limit)
+        )
+        return {
+            "today": today,
+            "summary": summary,
+            "monthly": monthly["monthly"],
+            "top_suppliers": suppliers,
+        }
@@ -0,0 +1,107 @@
+import asyncio
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from ewaste_api.cache import SharedVersion
+
+data_version = SharedVersion("analytics:data-version")
+
+# How often a worker with nothing to serve re-reads the cache while another
+# worker holds the recompute lock.
+RECOMPUTE_POLL_SECONDS = 0.05
+
+
+def invalidate_analytics():
+    """Mark every cached analytics result stale, now and again once the write commits."""
+    data_version.bump()
+    transaction.on_commit(data_version.bump)
+
+
+def _cache_key(name, params):
+    digest = hashlib.md5(
+        json.dumps(params, sort_keys=True, default=str).encode(), usedforsecurity=False
+    ).hexdigest()
+    return f"analytics:{name}:{digest}"
+
+
+def _is_fresh(entry, version):
+    if entry is None or entry["version"] != version:
+        return False
+    return entry.get("expires", 0) > time.time()
+
+
+def _entry(version, data):
+    expires = time.time() + settings.ANALYTICS_CACHE_SECONDS
+    return {"version": version, "data": data, "expires": expires}
+
+
+def cached_result(name, params, compute):
+    """
+    Return ``compute()`` for ``(name, params)``, cached against the data version.
+
+    Entries are kept without a cache timeout and go stale when the data version
+    changes or ``ANALYTICS_CACHE_SECONDS`` pass. The first worker to take the
+    recompute lock refreshes a stale entry while every other worker keeps
+    serving the previous value (stale-while-revalidate). When there is no
+    previous value at all, the others wait for the lock holder's result
+    instead of computing it too, so a burst always costs one recomputation.
+    """
+    key = _cache_key(name, params)
+    version = data_version.current()
+    entry = cache.get(key)
+    if _is_fresh(entry, version):
+        return entry["data"]
+
+    lock_key = f"{key}:lock"
+    lock_seconds = settings.ANALYTICS_RECOMPUTE_LOCK_SECONDS
+    while not cache.add(lock_key, True, timeout=lock_seconds):
+        if entry is not None:
+            return entry["data"]
+        time.sleep(RECOMPUTE_POLL_SECONDS)
+        entry = cache.get(key)
+    try:
+        # The previous lock holder may have just stored a fresh result.
+        entry = cache.get(key)
+        if _is_fresh(entry, version):
+            return entry["data"]
+        data = compute()
+        cache.set(key, _entry(version, data), timeout=None)
+    finally:
+        cache.delete(lock_key)
+    return data
+
+
+async def acached_result(name, params, compute):
+    """
+    ``cached_result`` for async views; ``compute`` is a coroutine function.
+
+    Entries and locks are shared with ``cached_result``, so a result cached by
+    a sync view is served to async callers and vice versa.
+    """
+    key = _cache_key(name, params)
+    version = await data_version.acurrent()
+    entry = await cache.aget(key)
+    if _is_fresh(entry, version):
+        return entry["data"]
+
+    lock_key = f"{key}:lock"
+    lock_seconds = settings.ANALYTICS_RECOMPUTE_LOCK_SECONDS
+    while not await cache.aadd(lock_key, True, timeout=lock_seconds):
+        if entry is not None:
+            return entry["data"]
+        await asyncio.sleep(RECOMPUTE_POLL_SECONDS)
+        entry = await cache.aget(key)
+    try:
+        entry = await cache.aget(key)
+        if _is_fresh(entry, version):
+            return entry["data"]
+        data = await compute()
+        await cache.aset(key, _entry(version, data), timeout=None)
+    finally:
+        await cache.adelete(lock_key)
+    return data
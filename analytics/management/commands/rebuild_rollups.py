@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from analytics.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Regenerate the daily collection rollup table and supplier totals from e-waste items"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rollup rows inserted per batch",
+        )
+
+    def handle(self, *args, **options):
+        created = rebuild_rollups(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {created} daily rollup rows, the monthly rollup and supplier totals"
+            )
+        )
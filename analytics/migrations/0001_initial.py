@@ -0,0 +1,73 @@
+# Generated by Django 4.2.10 on 2026-10-18 12:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_rollups(apps, schema_editor):
+    EWasteItem = apps.get_model('items', 'EWasteItem')
+    DailyCollectionRollup = apps.get_model('analytics', 'DailyCollectionRollup')
+    db_alias = schema_editor.connection.alias
+    totals = (
+        EWasteItem.objects.using(db_alias).order_by()
+        .values('date_collected', 'category_id', 'condition', 'source_supplier_id')
+        .annotate(
+            total_weight_kg=models.Sum('weight_kg', output_field=models.DecimalField(max_digits=16, decimal_places=3)),
+            total_estimated_value=models.Sum('estimated_value', output_field=models.DecimalField(max_digits=18, decimal_places=2)),
+            item_count=models.Count('id'),
+        )
+    )
+    DailyCollectionRollup.objects.using(db_alias).bulk_create(
+        [
+            DailyCollectionRollup(
+                date=row['date_collected'],
+                category_id=row['category_id'],
+                condition=row['condition'],
+                supplier_id=row['source_supplier_id'],
+                total_weight_kg=row['total_weight_kg'],
+                total_estimated_value=row['total_estimated_value'],
+                item_count=row['item_count'],
+            )
+            for row in totals.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('suppliers', '0001_initial'),
+        ('catalog', '0001_initial'),
+        ('items', '0002_keyset_ordering'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyCollectionRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('condition', models.CharField(choices=[('poor', 'Poor'), ('fair', 'Fair'), ('good', 'Good')], max_length=20)),
+                ('total_weight_kg', models.DecimalField(decimal_places=3, default=0, max_digits=16)),
+                ('total_estimated_value', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('item_count', models.IntegerField(default=0)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_rollups', to='catalog.itemcategory')),
+                ('supplier', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='daily_rollups', to='suppliers.supplier')),
+            ],
+            options={
+                'ordering': ['date', 'category', 'condition'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailycollectionrollup',
+            constraint=models.UniqueConstraint(condition=models.Q(('supplier__isnull', False)), fields=('date', 'category', 'condition', 'supplier'), name='rollup_unique_day_with_supplier'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailycollectionrollup',
+            constraint=models.UniqueConstraint(condition=models.Q(('supplier__isnull', True)), fields=('date', 'category', 'condition'), name='rollup_unique_day_without_supplier'),
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
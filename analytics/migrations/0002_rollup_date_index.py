@@ -0,0 +1,17 @@
+# Generated by Django 4.2.10 on 2026-10-18 12:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dailycollectionrollup',
+            index=models.Index(fields=['date', 'category', 'condition'], name='analytics_d_date_b17dfe_idx'),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 4.2.10 on 2026-10-18 13:44
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models.functions import TruncMonth
+
+
+def populate_monthly_rollups(apps, schema_editor):
+    DailyCollectionRollup = apps.get_model('analytics', 'DailyCollectionRollup')
+    MonthlyCollectionRollup = apps.get_model('analytics', 'MonthlyCollectionRollup')
+    db_alias = schema_editor.connection.alias
+    months = (
+        DailyCollectionRollup.objects.using(db_alias)
+        .annotate(month=TruncMonth('date'))
+        .order_by()
+        .values('month', 'category_id', 'condition')
+        .annotate(
+            weight=models.Sum('total_weight_kg'),
+            value=models.Sum('total_estimated_value'),
+            count=models.Sum('item_count'),
+        )
+    )
+    MonthlyCollectionRollup.objects.using(db_alias).bulk_create(
+        [
+            MonthlyCollectionRollup(
+                month=row['month'],
+                category_id=row['category_id'],
+                condition=row['condition'],
+                total_weight_kg=row['weight'],
+                total_estimated_value=row['value'],
+                item_count=row['count'],
+            )
+            for row in months.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0001_initial'),
+        ('analytics', '0002_rollup_date_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyCollectionRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='First day of the month')),
+                ('condition', models.CharField(choices=[('poor', 'Poor'), ('fair', 'Fair'), ('good', 'Good')], max_length=20)),
+                ('total_weight_kg', models.DecimalField(decimal_places=3, default=0, max_digits=16)),
+                ('total_estimated_value', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('item_count', models.IntegerField(default=0)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_rollups', to='catalog.itemcategory')),
+            ],
+            options={
+                'ordering': ['month', 'category', 'condition'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='monthlycollectionrollup',
+            constraint=models.UniqueConstraint(fields=('month', 'category', 'condition'), name='monthly_rollup_unique_key'),
+        ),
+        migrations.RunPython(populate_monthly_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,73 @@
+from django.db import models
+
+from catalog.models import ItemCategory
+from items.models import EWasteItem
+from suppliers.models import Supplier
+
+
+class DailyCollectionRollup(models.Model):
+    date = models.DateField()
+    category = models.ForeignKey(
+        ItemCategory, on_delete=models.CASCADE, related_name="daily_rollups"
+    )
+    condition = models.CharField(max_length=20, choices=EWasteItem.ConditionChoices.choices)
+    supplier = models.ForeignKey(
+        Supplier,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="daily_rollups",
+    )
+    total_weight_kg = models.DecimalField(max_digits=16, decimal_places=3, default=0)
+    total_estimated_value = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    item_count = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ["date", "category", "condition"]
+        indexes = [
+            models.Index(fields=["date", "category", "condition"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "category", "condition", "supplier"],
+                condition=models.Q(supplier__isnull=False),
+                name="rollup_unique_day_with_supplier",
+            ),
+            models.UniqueConstraint(
+                fields=["date", "category", "condition"],
+                condition=models.Q(supplier__isnull=True),
+                name="rollup_unique_day_without_supplier",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.date} | category {self.category_id} ({self.condition})"
+
+
+class MonthlyCollectionRollup(models.Model):
+    """
+    ``DailyCollectionRollup`` folded to one row per (month, category, condition).
+
+    Monthly history and the long summary windows read this table, so their
+    cost follows months x categories rather than days x suppliers.
+    """
+
+    month = models.DateField(help_text="First day of the month")
+    category = models.ForeignKey(
+        ItemCategory, on_delete=models.CASCADE, related_name="monthly_rollups"
+    )
+    condition = models.CharField(max_length=20, choices=EWasteItem.ConditionChoices.choices)
+    total_weight_kg = models.DecimalField(max_digits=16, decimal_places=3, default=0)
+    total_estimated_value = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    item_count = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ["month", "category", "condition"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["month", "category", "condition"], name="monthly_rollup_unique_key"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} | category {self.category_id} ({self.condition})"
@@ -0,0 +1,108 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q, Sum
+
+from .models import DailyCollectionRollup, MonthlyCollectionRollup
+
+# Query builders and payload formatters shared by the sync and async analytics
+# views, so both serve byte-for-byte the same data from the same SQL.
+
+TOTALS = {
+    "total_weight": Sum("total_weight_kg"),
+    "total_estimated_value": Sum("total_estimated_value"),
+    "items_collected": Sum("item_count"),
+}
+
+
+def today_queryset(today):
+    return DailyCollectionRollup.objects.filter(date=today)
+
+
+def today_payload(today, aggregates):
+    return {
+        "date": today.isoformat(),
+        "total_weight_kg": float(aggregates["total_weight"] or 0),
+        "total_estimated_value": float(aggregates["total_estimated_value"] or 0),
+        "items_collected": aggregates["items_collected"] or 0,
+    }
+
+
+def monthly_queryset():
+    return MonthlyCollectionRollup.objects.values("month").annotate(**TOTALS).order_by("month")
+
+
+def monthly_entry(entry):
+    return {
+        "month": entry["month"].strftime("%Y-%m") if entry["month"] else None,
+        "total_weight_kg": float(entry["total_weight"] or 0),
+        "total_estimated_value": float(entry["total_estimated_value"] or 0),
+        "items_collected": entry["items_collected"],
+    }
+
+
+def summary_windows(today):
+    """``{name: first day}`` of each summary window ending ``today``; ``None`` is unbounded."""
+    return {
+        "today": today,
+        "week_to_date": today - timedelta(days=today.weekday()),
+        "month_to_date": today.replace(day=1),
+        "year_to_date": today.replace(month=1, day=1),
+        "all_time": None,
+    }
+
+
+def _window_sums(prefix, condition):
+    return {
+        f"{prefix}_weight": Sum("total_weight_kg", filter=condition),
+        f"{prefix}_value": Sum("total_estimated_value", filter=condition),
+        f"{prefix}_count": Sum("item_count", filter=condition),
+    }
+
+
+def summary_queries(today):
+    """
+    ``(queryset, aggregates)`` pairs whose results ``summary_totals`` combines.
+
+    The windows that start this week or month sum the daily rollup from the
+    earlier of those two days. The year and all-time windows add whole months
+    from the monthly rollup, so no query grows with the length of the history.
+    """
+    windows = summary_windows(today)
+    month_start = windows["month_to_date"]
+    daily = {}
+    for name in ("today", "week_to_date", "month_to_date"):
+        daily.update(_window_sums(name, Q(date__gte=windows[name], date__lte=today)))
+    monthly = {
+        **_window_sums("earlier_months", Q(month__gte=windows["year_to_date"], month__lt=month_start)),
+        **_window_sums("all_time", None),
+    }
+    recent = DailyCollectionRollup.objects.filter(
+        date__gte=min(windows["week_to_date"], month_start), date__lte=today
+    )
+    return [(recent, daily), (MonthlyCollectionRollup.objects.all(), monthly)]
+
+
+def summary_totals(daily, monthly):
+    totals = {**daily, **monthly}
+    for metric in ("weight", "value", "count"):
+        totals[f"year_to_date_{metric}"] = (monthly[f"earlier_months_{metric}"] or 0) + (
+            daily[f"month_to_date_{metric}"] or 0
+        )
+    return totals
+
+
+def summary_payload(today, totals):
+    return {
+        "date": today.isoformat(),
+        "timezone": settings.TIME_ZONE,
+        "windows": {
+            name: {
+                "start": start.isoformat() if start else None,
+                "total_weight_kg": float(totals[f"{name}_weight"] or 0),
+                "total_estimated_value": float(totals[f"{name}_value"] or 0),
+                "items_collected": totals[f"{name}_count"] or 0,
+            }
+            for name, start in summary_windows(today).items()
+        },
+    }
@@ -0,0 +1,318 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import connections, router, transaction
+from django.db.models import (
+    Case,
+    Count,
+    DecimalField,
+    F,
+    IntegerField,
+    Max,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Greatest, TruncMonth
+
+from items.models import EWasteItem
+from suppliers.models import Supplier
+
+from .cache import invalidate_analytics
+from .models import DailyCollectionRollup, MonthlyCollectionRollup
+
+ITEM_STATE_FIELDS = (
+    "date_collected",
+    "category_id",
+    "condition",
+    "source_supplier_id",
+    "weight_kg",
+    "estimated_value",
+)
+
+
+def item_state(item):
+    """Snapshot of the item fields the rollup depends on."""
+    return tuple(getattr(item, field) for field in ITEM_STATE_FIELDS)
+
+
+TOTAL_FIELDS = ("total_weight_kg", "total_estimated_value", "item_count")
+
+# Supplier rows per ``UPDATE``; each one adds a few ``CASE`` parameters.
+SUPPLIER_BATCH_SIZE = 250
+
+
+def _upsert_totals(model, key_fields, rows, conflict_condition=""):
+    """
+    Add ``rows`` of ``(*key, weight, value, count)`` to ``model`` in set-based statements.
+
+    One ``INSERT ... ON CONFLICT DO UPDATE`` per batch creates missing keys and
+    increments existing ones, which SQLite and Postgres both run. Rows whose
+    count drops to zero are then removed with one ``DELETE``.
+    """
+    rows = [row for row in rows if any(row[-3:])]
+    if not rows:
+        return
+    connection = connections[router.db_for_write(model)]
+    quote = connection.ops.quote_name
+    fields = [model._meta.get_field(name) for name in (*key_fields, *TOTAL_FIELDS)]
+    table = quote(model._meta.db_table)
+    columns = ", ".join(quote(field.column) for field in fields)
+    conflict = ", ".join(quote(field.column) for field in fields[: len(key_fields)])
+    if conflict_condition:
+        conflict = f"{conflict}) WHERE ({conflict_condition}"
+    updates = ", ".join(
+        f"{quote(name)} = {table}.{quote(name)} + excluded.{quote(name)}" for name in TOTAL_FIELDS
+    )
+    row_sql = f"({', '.join(['%s'] * len(fields))})"
+    batch_size = max(connection.ops.bulk_batch_size(fields, rows), 1)
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) VALUES {', '.join([row_sql] * len(batch))} "
+                f"ON CONFLICT ({conflict}) DO UPDATE SET {updates}",
+                [
+                    field.get_db_prep_save(value, connection)
+                    for row in batch
+                    for field, value in zip(fields, row)
+                ],
+            )
+    if any(row[-1] < 0 for row in rows):
+        key_name = key_fields[0]
+        model.objects.filter(
+            **{f"{key_name}__in": {row[0] for row in rows}, "item_count__lte": 0}
+        ).delete()
+
+
+def _bump_days(deltas):
+    """Apply ``{(date, category_id, condition, supplier_id): [weight, value, count]}``."""
+    keys = ("date", "category", "condition", "supplier")
+    with_supplier, without_supplier = [], []
+    for key, totals in deltas.items():
+        if key[3] is None:
+            without_supplier.append((*key[:3], *totals))
+        else:
+            with_supplier.append((*key, *totals))
+    # The conflict targets name the partial unique constraints on the rollup.
+    _upsert_totals(DailyCollectionRollup, keys, with_supplier, '"supplier_id" IS NOT NULL')
+    _upsert_totals(DailyCollectionRollup, keys[:3], without_supplier, '"supplier_id" IS NULL')
+
+
+def _bump_months(deltas):
+    """Fold ``{(date, category_id, condition, supplier_id): [weight, value, count]}`` into months."""
+    months = defaultdict(lambda: [Decimal("0"), Decimal("0"), 0])
+    for (date, category_id, condition, _), (weight, value, count) in deltas.items():
+        month = months[(date.replace(day=1), category_id, condition)]
+        month[0] += weight
+        month[1] += value
+        month[2] += count
+    _upsert_totals(
+        MonthlyCollectionRollup,
+        ("month", "category", "condition"),
+        [(*key, *totals) for key, totals in months.items()],
+    )
+
+
+def _latest_collection():
+    return Subquery(
+        EWasteItem.objects.filter(source_supplier=OuterRef("pk"))
+        .order_by("-date_collected")
+        .values("date_collected")[:1]
+    )
+
+
+def _bump_suppliers(suppliers):
+    """
+    Apply ``{supplier_id: [weight, value, count, latest, recheck_latest]}`` to the totals.
+
+    Each batch of suppliers is one ``UPDATE`` with a ``CASE`` per column.
+    ``latest`` raises ``last_collected``; ``recheck_latest`` recomputes it after
+    removals.
+    """
+    amount_fields = (
+        ("total_weight_kg", DecimalField(max_digits=16, decimal_places=3)),
+        ("total_estimated_value", DecimalField(max_digits=18, decimal_places=2)),
+        ("item_count", IntegerField()),
+    )
+    entries = [(pk, totals) for pk, totals in suppliers.items() if any(totals[:3]) or totals[4]]
+    for start in range(0, len(entries), SUPPLIER_BATCH_SIZE):
+        batch = entries[start : start + SUPPLIER_BATCH_SIZE]
+        changes = {
+            name: F(name)
+            + Case(
+                *(When(pk=pk, then=Value(totals[index])) for pk, totals in batch),
+                default=Value(0),
+                output_field=output_field,
+            )
+            for index, (name, output_field) in enumerate(amount_fields)
+        }
+        latest = []
+        for pk, (_, _, _, date, recheck_latest) in batch:
+            if recheck_latest:
+                latest.append(When(pk=pk, then=_latest_collection()))
+            elif date is not None:
+                latest.append(
+                    When(pk=pk, then=Greatest(Coalesce("last_collected", Value(date)), Value(date)))
+                )
+        if latest:
+            changes["last_collected"] = Case(*latest, default=F("last_collected"))
+        Supplier.objects.filter(pk__in=[pk for pk, _ in batch]).update(**changes)
+
+
+def apply_item_changes(added=(), removed=()):
+    """
+    Fold item states (see ``item_state``) into the daily and monthly rollups and
+    the supplier totals.
+
+    Changes are summed per rollup key first, and each table then takes them
+    in one set-based statement, so the queries do not grow with the number of
+    keys a batch touches. Must run inside the transaction that writes the
+    items.
+    """
+    deltas = defaultdict(lambda: [Decimal("0"), Decimal("0"), 0])
+    suppliers = defaultdict(lambda: [Decimal("0"), Decimal("0"), 0, None, False])
+    for states, sign in ((added, 1), (removed, -1)):
+        for date, category_id, condition, supplier_id, weight, value in states:
+            delta = deltas[(date, category_id, condition, supplier_id)]
+            delta[0] += sign * Decimal(weight)
+            delta[1] += sign * Decimal(value)
+            delta[2] += sign
+            if supplier_id is None:
+                continue
+            totals = suppliers[supplier_id]
+            totals[0] += sign * Decimal(weight)
+            totals[1] += sign * Decimal(value)
+            totals[2] += sign
+            if sign > 0:
+                totals[3] = date if totals[3] is None else max(totals[3], date)
+            else:
+                totals[4] = True
+    _bump_days(deltas)
+    _bump_months(deltas)
+    _bump_suppliers(suppliers)
+    invalidate_analytics()
+
+
+def apply_value_changes(changes):
+    """Apply ``{(date, category_id, condition, supplier_id): value_delta}`` to the rollup."""
+    deltas = {key: [Decimal("0"), value, 0] for key, value in changes.items() if value}
+    suppliers = defaultdict(lambda: [Decimal("0"), Decimal("0"), 0, None, False])
+    for key, (_, value, _) in deltas.items():
+        if key[3] is not None:
+            suppliers[key[3]][1] += value
+    _bump_days(deltas)
+    _bump_months(deltas)
+    _bump_suppliers(suppliers)
+    invalidate_analytics()
+
+
+def merge_supplier(supplier_id):
+    """Move a supplier's rollup rows onto the no-supplier rows, as ``SET_NULL`` does for items."""
+    rows = DailyCollectionRollup.objects.filter(supplier_id=supplier_id)
+    _bump_days(
+        {
+            (date, category_id, condition, None): [weight, value, count]
+            for date, category_id, condition, weight, value, count in rows.values_list(
+                "date", "category_id", "condition", *TOTAL_FIELDS
+            )
+        }
+    )
+    rows.delete()
+    invalidate_analytics()
+
+
+def rebuild_rollups(batch_size=1000):
+    """Regenerate the whole rollup table from ``EWasteItem``."""
+    totals = (
+        EWasteItem.objects.order_by()
+        .values("date_collected", "category_id", "condition", "source_supplier_id")
+        .annotate(
+            total_weight_kg=Sum(
+                "weight_kg", output_field=DecimalField(max_digits=16, decimal_places=3)
+            ),
+            total_estimated_value=Sum(
+                "estimated_value", output_field=DecimalField(max_digits=18, decimal_places=2)
+            ),
+            item_count=Count("id"),
+        )
+    )
+    with transaction.atomic():
+        DailyCollectionRollup.objects.all().delete()
+        batch = []
+        created = 0
+        for row in totals.iterator(chunk_size=batch_size):
+            batch.append(
+                DailyCollectionRollup(
+                    date=row["date_collected"],
+                    category_id=row["category_id"],
+                    condition=row["condition"],
+                    supplier_id=row["source_supplier_id"],
+                    total_weight_kg=row["total_weight_kg"],
+                    total_estimated_value=row["total_estimated_value"],
+                    item_count=row["item_count"],
+                )
+            )
+            if len(batch) >= batch_size:
+                created += len(DailyCollectionRollup.objects.bulk_create(batch))
+                batch = []
+        created += len(DailyCollectionRollup.objects.bulk_create(batch))
+        rebuild_monthly_rollups()
+        refresh_supplier_totals()
+    invalidate_analytics()
+    return created
+
+
+def rebuild_monthly_rollups():
+    """Regenerate ``MonthlyCollectionRollup`` from the daily rollup."""
+    months = (
+        DailyCollectionRollup.objects.annotate(month=TruncMonth("date"))
+        .order_by()
+        .values("month", "category_id", "condition")
+        .annotate(
+            weight=Sum("total_weight_kg"),
+            value=Sum("total_estimated_value"),
+            count=Sum("item_count"),
+        )
+    )
+    MonthlyCollectionRollup.objects.all().delete()
+    return len(
+        MonthlyCollectionRollup.objects.bulk_create(
+            MonthlyCollectionRollup(
+                month=row["month"],
+                category_id=row["category_id"],
+                condition=row["condition"],
+                total_weight_kg=row["weight"],
+                total_estimated_value=row["value"],
+                item_count=row["count"],
+            )
+            for row in months
+        )
+    )
+
+
+def refresh_supplier_totals():
+    """Recompute every supplier's running totals from ``EWasteItem`` in one ``UPDATE``."""
+    items = EWasteItem.objects.filter(source_supplier=OuterRef("pk")).order_by().values(
+        "source_supplier"
+    )
+
+    def total(aggregate, output_field, default):
+        return Coalesce(
+            Subquery(items.annotate(total=aggregate).values("total"), output_field=output_field),
+            Value(default),
+            output_field=output_field,
+        )
+
+    return Supplier.objects.update(
+        item_count=total(Count("id"), IntegerField(), 0),
+        total_weight_kg=total(
+            Sum("weight_kg"), DecimalField(max_digits=16, decimal_places=3), Decimal("0")
+        ),
+        total_estimated_value=total(
+            Sum("estimated_value"), DecimalField(max_digits=18, decimal_places=2), Decimal("0")
+        ),
+        last_collected=Subquery(items.annotate(latest=Max("date_collected")).values("latest")),
+    )
@@ -0,0 +1,45 @@
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from items.models import EWasteItem
+from suppliers.models import Supplier
+
+from .cache import invalidate_analytics
+from .rollups import ITEM_STATE_FIELDS, apply_item_changes, item_state, merge_supplier
+
+
+@receiver(pre_save, sender=EWasteItem)
+def remember_previous_item_state(sender, instance, raw=False, **kwargs):
+    instance._rollup_previous = None
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    instance._rollup_previous = (
+        EWasteItem.objects.select_for_update()
+        .filter(pk=instance.pk)
+        .values_list(*ITEM_STATE_FIELDS)
+        .first()
+    )
+
+
+@receiver(post_save, sender=EWasteItem)
+def item_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, "_rollup_previous", None)
+    apply_item_changes(added=[item_state(instance)], removed=[previous] if previous else [])
+
+
+@receiver(post_delete, sender=EWasteItem)
+def item_deleted(sender, instance, **kwargs):
+    apply_item_changes(removed=[item_state(instance)])
+
+
+@receiver(pre_delete, sender=Supplier)
+def supplier_deleted(sender, instance, **kwargs):
+    merge_supplier(instance.pk)
+
+
+@receiver(post_save, sender=Supplier)
+def supplier_saved(sender, raw=False, **kwargs):
+    if not raw:
+        invalidate_analytics()
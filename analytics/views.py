@@ -1,76 +1,135 @@
-from datetime import date
-
-from django.db.models import Count, Sum
-from django.db.models.functions import TruncMonth
+from django.conf import settings
+from django.db.models import DecimalField, Max, Sum
+from django.utils import timezone
 from rest_framework import permissions, response, views
 
-from items.models import EWasteItem
+from ewaste_api.exports import parse_date_range
+from ewaste_api.pagination import KeysetPagination
 from suppliers.models import Supplier
 
+from .cache import cached_result
+from .queries import (
+    TOTALS,
+    monthly_entry,
+    monthly_queryset,
+    summary_payload,
+    summary_queries,
+    summary_totals,
+    today_payload,
+    today_queryset,
+)
+
 
 class TodayAnalyticsView(views.APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        today = date.today()
-        qs = EWasteItem.objects.filter(date_collected=today)
-        aggregates = qs.aggregate(
-            total_weight=Sum("weight_kg"),
-            total_estimated_value=Sum("estimated_value"),
-        )
-        data = {
-            "date": today.isoformat(),
-            "total_weight_kg": float(aggregates["total_weight"] or 0),
-            "total_estimated_value": float(aggregates["total_estimated_value"] or 0),
-            "items_collected": qs.count(),
-        }
+        today = timezone.localdate()
+        data = cached_result("today", {"date": today}, lambda: self.compute(today))
+        return response.Response(data)
+
+    def compute(self, today):
+        return today_payload(today, today_queryset(today).aggregate(**TOTALS))
+
+
+class SummaryAnalyticsView(views.APIView):
+    """
+    Today, week, month and year to date, and all-time collection totals.
+
+    Windows follow ``TIME_ZONE`` (weeks start on Monday) and are computed with
+    two conditional-aggregation queries: one over this week's and month's
+    daily rollup rows, one over the monthly rollup.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        today = timezone.localdate()
+        data = cached_result("summary", {"date": today}, lambda: self.compute(today))
         return response.Response(data)
 
+    def compute(self, today):
+        results = [queryset.aggregate(**sums) for queryset, sums in summary_queries(today)]
+        return summary_payload(today, summary_totals(*results))
+
 
 class MonthlyAnalyticsView(views.APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        qs = (
-            EWasteItem.objects.annotate(month=TruncMonth("date_collected"))
-            .values("month")
-            .annotate(
-                total_weight=Sum("weight_kg"),
-                total_estimated_value=Sum("estimated_value"),
-                items_collected=Count("id"),
-            )
-            .order_by("month")
-        )
-        results = [
-            {
-                "month": entry["month"].strftime("%Y-%m") if entry["month"] else None,
-                "total_weight_kg": float(entry["total_weight"] or 0),
-                "total_estimated_value": float(entry["total_estimated_value"] or 0),
-                "items_collected": entry["items_collected"],
-            }
-            for entry in qs
-        ]
-        return response.Response({"monthly": results})
+        return response.Response(cached_result("monthly", {}, self.compute))
+
+    def compute(self):
+        return {"monthly": [monthly_entry(entry) for entry in monthly_queryset()]}
+
+
+class SupplierRankingPagination(KeysetPagination):
+    page_size = getattr(settings, "SUPPLIER_RANKING_DEFAULT_LIMIT", 10)
+    page_size_query_param = "limit"
+    max_page_size = getattr(settings, "SUPPLIER_RANKING_MAX_LIMIT", 100)
+    ordering = ("-total_estimated_value", "id")
 
 
 class SupplierRankingView(views.APIView):
+    """
+    Suppliers ranked by estimated value.
+
+    Without a date window the ranking is read straight from the running totals
+    on ``Supplier`` through the ``(-total_estimated_value, id)`` index. With
+    ``date_from``/``date_to`` it is aggregated from the daily rollup instead.
+    """
+
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = SupplierRankingPagination
 
     def get(self, request):
-        qs = (
-            Supplier.objects.annotate(
-                total_estimated_value=Sum("items__estimated_value"),
-                item_count=Count("items"),
-            )
-            .order_by("-total_estimated_value")
+        start, end = parse_date_range(request.query_params)
+        params = {"url": request.build_absolute_uri()}
+        data = cached_result("supplier-ranking", params, lambda: self.compute(request, start, end))
+        return response.Response(data)
+
+    def windowed_queryset(self, start, end):
+        rollups = {}
+        if start:
+            rollups["daily_rollups__date__gte"] = start
+        if end:
+            rollups["daily_rollups__date__lte"] = end
+        return Supplier.objects.filter(**rollups).annotate(
+            window_total_estimated_value=Sum(
+                "daily_rollups__total_estimated_value",
+                output_field=DecimalField(max_digits=18, decimal_places=2),
+            ),
+            window_total_weight_kg=Sum(
+                "daily_rollups__total_weight_kg",
+                output_field=DecimalField(max_digits=16, decimal_places=3),
+            ),
+            window_item_count=Sum("daily_rollups__item_count"),
+            window_last_collected=Max("daily_rollups__date"),
         )
+
+    def compute(self, request, start, end):
+        paginator = self.pagination_class()
+        if start or end:
+            queryset = self.windowed_queryset(start, end)
+            paginator.ordering = ("-window_total_estimated_value", "id")
+            prefix = "window_"
+        else:
+            queryset = Supplier.objects.all()
+            prefix = ""
+        page = paginator.paginate_queryset(queryset, request, view=self)
         ranking = [
             {
                 "supplier_id": supplier.id,
                 "supplier_name": supplier.supplier_name,
-                "total_estimated_value": float(supplier.total_estimated_value or 0),
-                "item_count": supplier.item_count,
+                "total_estimated_value": float(getattr(supplier, f"{prefix}total_estimated_value")),
+                "total_weight_kg": float(getattr(supplier, f"{prefix}total_weight_kg")),
+                "item_count": getattr(supplier, f"{prefix}item_count"),
+                "last_collected": getattr(supplier, f"{prefix}last_collected"),
             }
-            for supplier in qs
+            for supplier in page
         ]
-        return response.Response({"ranking": ranking})
+        return {
+            "ranking": ranking,
+            "next": paginator.get_next_link(),
+            "previous": paginator.get_previous_link(),
+        }
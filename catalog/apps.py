@@ -1,6 +1,14 @@
 from django.apps import AppConfig
+from django.core import checks
 
 
 class CatalogConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "catalog"
+
+    def ready(self):
+        from ewaste_api.cache import check_shared_cache
+
+        from . import signals  # noqa: F401
+
+        checks.register(check_shared_cache, checks.Tags.caches)
@@ -0,0 +1,60 @@
+import threading
+
+from django.db import transaction
+
+from ewaste_api.cache import SharedVersion
+from ewaste_api.routers import use_primary
+
+from .models import ItemCategory
+
+price_version = SharedVersion("catalog:price-version")
+
+
+class CategoryPriceTable:
+    """
+    Process-local ``{category_id: base_price_per_kg}`` table.
+
+    The whole catalog is loaded with one query and reused until the shared
+    ``price_version`` changes, so pricing an item needs no catalog query. The
+    load always reads the primary: a reload inside a replica-routed request
+    would otherwise keep the replica's old prices until the next change.
+    """
+
+    def __init__(self):
+        self._prices = {}
+        self._version = None
+        self._lock = threading.Lock()
+
+    def get(self, category_id):
+        version = price_version.current()
+        if version != self._version:
+            self.reload(version)
+        try:
+            return self._prices[category_id]
+        except KeyError:
+            # Possibly created by another worker since the table was loaded.
+            self.reload(version)
+        try:
+            return self._prices[category_id]
+        except KeyError:
+            raise ItemCategory.DoesNotExist(f"Category {category_id} does not exist.")
+
+    def reload(self, version=None):
+        with use_primary():
+            prices = dict(ItemCategory.objects.values_list("id", "base_price_per_kg"))
+        with self._lock:
+            self._prices = prices
+            self._version = price_version.current() if version is None else version
+
+
+category_prices = CategoryPriceTable()
+
+
+def get_base_price(category_id):
+    return category_prices.get(category_id)
+
+
+def invalidate_category_prices():
+    """Invalidate every worker's table now and again once the write commits."""
+    price_version.bump()
+    transaction.on_commit(price_version.bump)
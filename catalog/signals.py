@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import ItemCategory
+from .prices import invalidate_category_prices
+
+
+@receiver(post_save, sender=ItemCategory)
+@receiver(post_delete, sender=ItemCategory)
+def category_price_changed(sender, **kwargs):
+    invalidate_category_prices()
@@ -1,4 +1,6 @@
-from rest_framework import permissions, viewsets
+from rest_framework import decorators, permissions, response, status, viewsets
+
+from items.pricing import reprice_category
 
 from .models import ItemCategory
 from .serializers import ItemCategorySerializer
@@ -9,8 +11,20 @@ class ItemCategoryViewSet(viewsets.ModelViewSet):
     serializer_class = ItemCategorySerializer
 
     def get_permissions(self):
-        if self.action in ["create", "update", "partial_update", "destroy"]:
+        if self.action in ["create", "update", "partial_update", "destroy", "reprice"]:
             permission_classes = [permissions.IsAdminUser]
         else:
             permission_classes = [permissions.IsAuthenticated]
         return [permission() for permission in permission_classes]
+
+    @decorators.action(detail=True, methods=["post"])
+    def reprice(self, request, pk=None):
+        category = self.get_object()
+        dry_run = str(request.data.get("dry_run", "false")).lower() in ("1", "true", "yes")
+        try:
+            summary = reprice_category(category, dry_run=dry_run)
+        except ValueError as exc:
+            return response.Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        summary["base_price_per_kg"] = str(summary["base_price_per_kg"])
+        summary["value_delta"] = str(summary["value_delta"])
+        return response.Response(summary, status=status.HTTP_200_OK)
@@ -0,0 +1,188 @@
+import gc
+import time
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from accounts.revocation import revocations
+from analytics.views import (
+    MonthlyAnalyticsView,
+    SummaryAnalyticsView,
+    SupplierRankingView,
+    TodayAnalyticsView,
+)
+from items.models import EWasteItem
+from items.serializers import EWasteItemSerializer
+from items.synthetic import SyntheticDataGenerator
+from transactions.models import Transaction
+from transactions.serializers import TransactionSerializer
+from transactions.views import TransactionViewSet
+
+from .renderers import ORJSONRenderer
+from .serialization import RowMapper
+
+SERIALIZER_ROWS = 2000
+PRICING_ROWS = 20000
+REVOCATION_CHECKS = 1000
+MIN_SAMPLE_SECONDS = 0.05
+
+
+def best_of(function, repeat):
+    """
+    Fastest per-call wall time over ``repeat`` samples, in seconds.
+
+    Like ``timeit``, garbage collection is paused and fast calls are looped
+    until one sample takes at least ``MIN_SAMPLE_SECONDS`` so sub-millisecond
+    timings are not dominated by noise.
+    """
+
+    def sample(loops):
+        started = time.perf_counter()
+        for _ in range(loops):
+            function()
+        return time.perf_counter() - started
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        loops = 1
+        while (elapsed := sample(loops)) < MIN_SAMPLE_SECONDS:
+            loops *= 2 if elapsed * 10 >= MIN_SAMPLE_SECONDS else 10
+        timings = [elapsed] + [sample(loops) for _ in range(repeat - 1)]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return min(timings) / loops
+
+
+def _calibration_workload():
+    total = Decimal("0")
+    for index in range(2000):
+        total += (Decimal(index) * Decimal("1.1")).quantize(Decimal("0.01"))
+    return str(sorted({str(index * 7 % 1013): index for index in range(2000)}))
+
+
+def calibrate(repeat=5):
+    """Per-call time of a fixed pure-Python workload, in ms, as a machine speed reference."""
+    return round(best_of(_calibration_workload, repeat) * 1000, 4)
+
+
+def _throughput(rows, seconds):
+    return {"value": round(rows / seconds, 1), "unit": "rows/s", "higher_is_better": True}
+
+
+def _latency(seconds):
+    return {"value": round(seconds * 1000, 3), "unit": "ms", "higher_is_better": False}
+
+
+def _ranking_request(params=None):
+    return Request(APIRequestFactory().get("/analytics/supplier-ranking/", params or {}))
+
+
+def measure(repeat=5):
+    """Benchmark the hot paths against whatever data is currently in the database."""
+    results = {}
+    items = list(EWasteItem.objects.select_related("category", "source_supplier")[:SERIALIZER_ROWS])
+    if items:
+        seconds = best_of(lambda: EWasteItemSerializer(items, many=True).data, repeat)
+        results["serialize_items"] = _throughput(len(items), seconds)
+    transactions = list(Transaction.objects.select_related("category")[:SERIALIZER_ROWS])
+    if transactions:
+        seconds = best_of(lambda: TransactionSerializer(transactions, many=True).data, repeat)
+        results["serialize_transactions"] = _throughput(len(transactions), seconds)
+    for name, model, mapper in (
+        ("map_item_rows", EWasteItem, RowMapper(EWasteItemSerializer)),
+        (
+            "map_transaction_rows",
+            Transaction,
+            RowMapper(TransactionSerializer, TransactionViewSet.list_computed_fields),
+        ),
+    ):
+        rows = list(model.objects.values_list(*mapper.lookups, named=True)[:SERIALIZER_ROWS])
+        if not rows:
+            continue
+        results[name] = _throughput(len(rows), best_of(lambda: mapper(rows), repeat))
+        page = {"next": None, "previous": None, "results": mapper(rows)}
+        label = name.split("_")[1]
+        for renderer in (JSONRenderer(), ORJSONRenderer()):
+            engine = "orjson" if isinstance(renderer, ORJSONRenderer) else "stdlib"
+            seconds = best_of(lambda: renderer.render(page), repeat)
+            results[f"render_{label}s_{engine}"] = _throughput(len(rows), seconds)
+    if items:
+        priced = (items * (PRICING_ROWS // len(items) + 1))[:PRICING_ROWS]
+        seconds = best_of(lambda: [item.compute_estimated_value() for item in priced], repeat)
+        results["compute_estimated_value"] = _throughput(len(priced), seconds)
+
+    # Unrevoked tokens, the common case: answered by the Bloom filter alone.
+    jtis = [uuid.uuid4().hex for _ in range(REVOCATION_CHECKS)]
+    revocations.sync()
+    seconds = best_of(lambda: [revocations.is_revoked(jti) for jti in jtis], repeat)
+    results["check_token_revocation"] = _throughput(len(jtis), seconds)
+
+    today = date.today()
+    window = {"date_from": (today - timedelta(days=30)).isoformat()}
+    ranking = SupplierRankingView()
+    queries = {
+        "analytics_today": lambda: TodayAnalyticsView().compute(today),
+        "analytics_monthly": lambda: MonthlyAnalyticsView().compute(),
+        "analytics_summary": lambda: SummaryAnalyticsView().compute(today),
+        "analytics_supplier_ranking": lambda: ranking.compute(_ranking_request(), None, None),
+        "analytics_supplier_ranking_window": lambda: ranking.compute(
+            _ranking_request(window), today - timedelta(days=30), None
+        ),
+    }
+    for name, query in queries.items():
+        results[name] = _latency(best_of(query, repeat))
+    return results
+
+
+def run_benchmarks(sizes, repeat=5, seed=0, batch_size=5000, progress=None):
+    """
+    Grow the item table through each of ``sizes`` and benchmark at every step.
+
+    Transactions are kept at a fifth of the item count. Returns
+    ``{"<benchmark>@<size>": {"value", "unit", "higher_is_better"}}``.
+    """
+    generator = SyntheticDataGenerator(batch_size=batch_size, seed=seed)
+    results = {}
+    current = EWasteItem.objects.count()
+    for index, size in enumerate(sorted(sizes)):
+        if size > current:
+            generator.generate(
+                users=10 if index == 0 else 0,
+                suppliers=max(size // 2000, 5) if index == 0 else 0,
+                items=size - current,
+                transactions=max(size // 5 - Transaction.objects.count(), 0),
+            )
+            current = size
+        for name, result in measure(repeat).items():
+            results[f"{name}@{size}"] = result
+            if progress:
+                progress(f"{name}@{size}", result)
+    return results
+
+
+def compare(results, baseline, threshold, speed=1.0):
+    """
+    Return ``[(name, baseline_value, value, change)]`` for every benchmark that is
+    more than ``threshold`` (a fraction) worse than its baseline entry.
+
+    ``speed`` is the current calibration time divided by the baseline's; values
+    are normalised by it so a uniformly slower or busier machine does not count
+    as a regression.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference or not reference["value"]:
+            continue
+        value = result["value"] * speed if result["higher_is_better"] else result["value"] / speed
+        change = value / reference["value"] - 1
+        worse = -change if result["higher_is_better"] else change
+        if worse > threshold:
+            regressions.append((name, reference["value"], result["value"], change))
+    return regressions
@@ -0,0 +1,91 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+
+# Backends whose entries live inside one process.
+PROCESS_LOCAL_CACHES = {
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+}
+
+
+class SharedVersion:
+    """
+    A version counter kept in the shared Django cache.
+
+    Each process remembers the last value it read and only goes back to the
+    cache once ``SHARED_VERSION_CHECK_SECONDS`` have passed, so hot paths pay
+    for a shared lookup at most once per interval. ``bump()`` is visible to the
+    calling process immediately and to other workers within the interval.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self._value = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def current(self):
+        now = time.monotonic()
+        if self._value is None or now - self._checked_at >= settings.SHARED_VERSION_CHECK_SECONDS:
+            value = cache.get(self.key)
+            if value is None:
+                # A fresh, time-based start value avoids matching a version a
+                # worker saw before the key was evicted.
+                cache.add(self.key, time.time_ns(), timeout=None)
+                value = cache.get(self.key)
+            with self._lock:
+                self._value, self._checked_at = value, now
+        return self._value
+
+    async def acurrent(self):
+        """``current()`` for async callers, without blocking the event loop on the cache."""
+        now = time.monotonic()
+        if self._value is None or now - self._checked_at >= settings.SHARED_VERSION_CHECK_SECONDS:
+            value = await cache.aget(self.key)
+            if value is None:
+                await cache.aadd(self.key, time.time_ns(), timeout=None)
+                value = await cache.aget(self.key)
+            with self._lock:
+                self._value, self._checked_at = value, now
+        return self._value
+
+    def bump(self):
+        try:
+            value = cache.incr(self.key)
+        except ValueError:
+            cache.add(self.key, time.time_ns(), timeout=None)
+            value = cache.get(self.key)
+        with self._lock:
+            self._value, self._checked_at = value, time.monotonic()
+        return value
+
+
+def check_shared_cache(app_configs=None, workers=None, **kwargs):
+    """
+    Refuse a process-local default cache when several workers serve the app.
+
+    Shared version keys, analytics locks and replica pins only reach other
+    workers through the cache. ``workers`` defaults to ``WEB_CONCURRENCY``;
+    the gunicorn config passes its actual worker count.
+    """
+    workers = settings.WEB_CONCURRENCY if workers is None else workers
+    backend = settings.CACHES["default"]["BACKEND"]
+    if workers <= 1 or backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        checks.Error(
+            f"CACHES['default'] uses {backend}, which each of the {workers} workers "
+            "keeps separately, so price and analytics invalidations "
+            "never reach the other workers.",
+            hint=(
+                "Set CACHE_BACKEND to a shared cache, for example "
+                "django.core.cache.backends.db.DatabaseCache after "
+                "`manage.py createcachetable`, or run a single worker."
+            ),
+            id="ewaste_api.E001",
+        )
+    ]
@@ -0,0 +1,108 @@
+"""
+PostgreSQL backend with optional psycopg_pool connection pooling.
+
+Follows the ``OPTIONS["pool"]`` setting Django 5.1 introduced, so settings
+carry over unchanged on upgrade. ``True`` or a dict of
+``psycopg_pool.ConnectionPool`` arguments (``min_size``, ``max_size``,
+``timeout``, ``max_lifetime``, ``max_idle``...) turns pooling on. Django then
+checks a connection out of the per-process pool when it would connect, and
+returns it when it would close, which with ``CONN_MAX_AGE = 0`` is at the end
+of each request. ``CONN_HEALTH_CHECKS`` makes the pool verify a connection
+before handing it out.
+"""
+
+import os
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base, creation
+from psycopg import IsolationLevel
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    def destroy_test_db(self, *args, **kwargs):
+        # Pooled connections would keep the test database in use.
+        self.connection.close()
+        self.connection.close_pool()
+        super().destroy_test_db(*args, **kwargs)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    creation_class = DatabaseCreation
+
+    # {alias: (pid, database name, pool)}. Pools are per process: a worker
+    # forked after the pool was opened builds its own instead of sharing the
+    # parent's sockets and background threads.
+    _connection_pools = {}
+    _pools_lock = threading.Lock()
+
+    @property
+    def pool(self):
+        pool_options = self.settings_dict["OPTIONS"].get("pool")
+        if self.alias == NO_DB_ALIAS or not pool_options:
+            return None
+        key = (os.getpid(), self.settings_dict["NAME"])
+        with self._pools_lock:
+            entry = self._connection_pools.get(self.alias)
+            if entry is not None and entry[:2] == key:
+                return entry[2]
+            if self.settings_dict["CONN_MAX_AGE"] != 0:
+                raise ImproperlyConfigured("Pooling doesn't support persistent connections.")
+            try:
+                from psycopg_pool import ConnectionPool
+            except ImportError as exc:
+                raise ImproperlyConfigured(
+                    "Error loading psycopg_pool module. Did you install psycopg-pool?"
+                ) from exc
+            if entry is not None and entry[0] == key[0]:
+                # The test runner switched to the test database.
+                entry[2].close()
+            connect_kwargs = self.get_connection_params()
+            # Django sets the autocommit mode it wants after checkout.
+            connect_kwargs["autocommit"] = True
+            pool = ConnectionPool(
+                kwargs=connect_kwargs,
+                open=False,
+                check=ConnectionPool.check_connection
+                if self.settings_dict["CONN_HEALTH_CHECKS"]
+                else None,
+                name=self.alias,
+                **({} if pool_options is True else pool_options),
+            )
+            self._connection_pools[self.alias] = (*key, pool)
+            return pool
+
+    def close_pool(self):
+        with self._pools_lock:
+            entry = self._connection_pools.pop(self.alias, None)
+        if entry is not None and entry[0] == os.getpid():
+            entry[2].close()
+
+    def get_connection_params(self):
+        conn_params = super().get_connection_params()
+        conn_params.pop("pool", None)
+        return conn_params
+
+    def get_new_connection(self, conn_params):
+        pool = self.pool
+        if pool is None:
+            return super().get_new_connection(conn_params)
+        pool.open()
+        connection = pool.getconn()
+        isolation_level = self.settings_dict["OPTIONS"].get("isolation_level")
+        if isolation_level is None:
+            self.isolation_level = IsolationLevel.READ_COMMITTED
+        else:
+            self.isolation_level = IsolationLevel(isolation_level)
+            connection.isolation_level = self.isolation_level
+        return connection
+
+    def _close(self):
+        if self.connection is not None and getattr(self.connection, "_pool", None):
+            with self.wrap_database_errors:
+                # Back to the pool it came from, which resets it.
+                self.connection._pool.putconn(self.connection)
+                self.connection = None
+            return None
+        return super()._close()
@@ -0,0 +1,56 @@
+"""
+SQLite backend tuned for concurrent writers.
+
+Adds the two SQLite ``OPTIONS`` Django 5.1 introduced, so settings carry over
+unchanged on upgrade:
+
+* ``init_command``: ``;``-separated statements (PRAGMAs) run on every new
+  connection.
+* ``transaction_mode``: ``DEFERRED``, ``IMMEDIATE`` or ``EXCLUSIVE``, used for
+  the ``BEGIN`` that starts an ``atomic()`` block. ``IMMEDIATE`` takes the
+  write lock up front, so a transaction that reads and then writes waits on
+  the busy timeout instead of failing with "database is locked" when another
+  writer got there first.
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.sqlite3 import base
+
+TRANSACTION_MODES = (None, "DEFERRED", "IMMEDIATE", "EXCLUSIVE")
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def __init__(self, settings_dict, alias="default"):
+        super().__init__(settings_dict, alias)
+        options = self.settings_dict["OPTIONS"]
+        mode = options.get("transaction_mode")
+        self.transaction_mode = mode.upper() if isinstance(mode, str) else mode
+        if self.transaction_mode not in TRANSACTION_MODES:
+            raise ImproperlyConfigured(
+                f"settings.DATABASES[{alias!r}]['OPTIONS']['transaction_mode'] is improperly "
+                f"configured to {mode!r}. Use one of "
+                f"{', '.join(repr(mode) for mode in TRANSACTION_MODES)}."
+            )
+        self.init_commands = [
+            command.strip()
+            for command in options.get("init_command", "").split(";")
+            if command.strip()
+        ]
+
+    def get_connection_params(self):
+        kwargs = super().get_connection_params()
+        kwargs.pop("transaction_mode", None)
+        kwargs.pop("init_command", None)
+        return kwargs
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        for command in self.init_commands:
+            conn.execute(command)
+        return conn
+
+    def _start_transaction_under_autocommit(self):
+        if self.transaction_mode is None:
+            super()._start_transaction_under_autocommit()
+        else:
+            self.cursor().execute(f"BEGIN {self.transaction_mode}")
@@ -0,0 +1,46 @@
+from django.core.exceptions import ValidationError
+from rest_framework import serializers
+
+
+class PreloadedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Primary key field that resolves against instances preloaded into the
+    serializer context (``context[context_key]`` as a ``{pk: instance}`` dict),
+    so batch validation does not issue one lookup per row. Falls back to the
+    regular queryset lookup when nothing was preloaded.
+    """
+
+    def __init__(self, context_key, **kwargs):
+        self.context_key = context_key
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        preloaded = self.context.get(self.context_key)
+        if preloaded is None:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = self.get_queryset().model._meta.pk.to_python(data)
+        except (TypeError, ValueError, ValidationError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            return preloaded[pk]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+
+
+def preload_instances(model, raw_values):
+    """Fetch every instance referenced by ``raw_values`` with a single query."""
+    pk_field = model._meta.pk
+    pks = set()
+    for value in raw_values:
+        if value is None or isinstance(value, bool):
+            continue
+        try:
+            pks.add(pk_field.to_python(value))
+        except (TypeError, ValueError, ValidationError):
+            continue
+    if not pks:
+        return {}
+    return model._default_manager.in_bulk(pks)
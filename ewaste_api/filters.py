@@ -0,0 +1,139 @@
+import sys
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connections
+from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend
+
+from .exports import parse_date_range
+
+
+class ExactFilter:
+    """``?<param>=<value>`` equality on a column or foreign key id."""
+
+    def __init__(self, field_name, param=None):
+        self.field_name = field_name
+        self.param = param or field_name
+
+    def filter(self, queryset, query_params):
+        raw_value = query_params.get(self.param)
+        if raw_value in (None, ""):
+            return queryset
+        field = queryset.model._meta.get_field(self.field_name)
+        try:
+            if field.is_relation:
+                # Validate the id only; a missing row simply matches nothing.
+                value = field.target_field.to_python(raw_value)
+            else:
+                value = field.clean(raw_value, None)
+        except DjangoValidationError as exc:
+            raise serializers.ValidationError({self.param: exc.messages})
+        return queryset.filter(**{self.field_name: value})
+
+
+class DateRangeFilter:
+    """``?date_from=`` / ``?date_to=`` (inclusive) on a date column."""
+
+    def __init__(self, field_name, start_param="date_from", end_param="date_to"):
+        self.field_name = field_name
+        self.start_param = start_param
+        self.end_param = end_param
+
+    def filter(self, queryset, query_params):
+        start, end = parse_date_range(query_params, self.start_param, self.end_param)
+        if start:
+            queryset = queryset.filter(**{f"{self.field_name}__gte": start})
+        if end:
+            queryset = queryset.filter(**{f"{self.field_name}__lte": end})
+        return queryset
+
+
+class PrefixFilter:
+    """
+    ``?<param>=<prefix>`` as ``__startswith``, narrowed to an index seek.
+
+    SQLite runs ``__startswith`` as a ``LIKE`` that an ordinary index cannot
+    serve, so elsewhere the filter adds the range
+    ``prefix <= value < next(prefix)``, which seeks a B-tree index on the
+    column; the ``LIKE`` keeps the match exact and case-sensitive. Postgres
+    compares strings by the database collation, where that range can miss
+    matches, and seeks ``LIKE 'prefix%'`` itself on a ``varchar_pattern_ops``
+    index, so there the filter is ``__startswith`` alone.
+    """
+
+    def __init__(self, field_name, param=None):
+        self.field_name = field_name
+        self.param = param or field_name
+
+    def filter(self, queryset, query_params):
+        prefix = query_params.get(self.param)
+        if not prefix:
+            return queryset
+        queryset = queryset.filter(**{f"{self.field_name}__startswith": prefix})
+        if connections[queryset.db].vendor == "postgresql":
+            return queryset
+        queryset = queryset.filter(**{f"{self.field_name}__gte": prefix})
+        if ord(prefix[-1]) < sys.maxunicode:
+            upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            queryset = queryset.filter(**{f"{self.field_name}__lt": upper})
+        return queryset
+
+
+class QueryFilterBackend(BaseFilterBackend):
+    """Apply the view's ``query_filters`` to its queryset."""
+
+    def filter_queryset(self, request, queryset, view):
+        for query_filter in getattr(view, "query_filters", ()):
+            queryset = query_filter.filter(queryset, request.query_params)
+        return queryset
+
+
+class KeysetOrderingFilter(BaseFilterBackend):
+    """
+    ``?ordering=<name>`` from the view's ``ordering_fields`` whitelist.
+
+    Each name maps to a full keyset ordering, ending in a unique field, that an
+    index on the model serves in either direction. ``KeysetPagination`` asks
+    this backend for the ordering, so cursors follow it. Without the parameter
+    the view's ``get_default_ordering(request)`` applies, else the first name.
+
+    Rows with a ``NULL`` ordering field are left out, as neither the cursor
+    nor a partial index can step over them. So that a list never drops rows
+    silently, a name in the view's ``ordering_requires`` is only accepted
+    together with one of its parameters, whose filter already excludes those
+    rows; without one the request is a 400.
+    """
+
+    ordering_param = "ordering"
+
+    def get_ordering(self, request, queryset, view):
+        name = request.query_params.get(self.ordering_param)
+        if not name:
+            if hasattr(view, "get_default_ordering"):
+                name = view.get_default_ordering(request)
+            else:
+                name = next(iter(view.ordering_fields))
+        if name not in view.ordering_fields:
+            raise serializers.ValidationError(
+                {self.ordering_param: f"Expected one of: {', '.join(view.ordering_fields)}."}
+            )
+        required = getattr(view, "ordering_requires", {}).get(name)
+        if required and not any(request.query_params.get(param) for param in required):
+            raise serializers.ValidationError(
+                {
+                    self.ordering_param: (
+                        f"{name} needs {' or '.join(required)}, "
+                        "since rows without a value would be left out."
+                    )
+                }
+            )
+        return view.ordering_fields[name]
+
+    def filter_queryset(self, request, queryset, view):
+        ordering = self.get_ordering(request, queryset, view)
+        not_null = {
+            f"{term.lstrip('-')}__isnull": False
+            for term in ordering
+            if queryset.model._meta.get_field(term.lstrip("-")).null
+        }
+        return queryset.filter(**not_null).order_by(*ordering)
@@ -0,0 +1,166 @@
+import csv
+import json
+import os
+import time
+from itertools import islice
+
+from django.db import transaction
+
+from items.models import ImportCheckpoint
+
+CHECKPOINT_FIELDS = ("rows", "created", "rejected")
+
+
+class InvalidRows(ValueError):
+    """A chunk had rows that failed validation; ``errors`` lists them by CSV line."""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(f"{len(errors)} invalid rows")
+
+
+class CSVImport:
+    """
+    Stream a CSV file into the database in validated chunks, with a checkpoint.
+
+    ``validate(rows)`` returns ``(validated_rows, errors)`` as the bulk helpers
+    do (``items.bulk.validate_item_rows``), so a chunk shares one category and
+    supplier lookup; ``create(validated_rows)`` writes the chunk in one
+    transaction. Header names are the ``serializer_class`` fields and empty
+    cells are left out of the payload, so optional fields take their defaults.
+
+    The number of data rows consumed is stored in an ``ImportCheckpoint`` row,
+    updated in the same transaction as the chunk it counts, and a later run
+    over the same file skips them: an interrupted import resumes exactly after
+    the last committed chunk, and a finished one picks up only rows appended
+    since. ``checkpoint_path`` receives a JSON copy after each chunk for
+    people watching the import; it is never read back. An invalid row stops
+    the import before its chunk is written, unless ``skip_invalid`` writes the
+    chunk's valid rows and reports the rest.
+    """
+
+    def __init__(
+        self,
+        path,
+        kind,
+        serializer_class,
+        validate,
+        create,
+        chunk_size=5000,
+        checkpoint_path=None,
+        skip_invalid=False,
+    ):
+        self.path = os.path.abspath(path)
+        self.kind = kind
+        self.serializer_class = serializer_class
+        self.validate = validate
+        self.create = create
+        self.chunk_size = chunk_size
+        self.checkpoint_path = checkpoint_path or f"{self.path}.checkpoint"
+        self.skip_invalid = skip_invalid
+
+    def load_checkpoint(self):
+        state = {"source": self.path, "kind": self.kind, "rows": 0, "created": 0, "rejected": 0}
+        saved = (
+            ImportCheckpoint.objects.filter(source=self.path, kind=self.kind)
+            .values(*CHECKPOINT_FIELDS)
+            .first()
+        )
+        state.update(saved or {})
+        return state
+
+    def save_checkpoint(self, state):
+        """Store ``state``; call it inside the transaction that wrote the chunk."""
+        ImportCheckpoint.objects.update_or_create(
+            source=self.path,
+            kind=self.kind,
+            defaults={name: state[name] for name in CHECKPOINT_FIELDS},
+        )
+
+    def write_mirror(self, state):
+        # Replace the file in one step so a reader never sees half a checkpoint.
+        partial = f"{self.checkpoint_path}.tmp"
+        with open(partial, "w", encoding="utf-8") as handle:
+            json.dump(state, handle)
+        os.replace(partial, self.checkpoint_path)
+
+    def reset(self):
+        ImportCheckpoint.objects.filter(source=self.path, kind=self.kind).delete()
+        try:
+            os.remove(self.checkpoint_path)
+        except FileNotFoundError:
+            pass
+
+    def check_header(self, header):
+        fields = {
+            name: field
+            for name, field in self.serializer_class().fields.items()
+            if not field.read_only
+        }
+        header = [name for name in header or () if name]
+        unknown = sorted(set(header) - set(fields))
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+        missing = [name for name, field in fields.items() if field.required and name not in header]
+        if missing:
+            raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    def run(self):
+        """
+        Import the rows after the checkpoint, yielding progress after each chunk.
+
+        Each report has the running ``rows``, ``created`` and ``rejected``
+        totals, ``rate`` (rows per second this run) and the chunk's skipped
+        ``errors``.
+        """
+        state = self.load_checkpoint()
+        started = time.perf_counter()
+        processed = 0
+        with open(self.path, newline="", encoding="utf-8-sig") as handle:
+            reader = csv.DictReader(handle)
+            self.check_header(reader.fieldnames)
+            numbered = ((reader.line_num, row) for row in reader)
+            pending = islice(numbered, state["rows"], None)
+            while chunk := list(islice(pending, self.chunk_size)):
+                with transaction.atomic():
+                    created, errors = self.import_chunk(chunk)
+                    chunk_state = {
+                        **state,
+                        "rows": state["rows"] + len(chunk),
+                        "created": state["created"] + created,
+                        "rejected": state["rejected"] + len(errors),
+                    }
+                    self.save_checkpoint(chunk_state)
+                state = chunk_state
+                processed += len(chunk)
+                self.write_mirror(state)
+                elapsed = time.perf_counter() - started
+                yield {
+                    "rows": state["rows"],
+                    "created": state["created"],
+                    "rejected": state["rejected"],
+                    "rate": processed / elapsed if elapsed else 0.0,
+                    "errors": errors,
+                }
+
+    def import_chunk(self, chunk):
+        payloads, lines, errors = [], [], []
+        for line, row in chunk:
+            if None in row:
+                errors.append({"line": line, "errors": ["Row has more fields than the header."]})
+                continue
+            payloads.append({name: value for name, value in row.items() if value not in ("", None)})
+            lines.append(line)
+        validated, row_errors = self.validate(payloads)
+        errors.extend({"line": lines[error["index"]], "errors": error["errors"]} for error in row_errors)
+        errors.sort(key=lambda error: error["line"])
+        if errors and not self.skip_invalid:
+            raise InvalidRows(errors)
+        if row_errors:
+            # Rows are validated independently, so the rest pass on their own.
+            invalid = {error["index"] for error in row_errors}
+            payloads = [payload for index, payload in enumerate(payloads) if index not in invalid]
+            validated, _ = self.validate(payloads)
+        if not validated:
+            return 0, errors
+        return len(self.create(validated)), errors
@@ -0,0 +1,194 @@
+import hashlib
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .routers import REPLICA_DB_ALIAS, read_from, replica_configured, routed_iterator
+
+logger = logging.getLogger("ewaste_api.queries")
+
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+
+
+def query_shape(sql):
+    """SQL with ``IN (%s, %s, ...)`` lists collapsed so batches of any size compare equal."""
+    return _PLACEHOLDER_LIST.sub("(%s, ...)", sql)
+
+
+class QueryRecorder:
+    """``execute_wrapper`` that counts queries, database time and repeated SQL shapes."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.shapes[query_shape(sql)] += 1
+
+    def repeated(self, threshold):
+        """``[(shape, count)]`` for every shape executed at least ``threshold`` times."""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+    @contextmanager
+    def capture(self, using=None):
+        aliases = [using] if using else list(connections)
+        with ExitStack() as stack:
+            for alias in aliases:
+                stack.enter_context(connections[alias].execute_wrapper(self))
+            yield self
+
+
+class QueryBudgetMiddleware:
+    """
+    Report the queries each request issues.
+
+    Adds ``Server-Timing: db;dur=<ms>;desc="<n> queries"`` to the response and
+    logs one line per request on ``ewaste_api.queries``, at WARNING when a SQL
+    shape repeats ``QUERY_BUDGET_REPEAT_THRESHOLD`` times or more (an N+1).
+    Queries run while a streaming body is consumed are not counted. Enabled by
+    ``QUERY_BUDGET_ENABLED``.
+
+    Under ASGI the wrappers are installed from the ORM's thread-sensitive
+    executor, because database connections are per thread and async views
+    run their queries there.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.QUERY_BUDGET_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        recorder = QueryRecorder()
+        with recorder.capture():
+            response = self.get_response(request)
+        return self.report(request, response, recorder)
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        capture = ExitStack()
+        await sync_to_async(capture.enter_context)(recorder.capture())
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(capture.close)()
+        return self.report(request, response, recorder)
+
+    def report(self, request, response, recorder):
+        duration_ms = recorder.duration * 1000
+        timing = f'db;dur={duration_ms:.2f};desc="{recorder.count} queries"'
+        existing = response.get("Server-Timing")
+        response["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+
+        repeated = recorder.repeated(settings.QUERY_BUDGET_REPEAT_THRESHOLD)
+        logger.log(
+            logging.WARNING if repeated else logging.INFO,
+            "method=%s path=%s status=%s queries=%d db_ms=%.2f repeated=%s",
+            request.method,
+            request.path,
+            response.status_code,
+            recorder.count,
+            duration_ms,
+            "; ".join(f"{count}x {shape[:200]}" for shape, count in repeated) or "-",
+            extra={
+                "query_budget": {
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    "queries": recorder.count,
+                    "db_ms": round(duration_ms, 2),
+                    "repeated": [{"sql": shape, "count": count} for shape, count in repeated],
+                }
+            },
+        )
+        return response
+
+
+class ReadReplicaMiddleware:
+    """
+    Serve safe requests from the read replica, with read-your-writes.
+
+    GET, HEAD and OPTIONS requests read from ``replica`` (see
+    ``ewaste_api.routers``), including the rows a streamed export pulls after
+    the view returns. Any other request reads and writes the primary, and
+    pins its client (its ``Authorization`` header or session cookie) to the
+    primary for ``DATABASE_REPLICA_PIN_SECONDS``, so the client's next reads
+    see its own writes despite replication lag. Clients can also send
+    ``X-Read-Consistency: strong`` to read from the primary. Not used unless a
+    ``replica`` database is configured.
+    """
+
+    sync_capable = True
+    async_capable = True
+    safe_methods = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(self, get_response):
+        if not replica_configured():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        key = self.pin_key(request)
+        route = self.route(request, pinned=key is not None and cache.get(key))
+        with read_from(route):
+            response = self.get_response(request)
+        if key is not None and request.method not in self.safe_methods:
+            cache.set(key, True, timeout=settings.DATABASE_REPLICA_PIN_SECONDS)
+        return self.finish(response, route)
+
+    async def __acall__(self, request):
+        key = self.pin_key(request)
+        route = self.route(request, pinned=key is not None and await cache.aget(key))
+        with read_from(route):
+            response = await self.get_response(request)
+        if key is not None and request.method not in self.safe_methods:
+            await cache.aset(key, True, timeout=settings.DATABASE_REPLICA_PIN_SECONDS)
+        return self.finish(response, route)
+
+    def pin_key(self, request):
+        credential = request.META.get("HTTP_AUTHORIZATION") or request.COOKIES.get(
+            settings.SESSION_COOKIE_NAME
+        )
+        if not credential:
+            return None
+        return "replica-pin:" + hashlib.sha256(credential.encode()).hexdigest()
+
+    def route(self, request, pinned):
+        if request.method not in self.safe_methods or pinned:
+            return None
+        if request.headers.get("X-Read-Consistency", "").lower() == "strong":
+            return None
+        return REPLICA_DB_ALIAS
+
+    def finish(self, response, route):
+        if route is not None and response.streaming:
+            # Only sync iterators can be wrapped; async views do not stream.
+            if not getattr(response, "is_async", False):
+                response.streaming_content = routed_iterator(response.streaming_content, route)
+        return response
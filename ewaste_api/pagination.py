@@ -0,0 +1,248 @@
+import json
+from base64 import b64decode, b64encode
+from collections import namedtuple
+from urllib import parse
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+Cursor = namedtuple("Cursor", ["position", "reverse"])
+
+
+def _reverse_ordering(ordering):
+    return tuple(term[1:] if term.startswith("-") else f"-{term}" for term in ordering)
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination keyed on the full ordering tuple.
+
+    DRF's ``CursorPagination`` only encodes the first ordering field and falls
+    back to an ``OFFSET`` to step over ties. Here the cursor carries the value
+    of every ordering field, so the next page is a pure index range seek. The
+    last ordering field must be unique (normally ``id``).
+    """
+
+    page_size = getattr(settings, "API_PAGE_SIZE", 50)
+    page_size_query_param = "page_size"
+    max_page_size = getattr(settings, "API_MAX_PAGE_SIZE", 500)
+    ordering = ("id",)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = bool(self.cursor and self.cursor.reverse)
+
+        ordering = _reverse_ordering(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if self.cursor is not None:
+            queryset = queryset.filter(
+                self._keyset_filter(queryset, ordering, self.cursor.position)
+            )
+
+        results = list(queryset[: self.page_size + 1])
+        self.page = results[: self.page_size]
+        has_following = len(results) > len(self.page)
+        if reverse:
+            self.page.reverse()
+            self.has_next = self.cursor is not None
+            self.has_previous = has_following
+        else:
+            self.has_next = has_following
+            self.has_previous = self.cursor is not None
+        if not self.page:
+            self.has_next = self.has_previous = False
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                return _positive_int(
+                    request.query_params[self.page_size_query_param],
+                    strict=True,
+                    cutoff=self.max_page_size,
+                )
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def get_ordering(self, request, queryset, view):
+        # Like DRF's CursorPagination, follow an ordering filter on the view.
+        for backend in getattr(view, "filter_backends", ()):
+            if hasattr(backend, "get_ordering"):
+                return tuple(backend().get_ordering(request, queryset, view))
+        return tuple(self.ordering)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        position = self._get_position_from_instance(self.page[-1], self.ordering)
+        return self.encode_cursor(Cursor(position=position, reverse=False))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        position = self._get_position_from_instance(self.page[0], self.ordering)
+        return self.encode_cursor(Cursor(position=position, reverse=True))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            querystring = b64decode(encoded.encode("ascii")).decode("ascii")
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            reverse = bool(int(tokens.get("r", ["0"])[0]))
+            position = json.loads(tokens["p"][0])
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(position=position, reverse=reverse)
+
+    def encode_cursor(self, cursor):
+        tokens = {"p": json.dumps(cursor.position, separators=(",", ":"))}
+        if cursor.reverse:
+            tokens["r"] = "1"
+        querystring = parse.urlencode(tokens)
+        encoded = b64encode(querystring.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _get_position_from_instance(self, instance, ordering):
+        position = []
+        for term in ordering:
+            name = term.lstrip("-")
+            value = instance[name] if isinstance(instance, dict) else getattr(instance, name)
+            position.append(None if value is None else str(value))
+        return position
+
+    def _keyset_filter(self, queryset, ordering, position):
+        """
+        Build ``(a, b, c) > (x, y, z)`` for a mixed-direction ordering.
+
+        The leading field is additionally bounded on its own so the database
+        can seek straight to the cursor in the ordering index. Ordering terms
+        may name model fields or annotations on ``queryset``.
+        """
+        annotations = queryset.query.annotations
+        values = []
+        for term, raw in zip(ordering, position):
+            name = term.lstrip("-")
+            if name in annotations:
+                field = annotations[name].output_field
+            else:
+                field = queryset.model._meta.get_field(name)
+            try:
+                values.append(field.to_python(raw))
+            except ValidationError:
+                raise NotFound(self.invalid_cursor_message)
+            if values[-1] is None:
+                raise NotFound(self.invalid_cursor_message)
+
+        after = Q()
+        equal = {}
+        for term, value in zip(ordering, values):
+            name = term.lstrip("-")
+            lookup = "lt" if term.startswith("-") else "gt"
+            after |= Q(**equal, **{f"{name}__{lookup}": value})
+            equal[name] = value
+
+        leading = ordering[0]
+        bound = "lte" if leading.startswith("-") else "gte"
+        return Q(**{f"{leading.lstrip('-')}__{bound}": values[0]}) & after
+
+
+def planner_row_estimate(queryset):
+    """The Postgres planner's row estimate for ``queryset``, or ``None`` elsewhere."""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class CountedKeysetPagination(KeysetPagination):
+    """
+    Keyset pagination that also reports how many rows the filtered list has.
+
+    A first page with no next page is the whole list, so it is counted
+    without a query. Otherwise, up to ``exact_count_threshold`` rows the count
+    is exact, from a ``COUNT(*)`` that stops reading after one row past the
+    threshold. It runs over the view's filtered queryset rather than the
+    page's rows, so it joins none of the tables the page reads. Larger
+    lists get the view's ``estimate_count(request)`` (for example from counters
+    kept on writes), else the Postgres planner's estimate, and the response
+    says ``"count_approximate": true``. ``?count=exact`` always counts, as does
+    a database with neither estimate.
+    """
+
+    exact_count_threshold = getattr(settings, "API_EXACT_COUNT_THRESHOLD", 1000)
+    count_query_param = "count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page = super().paginate_queryset(queryset, request, view)
+        if page is None:
+            return None
+        if self.cursor is None and not self.has_next:
+            self.count, self.count_approximate = len(page), False
+        else:
+            self.count, self.count_approximate = self.get_count(queryset, request, view)
+        return page
+
+    def get_count(self, queryset, request, view):
+        if view is not None:
+            queryset = view.filter_queryset(view.get_queryset())
+        queryset = queryset.order_by().values("pk")
+        if request.query_params.get(self.count_query_param) == "exact":
+            return queryset.count(), False
+        bounded = queryset[: self.exact_count_threshold + 1].count()
+        if bounded <= self.exact_count_threshold:
+            return bounded, False
+        estimate = None
+        if hasattr(view, "estimate_count"):
+            estimate = view.estimate_count(request)
+        if estimate is None:
+            estimate = planner_row_estimate(queryset)
+        if estimate is None:
+            return queryset.count(), False
+        # Never report fewer rows than the bounded count just saw.
+        return max(estimate, bounded), True
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "count": self.count,
+                "count_approximate": self.count_approximate,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"] = {
+            "count": {"type": "integer"},
+            "count_approximate": {"type": "boolean"},
+            **response_schema["properties"],
+        }
+        return response_schema
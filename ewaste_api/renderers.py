@@ -0,0 +1,119 @@
+import io
+from itertools import chain
+
+from django.conf import settings
+from rest_framework import parsers, renderers
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised by patching ``orjson`` to None
+    orjson = None
+
+_ORJSON_OPTIONS = (
+    # Datetimes go through DRF's encoder, which trims to milliseconds and
+    # writes UTC as "Z"; orjson's native format differs.
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+)
+
+
+def _members(container):
+    if isinstance(container, dict):
+        return container.values()
+    if isinstance(container, (list, tuple)):
+        return container
+    return (container,)
+
+
+def _has_float_orjson_changes(data):
+    """
+    Whether ``data`` holds a float orjson writes differently from the stdlib.
+
+    The stdlib writes ``repr(value)``; orjson writes exponents as ``1e16``
+    and ``1e-5`` rather than ``1e+16`` and ``1e-05``, ``0.00001`` where
+    ``repr`` has an exponent, and NaN and infinity as ``null``. Nested
+    containers are read one level at a time, so the type checks over a
+    page's fields run in C rather than once per value in Python.
+    """
+    level, kinds = [data], {type(data)}
+    while level:
+        if all(issubclass(kind, dict) for kind in kinds):
+            values = list(chain.from_iterable(map(dict.values, level)))
+        else:
+            values = [value for container in level for value in _members(container)]
+        kinds = set(map(type, values))
+        if any(issubclass(kind, float) for kind in kinds):
+            for value in values:
+                if isinstance(value, float) and orjson.dumps(value) != repr(value).encode():
+                    return True
+        containers = {kind for kind in kinds if issubclass(kind, (dict, list, tuple))}
+        if containers == kinds:
+            level = values
+        elif containers:
+            level = [value for value in values if isinstance(value, (dict, list, tuple))]
+            kinds = containers
+        else:
+            return False
+    return False
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    ``JSONRenderer`` backed by orjson.
+
+    Produces the same bytes as DRF's renderer for compact, unicode output:
+    types orjson does not handle natively (``Decimal``, datetimes, lazy
+    strings, querysets) are converted by DRF's ``JSONEncoder.default``.
+    Indented output (the browsable API, ``; indent=N``), non-default
+    ``COMPACT_JSON``/``UNICODE_JSON`` settings, anything orjson rejects (such
+    as integers beyond 64 bits) and a missing orjson all fall back to the
+    stdlib renderer.
+
+    orjson formats some floats differently and does not raise for them (see
+    ``_has_float_orjson_changes``), so data holding such a float is rendered
+    again by the stdlib, which also raises ``ValueError`` for NaN and
+    infinity as DRF's ``STRICT_JSON`` does.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if (
+            orjson is None
+            or not self.compact
+            or self.ensure_ascii
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        if _has_float_orjson_changes(data):
+            return super().render(data, accepted_media_type, renderer_context)
+        if b"\xe2\x80" in ret:
+            # Keep DRF's escaping of U+2028/U+2029 so the output stays a strict JS subset.
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+class ORJSONParser(parsers.JSONParser):
+    """
+    ``JSONParser`` backed by orjson for UTF-8 bodies.
+
+    Other encodings, input orjson refuses (including integers beyond 64 bits)
+    and a missing orjson are handed to the stdlib parser, so error messages
+    and accepted input stay DRF's.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower().replace("_", "-") not in ("utf-8", "utf8"):
+            return super().parse(stream, media_type, parser_context)
+        body = stream.read() if stream is not None else b""
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(body), media_type, parser_context)
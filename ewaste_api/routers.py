@@ -0,0 +1,88 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+REPLICA_DB_ALIAS = "replica"
+
+# Where reads go for the current request or block: ``REPLICA_DB_ALIAS`` or
+# ``None`` for the primary. Context variables follow ``sync_to_async`` hops,
+# so async views and their ORM threads see the same route.
+_read_route = ContextVar("ewaste_api_read_route", default=None)
+
+# Always read from the primary: a lagging replica could drop a fresh login
+# session or hide a token revocation from the workers' revocation filters.
+PRIMARY_ONLY_MODELS = {
+    "sessions.session",
+    "accounts.revokedtoken",
+    "accounts.revocationcounter",
+}
+
+
+def replica_configured():
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+@contextmanager
+def read_from(alias):
+    """Send ORM reads in this block to ``alias`` (the replica, or ``None`` for the primary)."""
+    token = _read_route.set(alias)
+    try:
+        yield
+    finally:
+        _read_route.reset(token)
+
+
+def use_replica():
+    return read_from(REPLICA_DB_ALIAS)
+
+
+def use_primary():
+    return read_from(None)
+
+
+def routed_iterator(iterator, alias):
+    """
+    Pull each item of ``iterator`` with reads sent to ``alias``.
+
+    Streamed response bodies are consumed after the view and its middleware
+    have returned, so the route has to travel with the iterator.
+    """
+    iterator = iter(iterator)
+    while True:
+        with read_from(alias):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+class ReadReplicaRouter:
+    """
+    Send reads to the ``replica`` database inside ``use_replica()`` blocks.
+
+    ``ReadReplicaMiddleware`` opens such a block for safe requests. Everything
+    else, including every write and any read outside a block, goes to the
+    primary. Without a ``replica`` entry in ``DATABASES`` the router does nothing.
+    """
+
+    def db_for_read(self, model, **hints):
+        if (
+            _read_route.get() == REPLICA_DB_ALIAS
+            and model._meta.label_lower not in PRIMARY_ONLY_MODELS
+            and replica_configured()
+        ):
+            return REPLICA_DB_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints):
+        # Explicit, so objects loaded from the replica are saved to the primary.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
@@ -0,0 +1,150 @@
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import ISO_8601, response, serializers
+from rest_framework.fields import empty
+from rest_framework.settings import api_settings
+
+# Fields whose ``.values()`` output is already their JSON representation.
+_PASSTHROUGH_FIELDS = (
+    serializers.RelatedField,
+    serializers.IntegerField,
+    serializers.CharField,
+    serializers.BooleanField,
+)
+
+
+def _decimal_representation(field):
+    coerce = getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+    if field.decimal_places is None or field.localize or not coerce:
+        return field.to_representation
+    exponent = -field.decimal_places
+
+    def convert(value):
+        # Column values already carry the field's scale; skip DRF's quantize.
+        if isinstance(value, Decimal) and value.as_tuple().exponent == exponent:
+            return format(value, "f")
+        return field.to_representation(value)
+
+    return convert
+
+
+def _datetime_representation(field):
+    """``DateTimeField.to_representation`` with the active timezone passed in once per page."""
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    if hasattr(field, "timezone") or output_format is None or output_format.lower() != ISO_8601:
+        return None
+
+    def convert(value, tz):
+        if tz is None or not isinstance(value, datetime) or timezone.is_naive(value):
+            return field.to_representation(value)
+        value = value.astimezone(tz).isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+    return convert
+
+
+class RowMapper:
+    """
+    Turn ``values_list()`` rows into the dicts a read-only serializer would produce.
+
+    ``lookups`` are the ``values_list()`` arguments; every serializer field
+    maps to one of them (dotted sources such as ``category.name`` become
+    ``category__name``). ``computed`` supplies ``{field: (function, lookups)}``
+    for fields that are not a plain column, such as ``SerializerMethodField``;
+    ``function`` receives those columns positionally. Conversions reuse the
+    serializer's own field instances (with the timezone lookup and decimal
+    rescaling hoisted out of the per-row path), and, like DRF, a dotted field is left
+    out when a relation on its path is null, so the output matches
+    ``serializer.data`` exactly. The per-row function is generated once.
+    """
+
+    def __init__(self, serializer_class, computed=None):
+        computed = computed or {}
+        self.lookups = []
+        namespace = {}
+        lines = ["def map_row(row, tz):", "    data = {}"]
+        for name, field in serializer_class().fields.items():
+            if field.write_only:
+                continue
+            if name in computed:
+                function, lookups = computed[name]
+                namespace[f"f_{name}"] = function
+                args = ", ".join(f"row[{self._index(lookup)}]" for lookup in lookups)
+                lines.append(f"    data[{name!r}] = f_{name}({args})")
+                continue
+            if isinstance(field, serializers.SerializerMethodField):
+                raise TypeError(f"{serializer_class.__name__}.{name} needs a computed mapping")
+            path = field.source_attrs
+            value = f"row[{self._index('__'.join(path))}]"
+            converted = f"c_{name}({value})"
+            if isinstance(field, _PASSTHROUGH_FIELDS):
+                converted = None
+            elif isinstance(field, serializers.DecimalField):
+                namespace[f"c_{name}"] = _decimal_representation(field)
+            elif isinstance(field, serializers.DateTimeField) and _datetime_representation(field):
+                namespace[f"c_{name}"] = _datetime_representation(field)
+                converted = f"c_{name}({value}, tz)"
+            else:
+                namespace[f"c_{name}"] = field.to_representation
+            if converted is None:
+                statement = f"data[{name!r}] = {value}"
+            else:
+                statement = f"data[{name!r}] = None if {value} is None else {converted}"
+            if len(path) > 1 and not field.allow_null and field.default is empty:
+                # DRF skips the field when the related object is missing.
+                relations = (
+                    f"row[{self._index('__'.join(path[:depth]))}] is not None"
+                    for depth in range(1, len(path))
+                )
+                lines.append(f"    if {' and '.join(relations)}:")
+                statement = f"    {statement}"
+            lines.append(f"    {statement}")
+        lines.append("    return data")
+        source = "\n".join(lines) + "\n"
+        exec(compile(source, f"<row mapper for {serializer_class.__name__}>", "exec"), namespace)
+        self.map_row = namespace["map_row"]
+
+    def _index(self, lookup):
+        if lookup not in self.lookups:
+            self.lookups.append(lookup)
+        return self.lookups.index(lookup)
+
+    def __call__(self, rows):
+        tz = timezone.get_current_timezone() if settings.USE_TZ else None
+        map_row = self.map_row
+        return [map_row(row, tz) for row in rows]
+
+
+@lru_cache(maxsize=None)
+def _row_mapper(viewset_class):
+    return RowMapper(viewset_class.serializer_class, viewset_class.list_computed_fields)
+
+
+class ValuesListMixin:
+    """
+    Serve ``list`` from ``values_list()`` rows through a ``RowMapper``.
+
+    The response is byte-identical to the serializer path but skips model
+    instantiation and DRF's per-field attribute lookups. Set
+    ``list_computed_fields`` for serializer fields that are not plain columns.
+    Disabled by ``FAST_LIST_SERIALIZATION=false``.
+    """
+
+    list_computed_fields = {}
+
+    def list(self, request, *args, **kwargs):
+        if not settings.FAST_LIST_SERIALIZATION:
+            return super().list(request, *args, **kwargs)
+        mapper = _row_mapper(type(self))
+        # Named rows let keyset pagination read ordering fields by attribute.
+        queryset = self.filter_queryset(self.get_queryset()).values_list(
+            *mapper.lookups, named=True
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(mapper(page))
+        return response.Response(mapper(queryset))
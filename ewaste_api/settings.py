@@ -3,6 +3,7 @@ from datetime import timedelta
 from pathlib import Path
 
 import dj_database_url
+from corsheaders.defaults import default_headers
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -66,6 +67,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "ewaste_api.middleware.QueryBudgetMiddleware",
+    "ewaste_api.middleware.ReadReplicaMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -77,6 +80,12 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# WhiteNoise is sync-only, so under ASGI every request takes a thread hop
+# through it. Turn it off when a proxy or CDN serves ``STATIC_ROOT``.
+SERVE_STATIC = os.getenv("SERVE_STATIC", "true").lower() == "true"
+if not SERVE_STATIC:
+    MIDDLEWARE.remove("whitenoise.middleware.WhiteNoiseMiddleware")
+
 ROOT_URLCONF = "ewaste_api.urls"
 
 TEMPLATES = [
@@ -113,6 +122,75 @@ if database_url:
         ssl_require=os.getenv("DATABASE_SSL_REQUIRE", "false").lower() == "true",
     )
 
+# Optional read replica (see ewaste_api.routers). Safe requests read from it;
+# writes, and reads by a client that wrote in the last
+# DATABASE_REPLICA_PIN_SECONDS, stay on the primary. Tests mirror the primary.
+database_replica_url = os.getenv("DATABASE_REPLICA_URL")
+if database_replica_url:
+    DATABASES["replica"] = dj_database_url.parse(
+        database_replica_url,
+        conn_max_age=600,
+        ssl_require=os.getenv("DATABASE_SSL_REQUIRE", "false").lower() == "true",
+        test_options={"MIRROR": "default"},
+    )
+DATABASE_ROUTERS = ["ewaste_api.routers.ReadReplicaRouter"]
+DATABASE_REPLICA_PIN_SECONDS = float(os.getenv("DATABASE_REPLICA_PIN_SECONDS", "10"))
+
+# SQLite tuning for concurrent collectors (see ewaste_api.db.sqlite3): WAL lets
+# readers run alongside the single writer, and BEGIN IMMEDIATE makes writers
+# queue on the busy timeout instead of failing with "database is locked".
+SQLITE_TUNING = os.getenv("SQLITE_TUNING", "true").lower() == "true"
+SQLITE_OPTIONS = {
+    "transaction_mode": os.getenv("SQLITE_TRANSACTION_MODE", "IMMEDIATE"),
+    "init_command": "; ".join(
+        [
+            "PRAGMA journal_mode = WAL",
+            "PRAGMA synchronous = NORMAL",
+            f"PRAGMA busy_timeout = {int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '20000'))}",
+            f"PRAGMA mmap_size = {int(os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))}",
+            # Negative sizes are KiB: 64 MiB of page cache per connection.
+            f"PRAGMA cache_size = {int(os.getenv('SQLITE_CACHE_SIZE', '-65536'))}",
+            "PRAGMA temp_store = MEMORY",
+        ]
+    ),
+}
+for database in DATABASES.values():
+    if SQLITE_TUNING and database["ENGINE"] == "django.db.backends.sqlite3":
+        database["ENGINE"] = "ewaste_api.db.sqlite3"
+        database["OPTIONS"] = {**SQLITE_OPTIONS, **database.get("OPTIONS", {})}
+
+# Optional per-process Postgres connection pool (see ewaste_api.db.postgresql).
+# Connections go back to the pool after each request instead of each worker
+# thread holding its own for CONN_MAX_AGE, so threads and async views share
+# at most DATABASE_POOL_MAX_SIZE connections per worker process and database.
+DATABASE_POOL = os.getenv("DATABASE_POOL", "false").lower() == "true"
+DATABASE_POOL_OPTIONS = {
+    "min_size": int(os.getenv("DATABASE_POOL_MIN_SIZE", "1")),
+    "max_size": int(os.getenv("DATABASE_POOL_MAX_SIZE", "2")),
+    "timeout": float(os.getenv("DATABASE_POOL_TIMEOUT", "10")),
+    "max_lifetime": float(os.getenv("DATABASE_POOL_MAX_LIFETIME", "1800")),
+    "max_idle": float(os.getenv("DATABASE_POOL_MAX_IDLE", "300")),
+}
+for database in DATABASES.values():
+    if DATABASE_POOL and database["ENGINE"] == "django.db.backends.postgresql":
+        database.update(ENGINE="ewaste_api.db.postgresql", CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=True)
+        database["OPTIONS"] = {**database.get("OPTIONS", {}), "pool": dict(DATABASE_POOL_OPTIONS)}
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "ewaste-api"),
+    }
+}
+# Worker processes serving the app (Render and Heroku set it). With more than
+# one, the default cache must be shared; see ewaste_api.cache.check_shared_cache.
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+SHARED_VERSION_CHECK_SECONDS = float(os.getenv("SHARED_VERSION_CHECK_SECONDS", "1.0"))
+ANALYTICS_CACHE_SECONDS = int(os.getenv("ANALYTICS_CACHE_SECONDS", "300"))
+ANALYTICS_RECOMPUTE_LOCK_SECONDS = int(os.getenv("ANALYTICS_RECOMPUTE_LOCK_SECONDS", "30"))
+SUPPLIER_RANKING_DEFAULT_LIMIT = int(os.getenv("SUPPLIER_RANKING_DEFAULT_LIMIT", "10"))
+SUPPLIER_RANKING_MAX_LIMIT = int(os.getenv("SUPPLIER_RANKING_MAX_LIMIT", "100"))
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
@@ -132,9 +210,30 @@ STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "accounts.User"
 
+# orjson-backed JSON renderer/parser; output is identical to DRF's stdlib JSON
+# and they fall back to it when orjson is not installed.
+ORJSON_ENABLED = os.getenv("ORJSON_ENABLED", "true").lower() == "true"
+JSON_RENDERER = (
+    "ewaste_api.renderers.ORJSONRenderer"
+    if ORJSON_ENABLED
+    else "rest_framework.renderers.JSONRenderer"
+)
+JSON_PARSER = (
+    "ewaste_api.renderers.ORJSONParser" if ORJSON_ENABLED else "rest_framework.parsers.JSONParser"
+)
+
 REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": (
+        JSON_RENDERER,
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        JSON_PARSER,
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.ClaimsJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
@@ -142,7 +241,31 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+API_PAGE_SIZE = int(os.getenv("API_PAGE_SIZE", "50"))
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "500"))
+API_EXACT_COUNT_THRESHOLD = int(os.getenv("API_EXACT_COUNT_THRESHOLD", "1000"))
+ITEMS_BULK_MAX_ROWS = int(os.getenv("ITEMS_BULK_MAX_ROWS", "5000"))
+ITEMS_BULK_BATCH_SIZE = int(os.getenv("ITEMS_BULK_BATCH_SIZE", "1000"))
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "2000"))
+FAST_LIST_SERIALIZATION = os.getenv("FAST_LIST_SERIALIZATION", "true").lower() == "true"
+
 CORS_ALLOW_ALL_ORIGINS = True
+CORS_ALLOW_HEADERS = (*default_headers, "x-read-consistency")
+
+QUERY_BUDGET_ENABLED = os.getenv("QUERY_BUDGET_ENABLED", "false").lower() == "true"
+QUERY_BUDGET_REPEAT_THRESHOLD = int(os.getenv("QUERY_BUDGET_REPEAT_THRESHOLD", "5"))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {
+        "ewaste_api": {
+            "handlers": ["console"],
+            "level": os.getenv("EWASTE_LOG_LEVEL", "INFO"),
+        },
+    },
+}
 
 access_minutes = int(os.getenv("ACCESS_TOKEN_LIFETIME_MINUTES", "15"))
 refresh_days = int(os.getenv("REFRESH_TOKEN_LIFETIME_DAYS", "7"))
@@ -150,8 +273,20 @@ refresh_days = int(os.getenv("REFRESH_TOKEN_LIFETIME_DAYS", "7"))
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=access_minutes),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=refresh_days),
+    "TOKEN_OBTAIN_SERIALIZER": "accounts.serializers.ClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "accounts.serializers.ClaimsTokenRefreshSerializer",
 }
 
+# How long a token's role/status claims, or a cached user lookup, may be
+# trusted; role changes and deactivations take effect within this window.
+AUTH_USER_CACHE_SECONDS = float(os.getenv("AUTH_USER_CACHE_SECONDS", "60"))
+AUTH_USER_CACHE_SIZE = int(os.getenv("AUTH_USER_CACHE_SIZE", "1024"))
+
+# Bloom filter in front of the revoked-token table (see accounts.revocation).
+TOKEN_REVOCATION_CAPACITY = int(os.getenv("TOKEN_REVOCATION_CAPACITY", "100000"))
+TOKEN_REVOCATION_ERROR_RATE = float(os.getenv("TOKEN_REVOCATION_ERROR_RATE", "0.01"))
+TOKEN_REVOCATION_REBUILD_SECONDS = float(os.getenv("TOKEN_REVOCATION_REBUILD_SECONDS", "3600"))
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "E-Waste Collection & Pricing API",
     "DESCRIPTION": "API for managing e-waste categories, suppliers, collections, transactions, and analytics.",
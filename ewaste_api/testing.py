@@ -0,0 +1,30 @@
+from contextlib import contextmanager
+
+from .middleware import QueryRecorder
+
+
+class QueryBudgetMixin:
+    """``TestCase`` mixin for asserting how many queries a block may issue."""
+
+    @contextmanager
+    def assertQueryBudget(self, max_queries, max_repeats=None, using=None):
+        """
+        Fail if the block runs more than ``max_queries`` queries, or if
+        ``max_repeats`` is given and any SQL shape runs more often than that.
+        """
+        recorder = QueryRecorder()
+        with recorder.capture(using):
+            yield recorder
+        report = "\n".join(f"{count}x {shape}" for shape, count in recorder.shapes.most_common())
+        self.assertLessEqual(
+            recorder.count,
+            max_queries,
+            f"{recorder.count} queries executed, budget is {max_queries}:\n{report}",
+        )
+        if max_repeats is not None:
+            worst = max(recorder.shapes.values(), default=0)
+            self.assertLessEqual(
+                worst,
+                max_repeats,
+                f"A query shape ran {worst} times, budget is {max_repeats}:\n{report}",
+            )
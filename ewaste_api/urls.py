@@ -4,9 +4,17 @@ from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 from rest_framework.routers import DefaultRouter
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
-from accounts.views import RegisterView
+from accounts.views import RegisterView, RevokeTokenView
+from analytics.async_views import (
+    AsyncDashboardView,
+    AsyncMonthlyAnalyticsView,
+    AsyncSummaryAnalyticsView,
+    AsyncSupplierRankingView,
+    AsyncTodayAnalyticsView,
+)
 from analytics.views import (
     MonthlyAnalyticsView,
+    SummaryAnalyticsView,
     SupplierRankingView,
     TodayAnalyticsView,
 )
@@ -26,10 +34,33 @@ urlpatterns = [
     path("auth/register/", RegisterView.as_view(), name="register"),
     path("auth/login/", TokenObtainPairView.as_view(), name="login"),
     path("auth/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("auth/revoke/", RevokeTokenView.as_view(), name="token_revoke"),
     path("schema/", SpectacularAPIView.as_view(), name="schema"),
     path("docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="docs"),
     path("analytics/today/", TodayAnalyticsView.as_view(), name="analytics-today"),
     path("analytics/monthly/", MonthlyAnalyticsView.as_view(), name="analytics-monthly"),
+    path("analytics/summary/", SummaryAnalyticsView.as_view(), name="analytics-summary"),
     path("analytics/supplier-ranking/", SupplierRankingView.as_view(), name="analytics-suppliers"),
+    path("analytics/async/today/", AsyncTodayAnalyticsView.as_view(), name="analytics-async-today"),
+    path(
+        "analytics/async/monthly/",
+        AsyncMonthlyAnalyticsView.as_view(),
+        name="analytics-async-monthly",
+    ),
+    path(
+        "analytics/async/summary/",
+        AsyncSummaryAnalyticsView.as_view(),
+        name="analytics-async-summary",
+    ),
+    path(
+        "analytics/async/supplier-ranking/",
+        AsyncSupplierRankingView.as_view(),
+        name="analytics-async-suppliers",
+    ),
+    path(
+        "analytics/async/dashboard/",
+        AsyncDashboardView.as_view(),
+        name="analytics-async-dashboard",
+    ),
     path("", include(router.urls)),
 ]
@@ -0,0 +1,102 @@
+"""
+Production gunicorn settings, picked up automatically from the project root
+(``gunicorn ewaste_api.wsgi:application``) or passed with ``-c gunicorn.conf.py``.
+
+Every value can be overridden from the environment; see the README's
+"Serving in production" section. Command-line flags still win over this file.
+"""
+
+import os
+import sys
+
+
+def _env_bool(name, default):
+    return os.getenv(name, str(default)).lower() in {"1", "true", "yes"}
+
+
+# CPUs this process may run on, which in a container can be far fewer than
+# the host has. CPU quotas are not visible here, so set WEB_CONCURRENCY on
+# small instances.
+cpu_count = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+
+bind = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', '8000')}")
+
+# Sync workers by default: 2 x CPUs + 1 processes. GUNICORN_WORKER_CLASS=gthread
+# serves GUNICORN_THREADS requests per process instead, which needs fewer
+# processes (and less memory) when views mostly wait on a remote database.
+# Note that gunicorn 21's gthread worker resets connections it had accepted
+# but not yet started when it is recycled; sync workers lose none.
+# WEB_CONCURRENCY is the variable Render and Heroku already set.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "sync")
+default_workers = cpu_count + 1 if worker_class == "gthread" else 2 * cpu_count + 1
+workers = int(os.getenv("WEB_CONCURRENCY", str(default_workers)))
+# More than one thread turns sync workers into gthread ones, so only
+# gthread gets a default above 1.
+threads = int(os.getenv("GUNICORN_THREADS", "4" if worker_class == "gthread" else "1"))
+
+# Import Django and the URLconf once in the master so workers share those pages
+# copy-on-write instead of each importing them after the fork.
+preload_app = _env_bool("GUNICORN_PRELOAD", True)
+
+# Recycle workers after a jittered number of requests to cap slow memory
+# growth without every worker restarting at once.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+# Heartbeat files on tmpfs, so a slow container disk cannot stall workers.
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG") or None
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def _close_connections():
+    from django.conf import settings
+
+    if not settings.configured:  # the app was not preloaded
+        return
+    from django.core.cache import caches
+    from django.db import connections
+
+    for connection in connections.all(initialized_only=True):
+        connection.close()
+    for cache in caches.all(initialized_only=True):
+        cache.close()
+
+
+def pre_fork(server, worker):
+    """
+    Close anything the master opened while importing the app.
+
+    The master never serves requests, so nothing is lost, and workers do not
+    inherit a live database or cache socket.
+    """
+    _close_connections()
+
+
+def post_fork(server, worker):
+    """Start each worker with fresh connections, opened on first use."""
+    _close_connections()
+
+
+def post_worker_init(worker):
+    """
+    Stop the server if each worker would keep its own default cache.
+
+    Runs the ``ewaste_api.E001`` check with the real worker count, which is
+    2 x CPUs + 1 when ``WEB_CONCURRENCY`` is unset. Exiting with gunicorn's
+    boot error code halts the master instead of respawning the worker.
+    """
+    from gunicorn.arbiter import Arbiter
+
+    from ewaste_api.cache import check_shared_cache
+
+    for error in check_shared_cache(workers=worker.cfg.workers):
+        worker.log.error("%s HINT: %s", error.msg, error.hint)
+        sys.exit(Arbiter.WORKER_BOOT_ERROR)
@@ -0,0 +1,61 @@
+from django.conf import settings
+from django.db import transaction
+
+from analytics.rollups import apply_item_changes, item_state
+from catalog.models import ItemCategory
+from ewaste_api.fields import preload_instances
+from suppliers.models import Supplier
+
+from .models import EWasteItem
+from .serializers import EWasteItemBulkSerializer
+
+
+def build_bulk_context(rows, context=None):
+    """Preload every category and supplier referenced by ``rows`` (one query each)."""
+    mappings = [row for row in rows if isinstance(row, dict)]
+    bulk_context = dict(context or {})
+    bulk_context["categories"] = preload_instances(
+        ItemCategory, (row.get("category") for row in mappings)
+    )
+    bulk_context["suppliers"] = preload_instances(
+        Supplier, (row.get("source_supplier") for row in mappings)
+    )
+    return bulk_context
+
+
+def validate_item_rows(rows, context=None):
+    """
+    Validate a batch of item payloads in one pass.
+
+    Returns ``(validated_rows, errors)`` where ``errors`` is a list of
+    ``{"index": n, "errors": {...}}`` entries for the rows that failed.
+    """
+    serializer = EWasteItemBulkSerializer(
+        data=rows, many=True, context=build_bulk_context(rows, context)
+    )
+    if serializer.is_valid():
+        return serializer.validated_data, []
+    errors = [
+        {"index": index, "errors": row_errors}
+        for index, row_errors in enumerate(serializer.errors)
+        if row_errors
+    ]
+    return [], errors
+
+
+def create_items(validated_rows, created_by=None):
+    """
+    Price a validated batch in memory and insert it with ``bulk_create``.
+
+    ``bulk_create`` sends no model signals, so the collection rollup is
+    updated here in the same transaction.
+    """
+    items = []
+    for data in validated_rows:
+        item = EWasteItem(created_by=created_by, **data)
+        item.estimated_value = item.compute_estimated_value()
+        items.append(item)
+    with transaction.atomic():
+        EWasteItem.objects.bulk_create(items, batch_size=settings.ITEMS_BULK_BATCH_SIZE)
+        apply_item_changes(added=[item_state(item) for item in items])
+    return items
@@ -0,0 +1,198 @@
+import json
+import math
+import time
+from datetime import date, timedelta
+from urllib import request as urlrequest
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.authentication import add_user_claims
+from catalog.models import ItemCategory
+from ewaste_api.middleware import QueryRecorder
+from items.models import EWasteItem
+from suppliers.models import Supplier
+from transactions.models import Transaction
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    return samples[max(math.ceil(fraction * len(samples)) - 1, 0)]
+
+
+def resolve_user(username):
+    """``username``'s user, or the first active staff user when it is ``None``."""
+    User = get_user_model()
+    if username:
+        try:
+            return User.objects.get(username=username)
+        except User.DoesNotExist:
+            raise CommandError(f"User {username!r} does not exist")
+    user = User.objects.filter(is_staff=True, is_active=True).order_by("id").first()
+    if user is None:
+        raise CommandError("No staff user found; create an admin or pass --username")
+    return user
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive every router and analytics endpoint and report p50/p95/p99 latency "
+        "and query counts"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests", type=int, default=50, help="Timed requests per endpoint"
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=3, help="Untimed requests per endpoint first"
+        )
+        parser.add_argument(
+            "--username",
+            help="User to authenticate as (default: the first active staff user)",
+        )
+        parser.add_argument(
+            "--base-url",
+            help="Benchmark a running server over HTTP instead of the in-process test client",
+        )
+        parser.add_argument(
+            "--cold",
+            action="store_true",
+            help="Clear the cache before every request (in-process mode only)",
+        )
+        parser.add_argument("--only", nargs="*", help="Only run endpoints with these names")
+        parser.add_argument("--output", help="Write the JSON report to this file")
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1 or options["warmup"] < 0:
+            raise CommandError("--requests must be positive and --warmup not negative")
+        user = resolve_user(options["username"])
+        if options["base_url"]:
+            send = self.http_sender(options["base_url"].rstrip("/"), user)
+        else:
+            send = self.client_sender(user, options["cold"])
+
+        endpoints = self.endpoints()
+        if options["only"]:
+            endpoints = [endpoint for endpoint in endpoints if endpoint[0] in options["only"]]
+        results = []
+        for name, path in endpoints:
+            for _ in range(options["warmup"]):
+                send(path)
+            timings, queries, statuses = [], [], set()
+            for _ in range(options["requests"]):
+                status, elapsed, query_count = send(path)
+                timings.append(elapsed * 1000)
+                statuses.add(status)
+                if query_count is not None:
+                    queries.append(query_count)
+            timings.sort()
+            results.append(
+                {
+                    "name": name,
+                    "path": path,
+                    "status": sorted(statuses),
+                    "p50_ms": round(percentile(timings, 0.50), 3),
+                    "p95_ms": round(percentile(timings, 0.95), 3),
+                    "p99_ms": round(percentile(timings, 0.99), 3),
+                    "mean_ms": round(sum(timings) / len(timings), 3),
+                    "queries": max(queries) if queries else None,
+                }
+            )
+            self.stdout.write(
+                f"{name:<28} p50 {results[-1]['p50_ms']:>9.2f}ms  p95 {results[-1]['p95_ms']:>9.2f}ms  "
+                f"p99 {results[-1]['p99_ms']:>9.2f}ms  queries {results[-1]['queries']}"
+            )
+
+        report = {
+            "generated_at": timezone.now().isoformat(),
+            "mode": "http" if options["base_url"] else "client",
+            "base_url": options["base_url"],
+            "requests": options["requests"],
+            "cold_cache": options["cold"],
+            "dataset": {
+                "items": EWasteItem.objects.count(),
+                "transactions": Transaction.objects.count(),
+                "suppliers": Supplier.objects.count(),
+                "categories": ItemCategory.objects.count(),
+            },
+            "endpoints": results,
+        }
+        if options["output"]:
+            with open(options["output"], "w") as handle:
+                json.dump(report, handle, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
+
+    def endpoints(self):
+        """``(name, path)`` for every list, detail and custom route plus analytics."""
+        from ewaste_api.urls import router
+
+        month_ago = (date.today() - timedelta(days=30)).isoformat()
+        endpoints = []
+        for prefix, viewset, basename in router.registry:
+            model = viewset.queryset.model
+            endpoints.append((f"{basename}-list", f"/{prefix}/"))
+            first = model.objects.order_by("id").values_list("id", flat=True).first()
+            if first is not None:
+                endpoints.append((f"{basename}-detail", f"/{prefix}/{first}/"))
+            if hasattr(viewset, "export"):
+                endpoints.append(
+                    (f"{basename}-export", f"/{prefix}/export/?format=ndjson&date_from={month_ago}")
+                )
+            if hasattr(viewset, "estimate_price") and first is not None:
+                endpoints.append((f"{basename}-estimate", f"/{prefix}/{first}/estimate_price/"))
+        return endpoints + [
+            ("analytics-today", "/analytics/today/"),
+            ("analytics-monthly", "/analytics/monthly/"),
+            ("analytics-summary", "/analytics/summary/"),
+            ("analytics-suppliers", "/analytics/supplier-ranking/"),
+            ("analytics-suppliers-window", f"/analytics/supplier-ranking/?date_from={month_ago}"),
+            ("analytics-async-dashboard", "/analytics/async/dashboard/"),
+        ]
+
+    def client_sender(self, user, cold):
+        hosts = [host.lstrip(".") for host in settings.ALLOWED_HOSTS if host != "*"]
+        client = APIClient(HTTP_HOST=hosts[0] if hosts else "localhost")
+        client.force_authenticate(user)
+
+        def send(path):
+            if cold:
+                cache.clear()
+            recorder = QueryRecorder()
+            started = time.perf_counter()
+            with recorder.capture():
+                response = client.get(path)
+                if response.streaming:
+                    b"".join(response.streaming_content)
+            return response.status_code, time.perf_counter() - started, recorder.count
+
+        return send
+
+    def http_sender(self, base_url, user):
+        if urlsplit(base_url).scheme not in ("http", "https"):
+            raise CommandError("--base-url must be an http(s) URL")
+        token = add_user_claims(AccessToken.for_user(user), user)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        def send(path):
+            started = time.perf_counter()
+            try:
+                with urlrequest.urlopen(urlrequest.Request(base_url + path, headers=headers)) as response:
+                    response.read()
+                    status, timing = response.status, response.headers.get("Server-Timing", "")
+            except HTTPError as exc:
+                status, timing = exc.code, exc.headers.get("Server-Timing", "")
+            elapsed = time.perf_counter() - started
+            queries = None
+            if 'desc="' in timing:
+                queries = int(timing.split('desc="', 1)[1].split(" ", 1)[0])
+            return status, elapsed, queries
+
+        return send
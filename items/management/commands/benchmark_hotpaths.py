@@ -0,0 +1,105 @@
+import json
+import platform
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import (
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+from django.utils import timezone
+
+from ewaste_api.benchmarks import calibrate, compare, run_benchmarks
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark serializers, pricing and analytics queries at several table sizes "
+        "in a throwaway test database and compare against a baseline JSON"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="10000,100000",
+            help="Comma-separated item counts to benchmark at (e.g. 10000,100000,1000000)",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per benchmark; best counts")
+        parser.add_argument(
+            "--baseline",
+            default="benchmarks/baseline.json",
+            help="Baseline JSON to compare with or write",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.25,
+            help="Fail when a benchmark is this fraction worse than the baseline",
+        )
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="Write the results to --baseline instead of comparing",
+        )
+        parser.add_argument("--output", help="Also write the results to this file")
+        parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed")
+
+    def handle(self, *args, **options):
+        try:
+            sizes = sorted({int(size) for size in options["sizes"].split(",") if size.strip()})
+        except ValueError:
+            raise CommandError("--sizes must be comma-separated integers")
+        if not sizes or sizes[0] < 1 or options["repeat"] < 1:
+            raise CommandError("--sizes and --repeat must be positive")
+
+        calibration = calibrate(options["repeat"])
+        setup_test_environment(debug=False)
+        old_config = setup_databases(verbosity=0, interactive=False, aliases={"default"})
+        try:
+            results = run_benchmarks(
+                sizes, repeat=options["repeat"], seed=options["seed"], progress=self.report
+            )
+        finally:
+            teardown_databases(old_config, verbosity=0)
+            teardown_test_environment()
+        calibration = min(calibration, calibrate(options["repeat"]))
+
+        document = {
+            "generated_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "calibration_ms": calibration,
+            "results": results,
+        }
+        if options["output"]:
+            self.write(options["output"], document)
+        if options["save_baseline"]:
+            self.write(options["baseline"], document)
+            return
+
+        try:
+            with open(options["baseline"]) as handle:
+                baseline = json.load(handle)
+        except FileNotFoundError:
+            self.stdout.write(f"No baseline at {options['baseline']}; run with --save-baseline")
+            return
+        speed = calibration / baseline.get("calibration_ms", calibration)
+        self.stdout.write(f"Machine speed relative to the baseline: {1 / speed:.2f}x")
+        regressions = compare(results, baseline["results"], options["threshold"], speed)
+        for name, before, after, change in regressions:
+            self.stderr.write(f"{name}: {before} -> {after} ({change:+.1%})")
+        if regressions:
+            raise CommandError(
+                f"{len(regressions)} benchmark(s) regressed more than {options['threshold']:.0%}"
+            )
+        self.stdout.write(self.style.SUCCESS("No regressions against the baseline"))
+
+    def report(self, name, result):
+        self.stdout.write(f"{name:<48} {result['value']:>14,.3f} {result['unit']}")
+
+    def write(self, path, document):
+        with open(path, "w") as handle:
+            json.dump(document, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        self.stdout.write(self.style.SUCCESS(f"Wrote {path}"))
@@ -0,0 +1,132 @@
+import json
+import threading
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.authentication import add_user_claims
+
+from .benchmark_endpoints import resolve_user
+from .benchmark_server import PROFILES, drive, gunicorn_server
+
+# Set through PGAPPNAME so only the benchmarked server's connections are counted.
+APPLICATION_NAME = "ewaste-benchmark-pool"
+
+# Persistent per-thread connections (CONN_MAX_AGE) against the psycopg_pool mode.
+MODES = {"persistent": "false", "pooled": "true"}
+
+
+class ConnectionSampler(threading.Thread):
+    """Polls ``pg_stat_activity`` for the server's connections and keeps the peak."""
+
+    def __init__(self, interval=0.1):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = 0
+        self.stopped = threading.Event()
+
+    def count(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*) FROM pg_stat_activity "
+                "WHERE datname = current_database() AND application_name = %s",
+                [APPLICATION_NAME],
+            )
+            return cursor.fetchone()[0]
+
+    def run(self):
+        try:
+            while not self.stopped.wait(self.interval):
+                self.peak = max(self.peak, self.count())
+        finally:
+            connection.close()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        return self.peak
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare requests/s and Postgres connection counts of persistent and pooled "
+        "connections under gunicorn at several worker counts"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", default="1,2,4", help="Comma list of worker counts")
+        parser.add_argument("--threads", type=int, default=4, help="gthread threads per worker")
+        parser.add_argument(
+            "--modes",
+            default=",".join(MODES),
+            help=f"Comma list of modes to run ({', '.join(MODES)})",
+        )
+        parser.add_argument("--path", default="/items/", help="Path to request")
+        parser.add_argument("--concurrency", type=int, default=32, help="Client threads")
+        parser.add_argument("--duration", type=float, default=5, help="Timed seconds per run")
+        parser.add_argument("--warmup", type=float, default=1, help="Untimed seconds per run first")
+        parser.add_argument(
+            "--username",
+            help="User to authenticate as (default: the first active staff user)",
+        )
+        parser.add_argument("--output", help="Write the JSON report to this file")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("Point DATABASE_URL at a Postgres database to benchmark pooling")
+        try:
+            worker_counts = sorted({int(count) for count in options["workers"].split(",")})
+        except ValueError:
+            raise CommandError("--workers must be a comma list of integers")
+        modes = [name.strip() for name in options["modes"].split(",") if name.strip()]
+        unknown = set(modes) - set(MODES)
+        if unknown:
+            raise CommandError(f"Unknown modes: {', '.join(sorted(unknown))}")
+        if not worker_counts or worker_counts[0] < 1 or options["threads"] < 1:
+            raise CommandError("--workers and --threads must be positive")
+        user = resolve_user(options["username"])
+        token = add_user_claims(AccessToken.for_user(user), user)
+        headers = {"Authorization": f"Bearer {token}"}
+        connections.close_all()
+
+        results = {}
+        for mode in modes:
+            results[mode] = []
+            for workers in worker_counts:
+                env = {
+                    "WEB_CONCURRENCY": str(workers),
+                    "GUNICORN_WORKER_CLASS": "gthread",
+                    "GUNICORN_THREADS": str(options["threads"]),
+                    # gthread drops queued connections when a worker recycles.
+                    "GUNICORN_MAX_REQUESTS": "0",
+                    "DATABASE_POOL": MODES[mode],
+                    "PGAPPNAME": APPLICATION_NAME,
+                }
+                with gunicorn_server(PROFILES["tuned"], options["path"], headers, env) as url:
+                    if options["warmup"]:
+                        drive(url, headers, options["concurrency"], options["warmup"])
+                    sampler = ConnectionSampler()
+                    sampler.start()
+                    result = drive(url, headers, options["concurrency"], options["duration"])
+                    result.update(workers=workers, peak_connections=sampler.stop())
+                results[mode].append(result)
+                self.stdout.write(
+                    f"{mode:<10} {workers:>2} workers  {result['requests_per_second']:>8.1f} req/s  "
+                    f"p95 {result['p95_ms']}ms  connections {result['peak_connections']}  "
+                    f"errors {result['errors']}"
+                )
+
+        report = {
+            "generated_at": timezone.now().isoformat(),
+            "path": options["path"],
+            "threads": options["threads"],
+            "concurrency": options["concurrency"],
+            "duration": options["duration"],
+            "modes": results,
+        }
+        if options["output"]:
+            with open(options["output"], "w") as handle:
+                json.dump(report, handle, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
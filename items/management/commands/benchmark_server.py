@@ -0,0 +1,224 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from urllib import request as urlrequest
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.authentication import add_user_claims
+from items.models import EWasteItem
+
+from .benchmark_endpoints import percentile, resolve_user
+
+# ``None`` runs gunicorn with an empty config file, i.e. its own defaults
+# (one sync worker, no preload, no recycling), which is what the Procfile
+# used to start.
+PROFILES = {
+    "default": None,
+    "tuned": os.path.join(settings.BASE_DIR, "gunicorn.conf.py"),
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def drive(url, headers, concurrency, duration):
+    """
+    Send GET requests to ``url`` from ``concurrency`` threads for ``duration`` seconds.
+
+    Every request opens a new connection, as gunicorn's sync worker does not
+    keep connections alive. Returns request and error counts, throughput and
+    latency percentiles in ms.
+    """
+    deadline = time.perf_counter() + duration
+    timings, errors, lock = [], [0], threading.Lock()
+
+    def run():
+        local_timings, local_errors = [], 0
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                with urlrequest.urlopen(urlrequest.Request(url, headers=headers), timeout=30) as response:
+                    response.read()
+            except (HTTPError, URLError, OSError):
+                local_errors += 1
+                continue
+            local_timings.append((time.perf_counter() - started) * 1000)
+        with lock:
+            timings.extend(local_timings)
+            errors[0] += local_errors
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=run) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    timings.sort()
+    return {
+        "requests": len(timings),
+        "errors": errors[0],
+        "requests_per_second": round(len(timings) / elapsed, 1),
+        "p50_ms": round(percentile(timings, 0.50), 3) if timings else None,
+        "p95_ms": round(percentile(timings, 0.95), 3) if timings else None,
+        "p99_ms": round(percentile(timings, 0.99), 3) if timings else None,
+    }
+
+
+@contextmanager
+def gunicorn_server(config, path, headers, env=None):
+    """
+    Run gunicorn with ``config`` (``None`` for its defaults) on a free local port.
+
+    Yields the URL of ``path`` once it answers; ``env`` is added to this
+    process's environment for the server. Unless ``CACHE_BACKEND`` is set,
+    the workers share a file cache in a temporary directory, since
+    gunicorn.conf.py refuses to start several workers on a process-local one.
+    """
+    url = f"http://127.0.0.1:{free_port()}{path}"
+    with tempfile.TemporaryDirectory() as directory:
+        if config is None:
+            config = os.path.join(directory, "empty.conf.py")
+            open(config, "w").close()
+        if "CACHE_BACKEND" not in os.environ:
+            env = {
+                "CACHE_BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "CACHE_LOCATION": os.path.join(directory, "cache"),
+                **(env or {}),
+            }
+        log_path = os.path.join(directory, "gunicorn.log")
+        with open(log_path, "w") as log:
+            server = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "gunicorn",
+                    "ewaste_api.wsgi:application",
+                    "-c",
+                    config,
+                    "-b",
+                    urlsplit(url).netloc,
+                ],
+                cwd=settings.BASE_DIR,
+                env={**os.environ, **(env or {})},
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
+            try:
+                wait_until_ready(server, url, headers, log_path)
+                yield url
+            finally:
+                server.terminate()
+                try:
+                    server.wait(timeout=30)
+                except subprocess.TimeoutExpired:
+                    server.kill()
+                    server.wait()
+
+
+def wait_until_ready(server, url, headers, log_path, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            with open(log_path) as log:
+                raise CommandError(f"gunicorn exited early:\n{log.read()[-2000:]}")
+        try:
+            with urlrequest.urlopen(urlrequest.Request(url, headers=headers), timeout=5):
+                return
+        except HTTPError as exc:
+            raise CommandError(f"{url} returned {exc.code}; pick a --path that returns 200")
+        except (URLError, OSError):
+            time.sleep(0.2)
+    raise CommandError(f"gunicorn did not answer {url} within {timeout}s")
+
+
+class Command(BaseCommand):
+    help = (
+        "Start gunicorn with its defaults and with gunicorn.conf.py in turn, load each "
+        "with concurrent requests and compare throughput"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--profiles",
+            default=",".join(PROFILES),
+            help=f"Comma list of profiles to run ({', '.join(PROFILES)})",
+        )
+        parser.add_argument("--path", default="/items/", help="Path to request")
+        parser.add_argument("--concurrency", type=int, default=16, help="Client threads")
+        parser.add_argument(
+            "--duration", type=float, default=10, help="Timed seconds per profile"
+        )
+        parser.add_argument(
+            "--warmup", type=float, default=2, help="Untimed seconds per profile first"
+        )
+        parser.add_argument(
+            "--username",
+            help="User to authenticate as (default: the first active staff user)",
+        )
+        parser.add_argument("--output", help="Write the JSON report to this file")
+
+    def handle(self, *args, **options):
+        profiles = [name.strip() for name in options["profiles"].split(",") if name.strip()]
+        unknown = set(profiles) - set(PROFILES)
+        if unknown:
+            raise CommandError(f"Unknown profiles: {', '.join(sorted(unknown))}")
+        if options["concurrency"] < 1 or options["duration"] <= 0 or options["warmup"] < 0:
+            raise CommandError(
+                "--concurrency and --duration must be positive and --warmup not negative"
+            )
+        user = resolve_user(options["username"])
+        token = add_user_claims(AccessToken.for_user(user), user)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        results = {}
+        for name in profiles:
+            results[name] = self.run_profile(PROFILES[name], options, headers)
+            self.stdout.write(
+                f"{name:<10} {results[name]['requests_per_second']:>9.1f} req/s  "
+                f"p50 {results[name]['p50_ms']}ms  p95 {results[name]['p95_ms']}ms  "
+                f"errors {results[name]['errors']}"
+            )
+        if "default" in results and results["default"]["requests_per_second"]:
+            for name in profiles:
+                if name != "default":
+                    ratio = (
+                        results[name]["requests_per_second"]
+                        / results["default"]["requests_per_second"]
+                    )
+                    self.stdout.write(f"{name} vs default: {ratio:.2f}x throughput")
+
+        report = {
+            "generated_at": timezone.now().isoformat(),
+            "path": options["path"],
+            "concurrency": options["concurrency"],
+            "duration": options["duration"],
+            "cpu_count": os.cpu_count(),
+            "dataset": {"items": EWasteItem.objects.count()},
+            "profiles": results,
+        }
+        if options["output"]:
+            with open(options["output"], "w") as handle:
+                json.dump(report, handle, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
+
+    def run_profile(self, config, options, headers):
+        with gunicorn_server(config, options["path"], headers) as url:
+            if options["warmup"]:
+                drive(url, headers, options["concurrency"], options["warmup"])
+            return drive(url, headers, options["concurrency"], options["duration"])
@@ -0,0 +1,177 @@
+import json
+import os
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, transaction
+from django.utils import timezone
+
+from .benchmark_endpoints import percentile
+
+# Django's stock SQLite backend (rollback journal, deferred transactions and
+# Python's 5 s busy timeout) against the tuned profile from settings.
+PROFILES = {
+    "stock": ("django.db.backends.sqlite3", {}),
+    "tuned": ("ewaste_api.db.sqlite3", settings.SQLITE_OPTIONS),
+}
+
+SCHEMA = (
+    "CREATE TABLE bench_category (id INTEGER PRIMARY KEY, base_price_per_kg REAL NOT NULL)",
+    "CREATE TABLE bench_item ("
+    "id INTEGER PRIMARY KEY AUTOINCREMENT, category_id INTEGER NOT NULL, "
+    "weight_kg REAL NOT NULL, estimated_value REAL NOT NULL, created_at TEXT NOT NULL)",
+    "INSERT INTO bench_category (id, base_price_per_kg) VALUES (1, 5500)",
+)
+
+
+def register_database(alias, engine, options, name):
+    """Add ``alias`` to ``connections`` for a throwaway database file."""
+    config = {"ENGINE": engine, "NAME": name, "OPTIONS": dict(options)}
+    connections.settings[alias] = connections.configure_settings({DEFAULT_DB_ALIAS: config})[
+        DEFAULT_DB_ALIAS
+    ]
+
+
+def unregister_database(alias):
+    for connection in connections.all(initialized_only=True):
+        if connection.alias == alias:
+            connection.close()
+            del connections[alias]
+    del connections.settings[alias]
+
+
+def run_writers(alias, writers, duration):
+    """
+    Run ``writers`` threads that each record items on ``alias`` for ``duration`` seconds.
+
+    Every write is an ``atomic()`` block that reads the category price and
+    then inserts an item, the same read-then-write shape as an item create.
+    SQLite releases the GIL while it works, so the threads contend for the
+    database lock as separate worker processes would.
+    """
+    deadline = time.perf_counter() + duration
+    timings, errors, lock = [], [0], threading.Lock()
+
+    def run():
+        local_timings, local_errors = [], 0
+        connection = connections[alias]
+        try:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    with transaction.atomic(using=alias), connection.cursor() as cursor:
+                        cursor.execute("SELECT base_price_per_kg FROM bench_category WHERE id = 1")
+                        (price,) = cursor.fetchone()
+                        cursor.execute(
+                            "INSERT INTO bench_item "
+                            "(category_id, weight_kg, estimated_value, created_at) "
+                            "VALUES (1, 2.5, %s, %s)",
+                            [price * 2.5, timezone.now().isoformat()],
+                        )
+                except OperationalError:
+                    local_errors += 1
+                    continue
+                local_timings.append((time.perf_counter() - started) * 1000)
+        finally:
+            connection.close()
+            with lock:
+                timings.extend(local_timings)
+                errors[0] += local_errors
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=run) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    timings.sort()
+    return {
+        "writers": writers,
+        "commits": len(timings),
+        "errors": errors[0],
+        "commits_per_second": round(len(timings) / elapsed, 1),
+        "p95_ms": round(percentile(timings, 0.95), 3) if timings else None,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure write throughput and lock errors of Django's stock SQLite backend and "
+        "the tuned profile with a growing number of concurrent writers"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--writers",
+            default="1,2,4,8,16,32",
+            help="Comma list of concurrent writer counts",
+        )
+        parser.add_argument(
+            "--duration", type=float, default=3, help="Seconds per writer count and profile"
+        )
+        parser.add_argument(
+            "--profiles",
+            default=",".join(PROFILES),
+            help=f"Comma list of profiles to run ({', '.join(PROFILES)})",
+        )
+        parser.add_argument("--output", help="Write the JSON report to this file")
+
+    def handle(self, *args, **options):
+        try:
+            writer_counts = sorted({int(count) for count in options["writers"].split(",")})
+        except ValueError:
+            raise CommandError("--writers must be a comma list of integers")
+        profiles = [name.strip() for name in options["profiles"].split(",") if name.strip()]
+        unknown = set(profiles) - set(PROFILES)
+        if unknown:
+            raise CommandError(f"Unknown profiles: {', '.join(sorted(unknown))}")
+        if not writer_counts or writer_counts[0] < 1 or options["duration"] <= 0:
+            raise CommandError("--writers and --duration must be positive")
+
+        results = {}
+        with tempfile.TemporaryDirectory() as directory:
+            for name in profiles:
+                engine, profile_options = PROFILES[name]
+                results[name] = []
+                for writers in writer_counts:
+                    alias = f"benchmark_{name}_{writers}"
+                    register_database(
+                        alias, engine, profile_options, os.path.join(directory, f"{alias}.sqlite3")
+                    )
+                    try:
+                        with connections[alias].cursor() as cursor:
+                            for statement in SCHEMA:
+                                cursor.execute(statement)
+                        connections[alias].close()
+                        result = run_writers(alias, writers, options["duration"])
+                    finally:
+                        unregister_database(alias)
+                    results[name].append(result)
+                    self.stdout.write(
+                        f"{name:<6} {writers:>3} writers  {result['commits_per_second']:>9.1f} commits/s  "
+                        f"p95 {result['p95_ms']}ms  errors {result['errors']}"
+                    )
+
+        sustained = {
+            name: max(
+                (result["writers"] for result in runs if result["errors"] == 0), default=0
+            )
+            for name, runs in results.items()
+        }
+        for name, writers in sustained.items():
+            self.stdout.write(f"{name}: up to {writers} concurrent writers without lock errors")
+
+        report = {
+            "generated_at": timezone.now().isoformat(),
+            "duration": options["duration"],
+            "profiles": results,
+            "sustained_writers": sustained,
+        }
+        if options["output"]:
+            with open(options["output"], "w") as handle:
+                json.dump(report, handle, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
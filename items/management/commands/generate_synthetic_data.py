@@ -0,0 +1,49 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from items.synthetic import SyntheticDataGenerator
+
+
+class Command(BaseCommand):
+    help = "Bulk-generate synthetic users, suppliers, items and transactions for load testing"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=100000, help="E-waste items to create")
+        parser.add_argument(
+            "--transactions", type=int, default=20000, help="Transactions to create"
+        )
+        parser.add_argument("--suppliers", type=int, default=500, help="Suppliers to create")
+        parser.add_argument("--users", type=int, default=50, help="Collector accounts to create")
+        parser.add_argument(
+            "--categories",
+            type=int,
+            default=10,
+            help="Make sure at least this many categories exist",
+        )
+        parser.add_argument(
+            "--years", type=float, default=5, help="History spread back from today"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=5000, help="Rows per bulk insert"
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed")
+
+    def handle(self, *args, **options):
+        counts = ("items", "transactions", "suppliers", "users", "categories")
+        if any(options[name] < 0 for name in counts) or options["batch_size"] < 1:
+            raise CommandError("Counts must not be negative and --batch-size must be positive")
+        if options["years"] <= 0:
+            raise CommandError("--years must be positive")
+        generator = SyntheticDataGenerator(
+            years=options["years"], batch_size=options["batch_size"], seed=options["seed"]
+        )
+        started = time.perf_counter()
+        summary = generator.generate(**{name: options[name] for name in counts})
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                ", ".join(f"{value} {name}" for name, value in summary.items())
+                + f" in {elapsed:.1f}s"
+            )
+        )
@@ -0,0 +1,110 @@
+from functools import partial
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from ewaste_api.imports import CSVImport, InvalidRows
+from items.bulk import create_items, validate_item_rows
+from items.serializers import EWasteItemBulkSerializer
+from transactions.bulk import create_transactions, validate_transaction_rows
+from transactions.serializers import TransactionBulkSerializer
+
+MAX_REPORTED_ERRORS = 20
+
+
+class Command(BaseCommand):
+    help = "Import historical items or transactions from a CSV file in resumable chunks"
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=("items", "transactions"), help="What the file holds")
+        parser.add_argument("path", help="CSV file with a header row of API field names")
+        parser.add_argument(
+            "--chunk-size", type=int, default=5000, help="Rows validated and written per transaction"
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="JSON copy of the checkpoint (default: the CSV path plus .checkpoint)",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore an existing checkpoint and import from the first row",
+        )
+        parser.add_argument(
+            "--skip-invalid",
+            action="store_true",
+            help="Report invalid rows and import the rest instead of stopping",
+        )
+        parser.add_argument("--created-by", help="Username recorded as the items' collector")
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive")
+        if options["kind"] == "items":
+            serializer_class = EWasteItemBulkSerializer
+            validate = validate_item_rows
+            create = partial(create_items, created_by=self.resolve_user(options["created_by"]))
+        else:
+            if options["created_by"]:
+                raise CommandError("--created-by only applies to items")
+            serializer_class = TransactionBulkSerializer
+            validate = validate_transaction_rows
+            create = create_transactions
+        csv_import = CSVImport(
+            options["path"],
+            options["kind"],
+            serializer_class,
+            validate,
+            create,
+            chunk_size=options["chunk_size"],
+            checkpoint_path=options["checkpoint"],
+            skip_invalid=options["skip_invalid"],
+        )
+        if options["restart"]:
+            csv_import.reset()
+
+        progress = None
+        try:
+            for progress in csv_import.run():
+                for error in progress["errors"]:
+                    self.stderr.write(f"Skipped line {error['line']}: {error['errors']}")
+                self.stdout.write(
+                    f"{progress['rows']} rows read, {progress['created']} created, "
+                    f"{progress['rejected']} skipped, {progress['rate']:.0f} rows/s"
+                )
+        except FileNotFoundError as exc:
+            raise CommandError(f"{exc.filename} does not exist")
+        except InvalidRows as exc:
+            for error in exc.errors[:MAX_REPORTED_ERRORS]:
+                self.stderr.write(f"Line {error['line']}: {error['errors']}")
+            raise CommandError(
+                f"{len(exc.errors)} invalid rows in the chunk after row "
+                f"{self.rows_done(progress, csv_import)}; nothing from that chunk was written. "
+                "Fix the file and rerun to resume, or pass --skip-invalid."
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        if progress is None:
+            self.stdout.write(f"No new rows in {csv_import.path}")
+            return
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {progress['created']} {options['kind']} from {progress['rows']} rows "
+                f"({progress['rejected']} skipped); checkpoint at {csv_import.checkpoint_path}"
+            )
+        )
+
+    def rows_done(self, progress, csv_import):
+        if progress is not None:
+            return progress["rows"]
+        return csv_import.load_checkpoint()["rows"]
+
+    def resolve_user(self, username):
+        if not username:
+            return None
+        User = get_user_model()
+        try:
+            return User.objects.get(username=username)
+        except User.DoesNotExist:
+            raise CommandError(f"User {username!r} does not exist")
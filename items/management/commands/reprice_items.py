@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from catalog.models import ItemCategory
+from items.pricing import reprice_category
+
+
+class Command(BaseCommand):
+    help = "Recompute estimated_value for existing items from current category prices"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "categories",
+            nargs="*",
+            help="Category ids or names to reprice (default: all categories)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the value delta without writing anything",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Number of item ids updated per transaction",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive")
+        categories = self.resolve_categories(options["categories"])
+        for category in categories:
+            try:
+                summary = reprice_category(
+                    category, chunk_size=options["chunk_size"], dry_run=options["dry_run"]
+                )
+            except ValueError as exc:
+                raise CommandError(f"{category.name}: {exc}")
+            verb = "Would reprice" if options["dry_run"] else "Repriced"
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{verb} {category.name}: {summary['changed']}/{summary['items']} items changed, "
+                    f"value delta {summary['value_delta']} in {summary['chunks']} chunks"
+                )
+            )
+
+    def resolve_categories(self, identifiers):
+        if not identifiers:
+            return list(ItemCategory.objects.all())
+        categories = []
+        for identifier in identifiers:
+            lookup = {"pk": identifier} if identifier.isdigit() else {"name": identifier}
+            try:
+                categories.append(ItemCategory.objects.get(**lookup))
+            except ItemCategory.DoesNotExist:
+                raise CommandError(f"Category {identifier!r} does not exist")
+        return categories
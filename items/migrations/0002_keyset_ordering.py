@@ -0,0 +1,21 @@
+# Generated by Django 4.2.10 on 2026-10-18 11:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='ewasteitem',
+            options={'ordering': ['-date_collected', '-created_at', 'id']},
+        ),
+        migrations.AddIndex(
+            model_name='ewasteitem',
+            index=models.Index(fields=['-date_collected', '-created_at', 'id'], name='items_ewast_date_co_ef0eef_idx'),
+        ),
+    ]
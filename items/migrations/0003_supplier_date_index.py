@@ -0,0 +1,17 @@
+# Generated by Django 4.2.10 on 2026-10-18 12:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0002_keyset_ordering'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ewasteitem',
+            index=models.Index(fields=['source_supplier', '-date_collected'], name='items_ewast_source__3a4471_idx'),
+        ),
+    ]
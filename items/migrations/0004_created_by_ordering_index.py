@@ -0,0 +1,21 @@
+# Generated by Django 4.2.10 on 2026-10-18 12:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0003_supplier_date_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='ewasteitem',
+            name='items_ewast_created_23c503_idx',
+        ),
+        migrations.AddIndex(
+            model_name='ewasteitem',
+            index=models.Index(fields=['created_by', '-date_collected', '-created_at', 'id'], name='items_ewast_created_9a8acd_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.10 on 2026-10-18 13:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0004_created_by_ordering_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='ewasteitem',
+            name='items_ewast_categor_c2b1d7_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='ewasteitem',
+            name='items_ewast_source__b0286d_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='ewasteitem',
+            name='items_ewast_source__3a4471_idx',
+        ),
+        migrations.AddIndex(
+            model_name='ewasteitem',
+            index=models.Index(fields=['category', '-date_collected', '-created_at', 'id'], name='items_ewast_categor_734e8c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ewasteitem',
+            index=models.Index(fields=['condition', '-date_collected', '-created_at', 'id'], name='items_ewast_conditi_a8008c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ewasteitem',
+            index=models.Index(fields=['source_supplier', '-date_collected', '-created_at', 'id'], name='items_ewast_source__c92463_idx'),
+        ),
+    ]
@@ -1,9 +1,10 @@
 from decimal import Decimal
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 
 from catalog.models import ItemCategory
+from catalog.prices import get_base_price
 from suppliers.models import Supplier
 
 
@@ -43,12 +44,14 @@ class EWasteItem(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        ordering = ["-date_collected", "-created_at"]
+        ordering = ["-date_collected", "-created_at", "id"]
         indexes = [
-            models.Index(fields=["category"]),
+            models.Index(fields=["-date_collected", "-created_at", "id"]),
+            models.Index(fields=["category", "-date_collected", "-created_at", "id"]),
+            models.Index(fields=["condition", "-date_collected", "-created_at", "id"]),
             models.Index(fields=["date_collected"]),
-            models.Index(fields=["created_by"]),
-            models.Index(fields=["source_supplier"]),
+            models.Index(fields=["created_by", "-date_collected", "-created_at", "id"]),
+            models.Index(fields=["source_supplier", "-date_collected", "-created_at", "id"]),
         ]
         constraints = [
             models.CheckConstraint(
@@ -59,15 +62,42 @@ class EWasteItem(models.Model):
 
     def compute_estimated_value(self):
         multiplier = self.CONDITION_MULTIPLIERS.get(self.condition, Decimal("1"))
-        base_price = self.category.base_price_per_kg
+        base_price = get_base_price(self.category_id)
         estimated = Decimal(base_price) * Decimal(self.weight_kg) * multiplier
         return estimated.quantize(Decimal("0.01"))
 
     def save(self, *args, **kwargs):
         if self.category_id and self.weight_kg and self.condition:
             self.estimated_value = self.compute_estimated_value()
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
     def __str__(self):
         item_id = self.id or "unsaved"
         return f"#{item_id} | {self.category.name} ({self.weight_kg} kg)"
+
+
+class ImportCheckpoint(models.Model):
+    """
+    Progress of an ``import_history`` run over one CSV file.
+
+    Updated in the same transaction as each chunk's rows, so ``rows`` always
+    counts exactly the data rows that were written or rejected.
+    """
+
+    source = models.CharField(max_length=1024)
+    kind = models.CharField(max_length=20)
+    rows = models.PositiveBigIntegerField(default=0)
+    created = models.PositiveBigIntegerField(default=0)
+    rejected = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "kind"], name="import_checkpoint_unique_source"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.kind} from {self.source}: {self.rows} rows"
@@ -0,0 +1,159 @@
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import (
+    BigIntegerField,
+    Case,
+    Count,
+    DecimalField,
+    ExpressionWrapper,
+    F,
+    Max,
+    Min,
+    Q,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Round
+from django.db.models.lookups import Exact, GreaterThan
+
+from analytics.rollups import apply_value_changes
+
+from .models import EWasteItem
+
+WEIGHT_SCALE = 1000
+MAX_SQL_INTEGER = 2**63 - 1
+
+
+def _integer(expression):
+    return ExpressionWrapper(expression, output_field=BigIntegerField())
+
+
+def _scaled(field_name, scale):
+    return Cast(Round(F(field_name) * Value(scale)), BigIntegerField())
+
+
+def _price_factors(base_price):
+    """
+    Return ``({condition: factor}, default_factor, scale)`` where each factor is
+    ``base_price * multiplier * scale`` as an exact integer.
+    """
+    base_price = Decimal(base_price)
+    factors = {
+        condition: base_price * multiplier
+        for condition, multiplier in EWasteItem.CONDITION_MULTIPLIERS.items()
+    }
+    default = base_price * Decimal("1")
+    places = max(-factor.as_tuple().exponent for factor in [default, *factors.values()])
+    scale = 10 ** max(places, 0)
+    return (
+        {condition: int(factor * scale) for condition, factor in factors.items()},
+        int(default * scale),
+        scale,
+    )
+
+
+def repriced_cents_expression(base_price):
+    """
+    SQL expression for ``compute_estimated_value()`` in integer cents.
+
+    Works entirely in scaled integers so the result is exact on every backend:
+    ``weight * 1000 * (base_price * multiplier * scale)`` is the value in units of
+    ``1 / (1000 * scale)``, which is then rounded half-to-even to cents exactly
+    like ``Decimal.quantize`` under the default context.
+    """
+    factors, default, scale = _price_factors(base_price)
+    factor = Case(
+        *(When(Q(condition=condition), then=Value(value)) for condition, value in factors.items()),
+        default=Value(default),
+        output_field=BigIntegerField(),
+    )
+    product = _integer(_scaled("weight_kg", WEIGHT_SCALE) * factor)
+    divisor = Value(WEIGHT_SCALE * scale // 100)
+    quotient = _integer(product / divisor)
+    twice_remainder = _integer((product - quotient * divisor) * Value(2))
+    round_up = Case(
+        When(GreaterThan(twice_remainder, divisor), then=Value(1)),
+        When(Exact(twice_remainder, divisor), then=_integer(quotient - quotient / Value(2) * Value(2))),
+        default=Value(0),
+        output_field=BigIntegerField(),
+    )
+    return _integer(quotient + round_up)
+
+
+def _check_range(queryset, base_price):
+    factors, default, _ = _price_factors(base_price)
+    largest = max([default, *factors.values()])
+    heaviest = queryset.aggregate(weight=Max("weight_kg"))["weight"]
+    if heaviest is not None and largest * int(heaviest * WEIGHT_SCALE + 1) > MAX_SQL_INTEGER:
+        raise ValueError("Category price is too large for set-based repricing.")
+
+
+def _update_rollups(chunk, category_id, new_cents, old_cents):
+    changes = (
+        chunk.order_by()
+        .annotate(new_cents=new_cents)
+        .values("date_collected", "condition", "source_supplier_id")
+        .annotate(delta_cents=Sum(F("new_cents") - old_cents))
+    )
+    apply_value_changes(
+        {
+            (row["date_collected"], category_id, row["condition"], row["source_supplier_id"]): (
+                Decimal(row["delta_cents"] or 0) / 100
+            )
+            for row in changes
+        }
+    )
+
+
+def reprice_category(category, chunk_size=5000, dry_run=False):
+    """
+    Recompute ``estimated_value`` for every item of ``category``.
+
+    Items are processed in id ranges of ``chunk_size`` with one ``UPDATE`` per
+    range, each in its own short transaction. Returns a summary including the
+    total value delta; with ``dry_run`` nothing is written.
+    """
+    items = EWasteItem.objects.filter(category_id=category.pk)
+    bounds = items.aggregate(low=Min("id"), high=Max("id"))
+    new_cents = repriced_cents_expression(category.base_price_per_kg)
+    summary = {
+        "category": category.pk,
+        "base_price_per_kg": category.base_price_per_kg,
+        "items": 0,
+        "changed": 0,
+        "value_delta": Decimal("0.00"),
+        "chunks": 0,
+        "dry_run": dry_run,
+    }
+    if bounds["low"] is None:
+        return summary
+    _check_range(items, category.base_price_per_kg)
+
+    old_cents = _scaled("estimated_value", 100)
+    delta_cents = 0
+    for start in range(bounds["low"], bounds["high"] + 1, chunk_size):
+        chunk = items.filter(id__gte=start, id__lt=start + chunk_size)
+        with transaction.atomic():
+            totals = chunk.annotate(new_cents=new_cents).aggregate(
+                matched=Count("id"),
+                changed=Count("id", filter=~Q(new_cents=old_cents)),
+                delta=Sum(F("new_cents") - old_cents),
+            )
+            if not totals["matched"]:
+                continue
+            if not dry_run and totals["changed"]:
+                _update_rollups(chunk, category.pk, new_cents, old_cents)
+                chunk.update(
+                    estimated_value=ExpressionWrapper(
+                        new_cents * Value(Decimal("0.01")),
+                        output_field=DecimalField(max_digits=12, decimal_places=2),
+                    )
+                )
+        summary["chunks"] += 1
+        summary["items"] += totals["matched"]
+        summary["changed"] += totals["changed"]
+        delta_cents += totals["delta"] or 0
+    summary["value_delta"] = (Decimal(delta_cents) / 100).quantize(Decimal("0.01"))
+    return summary
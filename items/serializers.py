@@ -2,6 +2,7 @@ from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
 from catalog.models import ItemCategory
+from ewaste_api.fields import PreloadedPrimaryKeyRelatedField
 from suppliers.models import Supplier
 
 from .models import EWasteItem
@@ -35,6 +36,11 @@ class EWasteItemSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Invalid condition value.")
         return value
 
+    def validate_weight_kg(self, value):
+        if value <= 0:
+            raise serializers.ValidationError("Weight must be greater than zero.")
+        return value
+
     def validate_category(self, value):
         if not isinstance(value, ItemCategory):
             raise serializers.ValidationError("Invalid category.")
@@ -53,3 +59,12 @@ class EWasteItemSerializer(serializers.ModelSerializer):
 
     def update(self, instance, validated_data):
         return super().update(instance, validated_data)
+
+
+class EWasteItemBulkSerializer(EWasteItemSerializer):
+    category = PreloadedPrimaryKeyRelatedField(
+        "categories", queryset=ItemCategory.objects.all()
+    )
+    source_supplier = PreloadedPrimaryKeyRelatedField(
+        "suppliers", queryset=Supplier.objects.all(), allow_null=True, required=False
+    )
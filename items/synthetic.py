@@ -0,0 +1,190 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import accumulate
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from analytics.rollups import rebuild_rollups
+from catalog.models import ItemCategory
+from suppliers.models import Supplier
+from transactions.models import Transaction
+
+from .models import EWasteItem
+
+CATEGORY_PRICES = {
+    "Motherboards": 5500,
+    "RAM": 7500,
+    "Phone Boards": 7500,
+    "Hard Drives": 3200,
+    "Power Supplies": 1800,
+    "Laptop Boards": 6200,
+    "Graphics Cards": 8800,
+    "Network Cards": 2600,
+    "Processors": 12000,
+    "Cables": 900,
+}
+LOCATIONS = ["Nairobi", "Mombasa", "Kisumu", "Nakuru", "Eldoret", "Thika", "Machakos", "Nyeri"]
+CONDITION_WEIGHTS = {
+    EWasteItem.ConditionChoices.POOR: 5,
+    EWasteItem.ConditionChoices.FAIR: 3,
+    EWasteItem.ConditionChoices.GOOD: 2,
+}
+USERNAME_PREFIX = "synthetic-collector-"
+
+
+def zipf_weights(count, exponent=1.1):
+    """Cumulative weights where rank ``k`` is ``1 / k**exponent`` as likely as rank 1."""
+    return list(accumulate(1 / rank**exponent for rank in range(1, count + 1)))
+
+
+class SyntheticDataGenerator:
+    """
+    Bulk-generate users, suppliers, items and transactions with production-like skew.
+
+    Suppliers, collectors, categories and buyers are drawn from Zipf-like
+    distributions, collection volume grows towards the present over ``years``,
+    and a share of items has no supplier. Rows are written with batched
+    ``bulk_create``; the daily rollup and supplier totals are rebuilt at the
+    end because bulk inserts bypass the item signals.
+    """
+
+    def __init__(self, years=5, batch_size=5000, seed=0, today=None):
+        self.years = years
+        self.batch_size = batch_size
+        self.random = random.Random(seed)
+        self.today = today or date.today()
+        self.days = max(int(365.25 * years), 1)
+
+    def categories(self, count):
+        categories = list(ItemCategory.objects.order_by("id"))
+        existing = {category.name for category in categories}
+        missing = [name for name in CATEGORY_PRICES if name not in existing]
+        for index in range(len(categories), count):
+            name = missing.pop(0) if missing else f"Synthetic Category {index + 1}"
+            price = CATEGORY_PRICES.get(name) or self.random.randrange(500, 15000, 100)
+            categories.append(ItemCategory.objects.create(name=name, base_price_per_kg=price))
+        return categories[: max(count, 1)]
+
+    def users(self, count):
+        User = get_user_model()
+        start = User.objects.filter(username__startswith=USERNAME_PREFIX).count()
+        new_users = []
+        for index in range(start, start + count):
+            user = User(username=f"{USERNAME_PREFIX}{index + 1}", role=User.RoleChoices.COLLECTOR)
+            user.set_unusable_password()
+            new_users.append(user)
+        User.objects.bulk_create(new_users, batch_size=self.batch_size)
+        return list(User.objects.filter(username__startswith=USERNAME_PREFIX).order_by("id"))
+
+    def suppliers(self, count):
+        start = Supplier.objects.count()
+        Supplier.objects.bulk_create(
+            (
+                Supplier(
+                    supplier_name=f"Supplier {index + 1}",
+                    contact=f"07{self.random.randrange(10**8):08d}",
+                    location=self.random.choice(LOCATIONS),
+                )
+                for index in range(start, start + count)
+            ),
+            batch_size=self.batch_size,
+        )
+        return list(Supplier.objects.order_by("id"))
+
+    def collection_date(self):
+        # Volume grows roughly linearly towards today.
+        return self.today - timedelta(days=int(self.days * (1 - self.random.random() ** 0.5)))
+
+    def _batches(self, rows):
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def items(self, count, categories, suppliers, users):
+        category_weights = zipf_weights(len(categories), 0.8)
+        supplier_weights = zipf_weights(len(suppliers)) if suppliers else None
+        user_weights = zipf_weights(len(users), 0.7) if users else None
+        prices = {category.id: Decimal(category.base_price_per_kg) for category in categories}
+        conditions = list(CONDITION_WEIGHTS)
+        condition_weights = list(accumulate(CONDITION_WEIGHTS.values()))
+
+        def rows():
+            for _ in range(count):
+                category = self.random.choices(categories, cum_weights=category_weights)[0]
+                condition = self.random.choices(conditions, cum_weights=condition_weights)[0]
+                weight = Decimal(f"{min(self.random.lognormvariate(0, 1.0), 500) + 0.05:.3f}")
+                supplier = None
+                if suppliers and self.random.random() > 0.1:
+                    supplier = self.random.choices(suppliers, cum_weights=supplier_weights)[0]
+                yield EWasteItem(
+                    category=category,
+                    weight_kg=weight,
+                    condition=condition,
+                    source_supplier=supplier,
+                    date_collected=self.collection_date(),
+                    estimated_value=(
+                        prices[category.id] * weight * EWasteItem.CONDITION_MULTIPLIERS[condition]
+                    ).quantize(Decimal("0.01")),
+                    created_by=(
+                        self.random.choices(users, cum_weights=user_weights)[0] if users else None
+                    ),
+                )
+
+        created = 0
+        for batch in self._batches(rows()):
+            with transaction.atomic():
+                created += len(EWasteItem.objects.bulk_create(batch))
+        return created
+
+    def transactions(self, count, categories):
+        category_weights = zipf_weights(len(categories), 0.8)
+        buyers = [f"Buyer {index + 1}" for index in range(max(count // 200, 10))]
+        buyer_weights = zipf_weights(len(buyers))
+
+        def rows():
+            for _ in range(count):
+                category = self.random.choices(categories, cum_weights=category_weights)[0]
+                weight = Decimal(f"{self.random.uniform(1, 250):.3f}")
+                sold = self.random.random() < 0.7
+                yield Transaction(
+                    category=category,
+                    weight_kg=weight,
+                    sale_price=(
+                        Decimal(category.base_price_per_kg) * weight * Decimal(
+                            f"{self.random.uniform(0.9, 1.3):.2f}"
+                        )
+                    ).quantize(Decimal("0.01")),
+                    buyer_name=self.random.choices(buyers, cum_weights=buyer_weights)[0],
+                    status=(
+                        Transaction.StatusChoices.SOLD if sold else Transaction.StatusChoices.STOCKED
+                    ),
+                    date_sold=self.collection_date() if sold else None,
+                )
+
+        created = 0
+        for batch in self._batches(rows()):
+            with transaction.atomic():
+                created += len(Transaction.objects.bulk_create(batch))
+        return created
+
+    def generate(self, users=50, suppliers=500, categories=10, items=100000, transactions=20000):
+        """Create the requested volumes and return the number of rows per table."""
+        category_rows = self.categories(categories)
+        user_rows = self.users(users)
+        supplier_rows = self.suppliers(suppliers)
+        summary = {
+            "categories": len(category_rows),
+            "users": users,
+            "suppliers": suppliers,
+            "items": self.items(items, category_rows, supplier_rows, user_rows),
+            "transactions": self.transactions(transactions, category_rows),
+        }
+        summary["rollup_rows"] = rebuild_rollups(batch_size=self.batch_size)
+        return summary
@@ -1,12 +1,69 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Sum
 from rest_framework import decorators, permissions, response, status, viewsets
+from rest_framework.settings import api_settings
+
+from ewaste_api.exports import EXPORT_RENDERERS, parse_date_range, streaming_export
+from ewaste_api.filters import (
+    DateRangeFilter,
+    ExactFilter,
+    KeysetOrderingFilter,
+    QueryFilterBackend,
+)
+from ewaste_api.pagination import CountedKeysetPagination
+from ewaste_api.serialization import ValuesListMixin
 
+from analytics.models import MonthlyCollectionRollup
+
+from .bulk import create_items, validate_item_rows
 from .models import EWasteItem
 from .serializers import EWasteItemSerializer
 
 
-class EWasteItemViewSet(viewsets.ModelViewSet):
+class EWasteItemPagination(CountedKeysetPagination):
+    ordering = ("-date_collected", "-created_at", "id")
+
+
+class EWasteItemViewSet(ValuesListMixin, viewsets.ModelViewSet):
     serializer_class = EWasteItemSerializer
+    pagination_class = EWasteItemPagination
     queryset = EWasteItem.objects.select_related("category", "source_supplier", "created_by")
+    filter_backends = [QueryFilterBackend, KeysetOrderingFilter]
+    # Each equality filter has an index led by its column and followed by
+    # the date ordering, so any filter with either ordering is one index seek.
+    query_filters = (
+        DateRangeFilter("date_collected"),
+        ExactFilter("category"),
+        ExactFilter("condition"),
+        ExactFilter("source_supplier"),
+    )
+    ordering_fields = {
+        "-date_collected": ("-date_collected", "-created_at", "id"),
+        "date_collected": ("date_collected", "created_at", "-id"),
+    }
+    # The same filters over the monthly rollup, whose item counts every write
+    # keeps current, for approximate list counts. It has no supplier column
+    # and no days, so only whole-month windows without a supplier qualify.
+    rollup_count_filters = (
+        DateRangeFilter("month"),
+        ExactFilter("category"),
+        ExactFilter("condition"),
+    )
+    export_columns = (
+        ("id", "id"),
+        ("category", "category_id"),
+        ("category_name", "category__name"),
+        ("weight_kg", "weight_kg"),
+        ("condition", "condition"),
+        ("source_supplier", "source_supplier_id"),
+        ("supplier_name", "source_supplier__supplier_name"),
+        ("date_collected", "date_collected"),
+        ("estimated_value", "estimated_value"),
+        ("created_by", "created_by_id"),
+        ("created_at", "created_at"),
+    )
 
     def get_queryset(self):
         user = self.request.user
@@ -16,6 +73,21 @@ class EWasteItemViewSet(viewsets.ModelViewSet):
             return self.queryset
         return self.queryset.filter(created_by=user)
 
+    def estimate_count(self, request):
+        # The rollup has no per-collector split, so only the full list qualifies.
+        user = request.user
+        if not (user.is_staff or getattr(user, "role", "") == "admin"):
+            return None
+        if request.query_params.get("source_supplier"):
+            return None
+        start, end = parse_date_range(request.query_params)
+        if (start and start.day != 1) or (end and (end + timedelta(days=1)).day != 1):
+            return None
+        rollups = MonthlyCollectionRollup.objects.all()
+        for query_filter in self.rollup_count_filters:
+            rollups = query_filter.filter(rollups, request.query_params)
+        return rollups.aggregate(total=Sum("item_count"))["total"] or 0
+
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
 
@@ -24,3 +96,38 @@ class EWasteItemViewSet(viewsets.ModelViewSet):
         item = self.get_object()
         estimate = item.compute_estimated_value()
         return response.Response({"estimated_value": estimate}, status=status.HTTP_200_OK)
+
+    @decorators.action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request):
+        rows = request.data
+        if isinstance(rows, dict):
+            rows = rows.get("items")
+        if not isinstance(rows, list) or not rows:
+            return response.Response(
+                {"detail": "Expected a non-empty list of items."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(rows) > settings.ITEMS_BULK_MAX_ROWS:
+            return response.Response(
+                {"detail": f"At most {settings.ITEMS_BULK_MAX_ROWS} items per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        validated_rows, errors = validate_item_rows(rows, self.get_serializer_context())
+        if errors:
+            return response.Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+        items = create_items(validated_rows, created_by=request.user)
+        return response.Response(
+            {"created": len(items), "ids": [item.id for item in items]},
+            status=status.HTTP_201_CREATED,
+        )
+
+    @decorators.action(
+        detail=False,
+        methods=["get"],
+        renderer_classes=[*api_settings.DEFAULT_RENDERER_CLASSES, *EXPORT_RENDERERS],
+    )
+    def export(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        return streaming_export(
+            queryset, self.export_columns, request.accepted_renderer.format, "items"
+        )
@@ -0,0 +1,58 @@
+# Generated by Django 4.2.10 on 2026-10-18 12:04
+
+from django.db import migrations, models
+
+
+def populate_totals(apps, schema_editor):
+    EWasteItem = apps.get_model('items', 'EWasteItem')
+    Supplier = apps.get_model('suppliers', 'Supplier')
+    db_alias = schema_editor.connection.alias
+    totals = (
+        EWasteItem.objects.using(db_alias).filter(source_supplier__isnull=False)
+        .order_by()
+        .values('source_supplier_id')
+        .annotate(
+            item_count=models.Count('id'),
+            total_weight_kg=models.Sum('weight_kg', output_field=models.DecimalField(max_digits=16, decimal_places=3)),
+            total_estimated_value=models.Sum('estimated_value', output_field=models.DecimalField(max_digits=18, decimal_places=2)),
+            last_collected=models.Max('date_collected'),
+        )
+    )
+    for row in totals.iterator():
+        Supplier.objects.using(db_alias).filter(pk=row.pop('source_supplier_id')).update(**row)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('suppliers', '0001_initial'),
+        ('items', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='supplier',
+            name='item_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='supplier',
+            name='last_collected',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='supplier',
+            name='total_estimated_value',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, max_digits=18),
+        ),
+        migrations.AddField(
+            model_name='supplier',
+            name='total_weight_kg',
+            field=models.DecimalField(decimal_places=3, default=0, editable=False, max_digits=16),
+        ),
+        migrations.AddIndex(
+            model_name='supplier',
+            index=models.Index(fields=['-total_estimated_value', 'id'], name='suppliers_s_total_e_ed646d_idx'),
+        ),
+        migrations.RunPython(populate_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.10 on 2026-10-18 12:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('suppliers', '0002_supplier_totals'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='supplier',
+            index=models.Index(fields=['supplier_name'], name='suppliers_s_supplie_60545a_idx'),
+        ),
+    ]
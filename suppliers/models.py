@@ -5,9 +5,21 @@ class Supplier(models.Model):
     supplier_name = models.CharField(max_length=200)
     contact = models.CharField(max_length=200, blank=True)
     location = models.CharField(max_length=200, blank=True)
+    item_count = models.IntegerField(default=0, editable=False)
+    total_weight_kg = models.DecimalField(
+        max_digits=16, decimal_places=3, default=0, editable=False
+    )
+    total_estimated_value = models.DecimalField(
+        max_digits=18, decimal_places=2, default=0, editable=False
+    )
+    last_collected = models.DateField(null=True, blank=True, editable=False)
 
     class Meta:
         ordering = ["supplier_name"]
+        indexes = [
+            models.Index(fields=["supplier_name"]),
+            models.Index(fields=["-total_estimated_value", "id"]),
+        ]
 
     def __str__(self):
         return self.supplier_name
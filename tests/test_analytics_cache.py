@@ -0,0 +1,86 @@
+from datetime import date
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from analytics.cache import _cache_key, _entry, data_version
+from catalog.models import ItemCategory
+from items.models import EWasteItem
+from suppliers.models import Supplier
+
+
+class AnalyticsCacheTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = get_user_model().objects.create_user(
+            username="admin", password="adminpass123", role="admin", is_staff=True
+        )
+        self.category = ItemCategory.objects.create(name="Boards", base_price_per_kg=5000)
+        self.supplier = Supplier.objects.create(supplier_name="Supplier One")
+        self.client.force_authenticate(self.admin)
+
+    def create_item(self):
+        return EWasteItem.objects.create(
+            category=self.category,
+            weight_kg="2",
+            condition=EWasteItem.ConditionChoices.GOOD,
+            source_supplier=self.supplier,
+            date_collected=date.today(),
+        )
+
+    def test_repeated_requests_are_served_from_cache(self):
+        self.create_item()
+        for name in ("analytics-today", "analytics-monthly", "analytics-suppliers"):
+            first = self.client.get(reverse(name))
+            with self.assertNumQueries(0):
+                second = self.client.get(reverse(name))
+            self.assertEqual(first.data, second.data)
+
+    def test_item_and_supplier_writes_invalidate_results(self):
+        self.create_item()
+        self.assertEqual(self.client.get(reverse("analytics-today")).data["items_collected"], 1)
+        self.create_item()
+        self.assertEqual(self.client.get(reverse("analytics-today")).data["items_collected"], 2)
+        self.supplier.supplier_name = "Renamed Supplier"
+        self.supplier.save()
+        ranking = self.client.get(reverse("analytics-suppliers")).data["ranking"]
+        self.assertEqual(ranking[0]["supplier_name"], "Renamed Supplier")
+
+    def test_stale_value_is_served_while_another_worker_recomputes(self):
+        self.create_item()
+        stale = self.client.get(reverse("analytics-monthly")).data
+        data_version.bump()
+        cache.add(f"{_cache_key('monthly', {})}:lock", True)
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("analytics-monthly"))
+        self.assertEqual(response.data, stale)
+        cache.delete(f"{_cache_key('monthly', {})}:lock")
+        with self.assertNumQueries(1):
+            self.client.get(reverse("analytics-monthly"))
+
+    def test_expired_entry_is_kept_and_served_while_another_worker_recomputes(self):
+        self.create_item()
+        key = _cache_key("monthly", {})
+        with mock.patch("analytics.cache.time.time", return_value=0):
+            stale = self.client.get(reverse("analytics-monthly")).data
+        self.assertIsNotNone(cache.get(key))
+        cache.add(f"{key}:lock", True)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(reverse("analytics-monthly")).data, stale)
+
+    def test_cold_requests_wait_for_the_lock_holder_instead_of_computing(self):
+        self.create_item()
+        key = _cache_key("monthly", {})
+        cache.add(f"{key}:lock", True)
+        result = {"monthly": []}
+
+        def other_worker_finishes(seconds):
+            cache.set(key, _entry(data_version.current(), result), timeout=None)
+
+        with mock.patch("analytics.cache.time.sleep", side_effect=other_worker_finishes):
+            with self.assertNumQueries(0):
+                response = self.client.get(reverse("analytics-monthly"))
+        self.assertEqual(response.data, result)
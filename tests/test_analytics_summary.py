@@ -0,0 +1,75 @@
+from datetime import date
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from analytics.queries import summary_windows
+from catalog.models import ItemCategory
+from items.models import EWasteItem
+
+
+class SummaryAnalyticsTestCase(APITestCase):
+    today = date(2026, 10, 14)  # a Wednesday
+
+    def setUp(self):
+        cache.clear()
+        user = get_user_model().objects.create_user(username="collector", password="pass12345")
+        self.client.force_authenticate(user)
+        category = ItemCategory.objects.create(name="Boards", base_price_per_kg=1000)
+        for collected in (
+            date(2026, 10, 14),
+            date(2026, 10, 12),
+            date(2026, 10, 1),
+            date(2026, 2, 1),
+            date(2025, 12, 31),
+            date(2026, 10, 20),
+        ):
+            EWasteItem.objects.create(
+                category=category, weight_kg="2", condition="good", date_collected=collected
+            )
+
+    def test_windows_start_on_local_calendar_boundaries(self):
+        self.assertEqual(
+            summary_windows(self.today),
+            {
+                "today": date(2026, 10, 14),
+                "week_to_date": date(2026, 10, 12),
+                "month_to_date": date(2026, 10, 1),
+                "year_to_date": date(2026, 1, 1),
+                "all_time": None,
+            },
+        )
+
+    @mock.patch("analytics.views.timezone.localdate", return_value=today)
+    def test_summary_returns_every_window_from_two_queries(self, localdate):
+        with self.assertNumQueries(2):  # this week and month's days, then the months
+            response = self.client.get(reverse("analytics-summary"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["timezone"], "Africa/Nairobi")
+        windows = response.data["windows"]
+        counts = {name: window["items_collected"] for name, window in windows.items()}
+        self.assertEqual(
+            counts,
+            {"today": 1, "week_to_date": 2, "month_to_date": 3, "year_to_date": 4, "all_time": 6},
+        )
+        self.assertEqual(windows["week_to_date"]["total_weight_kg"], 4.0)
+        self.assertEqual(windows["month_to_date"]["total_estimated_value"], 6000.0)
+        self.assertIsNone(windows["all_time"]["start"])
+
+    @mock.patch("analytics.views.timezone.localdate", return_value=date(2026, 10, 2))
+    def test_week_reaching_into_last_month_counts_its_days(self, localdate):
+        # Friday 2 October: the week started on 28 September.
+        category = ItemCategory.objects.get()
+        EWasteItem.objects.create(
+            category=category, weight_kg="1", condition="good", date_collected=date(2026, 9, 29)
+        )
+        windows = self.client.get(reverse("analytics-summary")).data["windows"]
+        counts = {name: window["items_collected"] for name, window in windows.items()}
+        self.assertEqual(
+            counts,
+            {"today": 0, "week_to_date": 2, "month_to_date": 1, "year_to_date": 3, "all_time": 7},
+        )
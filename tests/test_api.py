@@ -122,7 +122,7 @@ class EWasteAPITestCase(APITestCase):
         )
         response = self.client.get("/items/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
 
     def test_admin_can_view_all_items(self):
         EWasteItem.objects.create(
@@ -142,7 +142,7 @@ class EWasteAPITestCase(APITestCase):
         self.authenticate("admin", "adminpass123")
         response = self.client.get("/items/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data["results"]), 2)
 
     def test_supplier_item_transaction_flow(self):
         self.authenticate("collector", "collectorpass123")
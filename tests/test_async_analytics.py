@@ -0,0 +1,105 @@
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.authentication import add_user_claims
+from accounts.revocation import revocations
+from catalog.models import ItemCategory
+from items.models import EWasteItem
+from suppliers.models import Supplier
+
+
+# A revocation check falling due after the slow setUp would add a query to
+# the counted requests.
+@override_settings(SHARED_VERSION_CHECK_SECONDS=60)
+class AsyncAnalyticsTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username="viewer", password="pass12345")
+        token = add_user_claims(AccessToken.for_user(self.user), self.user)
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+        revocations.sync()
+        category = ItemCategory.objects.create(name="Boards", base_price_per_kg=1000)
+        for index in range(3):
+            supplier = Supplier.objects.create(supplier_name=f"Supplier {index}")
+            for days_ago in (0, 40):
+                EWasteItem.objects.create(
+                    category=category,
+                    source_supplier=supplier,
+                    weight_kg=str(index + 1),
+                    condition="good",
+                    date_collected=date.today() - timedelta(days=days_ago),
+                )
+
+    def test_async_views_match_their_sync_counterparts(self):
+        window = f"?date_from={(date.today() - timedelta(days=7)).isoformat()}"
+        for name, query in (
+            ("today", ""),
+            ("monthly", ""),
+            ("summary", ""),
+            ("suppliers", "?limit=2"),
+            ("suppliers", window),
+        ):
+            with self.subTest(name=name, query=query):
+                cache.clear()
+                expected = self.client.get(reverse(f"analytics-{name}") + query, **self.auth).json()
+                cache.clear()
+                response = self.client.get(reverse(f"analytics-async-{name}") + query, **self.auth)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                data = response.json()
+                if name == "suppliers":
+                    # Cursor links point at the endpoint that produced them.
+                    self.assertEqual(data.pop("next") is None, expected.pop("next") is None)
+                self.assertEqual(data, expected)
+
+    def test_async_and_sync_views_share_cached_results(self):
+        self.client.get(reverse("analytics-summary"), **self.auth)
+        with self.assertNumQueries(0):  # user claims and the summary are both cached
+            response = self.client.get(reverse("analytics-async-summary"), **self.auth)
+        self.assertEqual(response.json()["windows"]["all_time"]["items_collected"], 6)
+
+    def test_dashboard_gathers_every_section(self):
+        response = self.client.get(reverse("analytics-async-dashboard"), **self.auth)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["today"]["items_collected"], 3)
+        self.assertEqual(data["summary"]["windows"]["all_time"]["items_collected"], 6)
+        self.assertEqual(len(data["monthly"]), len({entry["month"] for entry in data["monthly"]}))
+        self.assertEqual(
+            [supplier["supplier_name"] for supplier in data["top_suppliers"]],
+            ["Supplier 2", "Supplier 1", "Supplier 0"],
+        )
+
+    def test_requires_a_valid_token(self):
+        response = self.client.get(reverse("analytics-async-today"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("detail", response.json())
+        self.assertIn("Bearer", response["WWW-Authenticate"])
+        response = self.client.get(
+            reverse("analytics-async-today"), HTTP_AUTHORIZATION="Bearer not-a-token"
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_invalid_window_is_rejected(self):
+        response = self.client.get(
+            reverse("analytics-async-suppliers") + "?date_from=2024-13-01", **self.auth
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("date_from", response.json())
+
+    @override_settings(QUERY_BUDGET_ENABLED=True)
+    async def test_runs_natively_under_the_async_client(self):
+        with self.assertLogs("ewaste_api.queries", "INFO"):
+            response = await self.async_client.get(
+                reverse("analytics-async-today"), AUTHORIZATION=self.auth["HTTP_AUTHORIZATION"]
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["items_collected"], 3)
+        # The rollup aggregate, counted across the executor hop.
+        self.assertEqual(response["Server-Timing"].split('desc="')[1], '1 queries"')
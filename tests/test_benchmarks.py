@@ -0,0 +1,54 @@
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from ewaste_api import benchmarks
+
+
+class HotPathBenchmarkTestCase(TestCase):
+    @mock.patch.object(benchmarks, "MIN_SAMPLE_SECONDS", 0.001)
+    def test_every_hot_path_is_measured_at_each_size(self):
+        results = benchmarks.run_benchmarks([60, 30], repeat=1)
+        names = {
+            "serialize_items",
+            "serialize_transactions",
+            "map_item_rows",
+            "map_transaction_rows",
+            "render_items_stdlib",
+            "render_items_orjson",
+            "render_transactions_stdlib",
+            "render_transactions_orjson",
+            "compute_estimated_value",
+            "check_token_revocation",
+            "analytics_today",
+            "analytics_monthly",
+            "analytics_summary",
+            "analytics_supplier_ranking",
+            "analytics_supplier_ranking_window",
+        }
+        self.assertEqual(set(results), {f"{name}@{size}" for name in names for size in (30, 60)})
+        self.assertEqual(results["serialize_items@60"]["unit"], "rows/s")
+        self.assertFalse(results["analytics_monthly@60"]["higher_is_better"])
+        self.assertTrue(all(result["value"] > 0 for result in results.values()))
+
+    def test_compare_flags_regressions_past_threshold(self):
+        baseline = {
+            "serialize_items@10": {"value": 1000, "unit": "rows/s", "higher_is_better": True},
+            "analytics_today@10": {"value": 2.0, "unit": "ms", "higher_is_better": False},
+        }
+        results = {
+            "serialize_items@10": {"value": 700, "unit": "rows/s", "higher_is_better": True},
+            "analytics_today@10": {"value": 2.4, "unit": "ms", "higher_is_better": False},
+            "analytics_monthly@10": {"value": 9.0, "unit": "ms", "higher_is_better": False},
+        }
+        regressions = benchmarks.compare(results, baseline, threshold=0.25)
+        self.assertEqual([name for name, *_ in regressions], ["serialize_items@10"])
+        self.assertEqual(benchmarks.compare(results, baseline, threshold=0.1)[1][0], "analytics_today@10")
+        # On a machine running at half speed the same numbers are an improvement.
+        self.assertEqual(benchmarks.compare(results, baseline, threshold=0.25, speed=2.0), [])
+
+    def test_command_rejects_bad_sizes(self):
+        with self.assertRaises(CommandError):
+            call_command("benchmark_hotpaths", sizes="ten")
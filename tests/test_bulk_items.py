@@ -0,0 +1,131 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Sum
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from analytics.models import DailyCollectionRollup
+from catalog.models import ItemCategory
+from items.models import EWasteItem
+from suppliers.models import Supplier
+
+
+class BulkItemIntakeTestCase(APITestCase):
+    def setUp(self):
+        self.User = get_user_model()
+        self.collector = self.User.objects.create_user(
+            username="collector",
+            password="collectorpass123",
+            role="collector",
+        )
+        self.boards = ItemCategory.objects.create(name="Boards", base_price_per_kg=5000)
+        self.ram = ItemCategory.objects.create(name="RAM", base_price_per_kg="7500.00")
+        self.supplier = Supplier.objects.create(supplier_name="Supplier One")
+        response = self.client.post(
+            reverse("login"),
+            {"username": "collector", "password": "collectorpass123"},
+            format="json",
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    def row(self, **overrides):
+        payload = {
+            "category": self.boards.id,
+            "weight_kg": "2.345",
+            "condition": "fair",
+            "source_supplier": self.supplier.id,
+            "date_collected": date.today().isoformat(),
+        }
+        payload.update(overrides)
+        return payload
+
+    def test_bulk_create_prices_and_stores_every_row(self):
+        rows = [
+            self.row(),
+            self.row(category=self.ram.id, condition="poor", source_supplier=None),
+            self.row(weight_kg="0.005", condition="good"),
+        ]
+        response = self.client.post("/items/bulk/", rows, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 3)
+        self.assertEqual(EWasteItem.objects.count(), 3)
+        for item in EWasteItem.objects.filter(pk__in=response.data["ids"]):
+            self.assertEqual(item.created_by, self.collector)
+            self.assertEqual(item.estimated_value, item.compute_estimated_value())
+        self.assertEqual(
+            EWasteItem.objects.get(pk=response.data["ids"][0]).estimated_value,
+            Decimal("10552.50"),
+        )
+
+    def test_bulk_create_resolves_relations_with_one_query_each(self):
+        rows = [self.row(), self.row(category=self.ram.id)] * 50
+        response = self.client.post("/items/bulk/", {"items": rows}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.client.credentials()
+        self.client.force_authenticate(self.collector)
+        # categories, suppliers, savepoint, insert, daily rollup, monthly
+        # rollup, supplier totals, release
+        with self.assertNumQueries(8):
+            self.client.post("/items/bulk/", rows, format="json")
+
+    def test_rollup_queries_do_not_grow_with_distinct_keys(self):
+        suppliers = [self.supplier] + [
+            Supplier.objects.create(supplier_name=f"Supplier {index}") for index in range(2, 6)
+        ]
+        today = date.today()
+        spread = [
+            self.row(
+                category=(self.boards, self.ram)[index % 2].id,
+                condition=("good", "fair", "poor")[index % 3],
+                source_supplier=suppliers[index % 5].id if index % 7 else None,
+                date_collected=(today - timedelta(days=index % 90)).isoformat(),
+            )
+            for index in range(120)
+        ]
+        single_key = [self.row()] * 120
+        self.client.credentials()
+        self.client.force_authenticate(self.collector)
+        self.client.post("/items/bulk/", [self.row()], format="json")  # loads the price table
+        queries = []
+        for rows in (single_key, spread):
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.post("/items/bulk/", rows, format="json")
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            queries.append(len(captured))
+        # The spread batch adds only the upsert for rows without a supplier.
+        self.assertEqual(queries, [8, 9])
+        self.assertGreater(DailyCollectionRollup.objects.count(), 100)
+        self.assertEqual(
+            DailyCollectionRollup.objects.aggregate(total=Sum("item_count"))["total"], 241
+        )
+        self.assertEqual(
+            Supplier.objects.aggregate(total=Sum("item_count"))["total"],
+            EWasteItem.objects.filter(source_supplier__isnull=False).count(),
+        )
+
+    def test_bulk_create_reports_errors_by_index_and_writes_nothing(self):
+        rows = [
+            self.row(),
+            self.row(category=999),
+            self.row(),
+            self.row(condition="shiny", weight_kg="-1"),
+        ]
+        response = self.client.post("/items/bulk/", rows, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([error["index"] for error in response.data["errors"]], [1, 3])
+        self.assertIn("category", response.data["errors"][0]["errors"])
+        self.assertIn("condition", response.data["errors"][1]["errors"])
+        self.assertIn("weight_kg", response.data["errors"][1]["errors"])
+        self.assertEqual(EWasteItem.objects.count(), 0)
+
+    def test_bulk_create_rejects_non_list_and_oversized_payloads(self):
+        response = self.client.post("/items/bulk/", {"category": self.boards.id}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        with self.settings(ITEMS_BULK_MAX_ROWS=2):
+            response = self.client.post("/items/bulk/", [self.row()] * 3, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
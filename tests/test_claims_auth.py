@@ -0,0 +1,127 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.authentication import UserClaimsCache, user_claims_cache
+from accounts.revocation import revocations
+from catalog.models import ItemCategory
+from items.models import EWasteItem
+
+
+# Password hashing in setUp can outlast the default interval, and a due
+# revocation check would add a query to the counted requests.
+@override_settings(SHARED_VERSION_CHECK_SECONDS=60)
+class ClaimsAuthenticationTestCase(APITestCase):
+    def setUp(self):
+        user_claims_cache.clear()
+        revocations.sync()
+        self.User = get_user_model()
+        self.collector = self.User.objects.create_user(
+            username="collector", password="collectorpass123"
+        )
+        category = ItemCategory.objects.create(name="Boards", base_price_per_kg=1000)
+        EWasteItem.objects.create(
+            category=category,
+            weight_kg="1",
+            condition="good",
+            date_collected=date.today(),
+            created_by=self.collector,
+        )
+
+    def login(self):
+        response = self.client.post(
+            reverse("login"),
+            {"username": "collector", "password": "collectorpass123"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def use(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_login_tokens_carry_claims_and_skip_the_user_query(self):
+        tokens = self.login()
+        claims = AccessToken(tokens["access"])
+        self.assertEqual(
+            (claims["role"], claims["is_staff"], claims["is_active"]), ("collector", False, True)
+        )
+        self.use(tokens["access"])
+        with self.assertNumQueries(1):  # the item page only
+            response = self.client.get("/items/")
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_request_user_is_a_usable_user_instance(self):
+        self.use(self.login()["access"])
+        category = ItemCategory.objects.get()
+        payload = {
+            "category": category.id,
+            "weight_kg": "2",
+            "condition": "good",
+            "date_collected": "2026-10-01",
+        }
+        response = self.client.post("/items/", payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created_by"], self.collector.id)
+
+    def test_tokens_without_claims_resolve_through_the_cache(self):
+        self.use(AccessToken.for_user(self.collector))
+        with self.assertNumQueries(2):
+            self.client.get("/items/")
+        with self.assertNumQueries(1):
+            self.client.get("/items/")
+
+    def test_role_and_deactivation_apply_once_the_window_passes(self):
+        self.use(self.login()["access"])
+        self.User.objects.filter(pk=self.collector.pk).update(role="admin", is_staff=True)
+        staff_only = {"name": "RAM", "base_price_per_kg": "7500"}
+        # Within the window the token's collector claims are still trusted.
+        response = self.client.post("/categories/", staff_only, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        with override_settings(AUTH_USER_CACHE_SECONDS=0):
+            response = self.client.post("/categories/", staff_only, format="json")
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.User.objects.filter(pk=self.collector.pk).update(is_active=False)
+            response = self.client.get("/items/")
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_saving_a_user_evicts_the_cached_claims(self):
+        self.use(AccessToken.for_user(self.collector))
+        self.client.get("/items/")
+        self.collector.is_active = False
+        self.collector.save()
+        self.assertEqual(self.client.get("/items/").status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_reissues_current_claims(self):
+        refresh = self.login()["refresh"]
+        self.collector.role = "admin"
+        self.collector.save()
+        response = self.client.post(reverse("token_refresh"), {"refresh": refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        access = AccessToken(response.data["access"])
+        self.assertEqual((access["role"], access["is_staff"]), ("admin", True))
+
+        self.collector.is_active = False
+        self.collector.save()
+        response = self.client.post(reverse("token_refresh"), {"refresh": refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class UserClaimsCacheTestCase(TestCase):
+    @override_settings(AUTH_USER_CACHE_SIZE=2)
+    def test_cache_is_bounded_and_least_recently_used_goes_first(self):
+        cache = UserClaimsCache()
+        loads = []
+
+        def load(user_id):
+            loads.append(user_id)
+            return {"role": "collector", "is_staff": False, "is_active": True}
+
+        for user_id in (1, 2, 1, 3, 1, 2):
+            cache.get(user_id, load)
+        self.assertEqual(loads, [1, 2, 3, 2])
@@ -0,0 +1,103 @@
+import csv
+import io
+import json
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from catalog.models import ItemCategory
+from items.models import EWasteItem
+from transactions.models import Transaction
+
+
+class StreamingExportTestCase(APITestCase):
+    def setUp(self):
+        self.User = get_user_model()
+        self.admin = self.User.objects.create_user(
+            username="admin", password="adminpass123", role="admin", is_staff=True
+        )
+        self.collector = self.User.objects.create_user(
+            username="collector", password="collectorpass123", role="collector"
+        )
+        self.category = ItemCategory.objects.create(name="Circuits", base_price_per_kg=5000)
+        self.today = date.today()
+        for owner, days_ago in ((self.admin, 0), (self.collector, 0), (self.collector, 10)):
+            EWasteItem.objects.create(
+                category=self.category,
+                weight_kg="1.250",
+                condition=EWasteItem.ConditionChoices.FAIR,
+                date_collected=self.today - timedelta(days=days_ago),
+                created_by=owner,
+            )
+
+    def authenticate(self, username, password):
+        response = self.client.post(
+            reverse("login"), {"username": username, "password": password}, format="json"
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    def read_csv(self, response):
+        content = b"".join(response.streaming_content).decode()
+        return list(csv.DictReader(io.StringIO(content)))
+
+    def test_items_csv_export_streams_all_rows_for_admin(self):
+        self.authenticate("admin", "adminpass123")
+        response = self.client.get("/items/export/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = self.read_csv(response)
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]["category_name"], "Circuits")
+        self.assertEqual(rows[0]["weight_kg"], "1.250")
+        self.assertEqual(rows[0]["estimated_value"], "5625.00")
+        self.assertEqual(rows[0]["supplier_name"], "")
+
+    def test_items_export_respects_role_scoping_and_date_range(self):
+        self.authenticate("collector", "collectorpass123")
+        response = self.client.get(
+            "/items/export/", {"format": "ndjson", "date_from": self.today.isoformat()}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        records = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["created_by"], self.collector.id)
+        self.assertIsNone(records[0]["source_supplier"])
+        self.assertEqual(records[0]["date_collected"], self.today.isoformat())
+
+    def test_export_rejects_invalid_dates(self):
+        self.authenticate("admin", "adminpass123")
+        response = self.client.get("/items/export/", {"date_from": "yesterday"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("date_from", response.data)
+
+    def test_transactions_export_filters_on_date_sold(self):
+        Transaction.objects.create(
+            category=self.category,
+            weight_kg="2",
+            sale_price="1000",
+            buyer_name="Buyer A",
+            status=Transaction.StatusChoices.SOLD,
+            date_sold=self.today,
+        )
+        Transaction.objects.create(
+            category=self.category,
+            weight_kg="3",
+            sale_price="1500",
+            buyer_name="Buyer B",
+            status=Transaction.StatusChoices.SOLD,
+            date_sold=self.today - timedelta(days=30),
+        )
+        self.authenticate("admin", "adminpass123")
+        response = self.client.get(
+            "/transactions/export/",
+            {"date_from": (self.today - timedelta(days=7)).isoformat()},
+            HTTP_ACCEPT="text/csv",
+        )
+        rows = self.read_csv(response)
+        self.assertEqual([row["buyer_name"] for row in rows], ["Buyer A"])
+        self.assertEqual(rows[0]["sale_price"], "1000.00")
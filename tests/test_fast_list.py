@@ -0,0 +1,101 @@
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework import serializers
+from rest_framework.test import APITestCase
+
+from catalog.models import ItemCategory
+from ewaste_api.serialization import RowMapper
+from items.models import EWasteItem
+from suppliers.models import Supplier
+from transactions.models import Transaction
+from transactions.serializers import TransactionSerializer
+
+
+class FastListParityTestCase(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.admin = User.objects.create_user(
+            username="admin", password="adminpass123", role="admin", is_staff=True
+        )
+        self.collector = User.objects.create_user(username="collector", password="pass12345")
+        boards = ItemCategory.objects.create(name="Boards", base_price_per_kg="5500.00")
+        ram = ItemCategory.objects.create(name="RAM", base_price_per_kg="7500.50")
+        supplier = Supplier.objects.create(supplier_name="Kariakor Depot")
+        for index in range(7):
+            EWasteItem.objects.create(
+                category=boards if index % 2 else ram,
+                # Every third item has no supplier, so supplier_detail is null.
+                source_supplier=None if index % 3 == 0 else supplier,
+                weight_kg=f"{index + 1}.125",
+                condition=EWasteItem.ConditionChoices.GOOD,
+                date_collected=date(2026, 1, 1) + timedelta(days=index // 2),
+                created_by=self.collector if index % 2 else self.admin,
+            )
+            Transaction.objects.create(
+                category=boards if index % 2 else ram,
+                weight_kg=f"{index + 0.5}",
+                sale_price=f"{index * 1000}.25",
+                buyer_name="Buyer Ltd",
+                status="sold" if index % 2 else "stocked",
+                date_sold=date(2026, 2, 1) if index % 2 else None,
+            )
+
+    def fetch_pages(self, user, path):
+        self.client.force_authenticate(user)
+        pages = []
+        while path:
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.content)
+            path = response.json()["next"]
+        return pages
+
+    def test_list_responses_are_byte_identical_to_the_serializers(self):
+        for user, path in (
+            (self.admin, "/items/?page_size=3"),
+            (self.collector, "/items/?page_size=2"),
+            (self.admin, "/transactions/?page_size=3"),
+        ):
+            with self.subTest(user=user.username, path=path):
+                fast = self.fetch_pages(user, path)
+                with override_settings(FAST_LIST_SERIALIZATION=False):
+                    slow = self.fetch_pages(user, path)
+                self.assertGreater(len(fast), 1)
+                self.assertEqual(fast, slow)
+
+    def test_list_is_a_single_query(self):
+        self.client.force_authenticate(self.admin)
+        with self.assertNumQueries(1):
+            response = self.client.get("/items/")
+        item = response.json()["results"][0]
+        self.assertEqual(item["category_detail"], "RAM")
+        self.assertEqual(item["weight_kg"], "7.125")
+        self.assertNotIn("supplier_detail", item)
+
+
+class RowMapperTestCase(TestCase):
+    def test_method_fields_need_a_computed_mapping(self):
+        with self.assertRaises(TypeError):
+            RowMapper(TransactionSerializer)
+
+    def test_maps_rows_to_serializer_representation(self):
+        class Example(serializers.Serializer):
+            name = serializers.CharField(source="category.name")
+            price = serializers.DecimalField(max_digits=6, decimal_places=2)
+            label = serializers.SerializerMethodField()
+
+        mapper = RowMapper(
+            Example, {"label": (lambda name: name and name.upper(), ("category__name",))}
+        )
+        self.assertEqual(mapper.lookups, ["category__name", "category", "price"])
+        self.assertEqual(
+            mapper([("ram", 1, 7.5), ("pcb", 2, None), (None, None, 3)]),
+            [
+                {"name": "ram", "price": "7.50", "label": "RAM"},
+                {"name": "pcb", "price": None, "label": "PCB"},
+                # Like DRF, a field behind a missing relation is left out.
+                {"price": "3.00", "label": None},
+            ],
+        )
@@ -0,0 +1,146 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from catalog.models import ItemCategory
+from items.models import EWasteItem
+from suppliers.models import Supplier
+from transactions.models import Transaction
+
+
+class ItemFilterTestCase(APITestCase):
+    def setUp(self):
+        self.admin = get_user_model().objects.create_user(
+            username="admin", password="adminpass123", role="admin", is_staff=True
+        )
+        self.client.force_authenticate(self.admin)
+        self.boards = ItemCategory.objects.create(name="Boards", base_price_per_kg=1000)
+        self.ram = ItemCategory.objects.create(name="RAM", base_price_per_kg=2000)
+        self.supplier = Supplier.objects.create(supplier_name="Depot")
+        self.today = date.today()
+        self.items = [
+            EWasteItem.objects.create(
+                category=category,
+                weight_kg="1.5",
+                condition=condition,
+                source_supplier=supplier,
+                date_collected=self.today - timedelta(days=days_ago),
+                created_by=self.admin,
+            )
+            for category, condition, supplier, days_ago in [
+                (self.boards, "good", self.supplier, 0),
+                (self.boards, "poor", None, 10),
+                (self.ram, "good", None, 20),
+                (self.ram, "fair", self.supplier, 40),
+            ]
+        ]
+
+    def ids(self, params, path="/items/"):
+        response = self.client.get(path, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return [row["id"] for row in response.data["results"]]
+
+    def test_filters_combine(self):
+        first, second, third, fourth = (item.id for item in self.items)
+        self.assertEqual(self.ids({"category": self.boards.id}), [first, second])
+        self.assertEqual(self.ids({"condition": "good"}), [first, third])
+        self.assertEqual(self.ids({"source_supplier": self.supplier.id}), [first, fourth])
+        window = {
+            "date_from": (self.today - timedelta(days=30)).isoformat(),
+            "date_to": (self.today - timedelta(days=5)).isoformat(),
+        }
+        self.assertEqual(self.ids(window), [second, third])
+        self.assertEqual(self.ids({"category": self.ram.id, **window}), [third])
+        self.assertEqual(self.ids({"category": self.ram.id + 100}), [])
+
+    def test_ordering_whitelist_drives_the_cursor(self):
+        ids = []
+        url = "/items/?ordering=date_collected&page_size=3"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(row["id"] for row in response.data["results"])
+            url = response.data["next"]
+        self.assertEqual(ids, [item.id for item in reversed(self.items)])
+
+        response = self.client.get("/items/", {"ordering": "weight_kg"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("ordering", response.data)
+
+    def test_invalid_values_are_rejected(self):
+        for params in ({"condition": "mint"}, {"category": "boards"}, {"date_from": "yesterday"}):
+            response = self.client.get("/items/", params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+            self.assertIn(next(iter(params)), response.data)
+
+    def test_export_applies_the_same_filters(self):
+        response = self.client.get("/items/export/", {"format": "ndjson", "condition": "good"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = b"".join(response.streaming_content).splitlines()
+        self.assertEqual(len(lines), 2)
+
+
+class TransactionFilterTestCase(APITestCase):
+    def setUp(self):
+        self.admin = get_user_model().objects.create_user(
+            username="admin", password="adminpass123", role="admin", is_staff=True
+        )
+        self.client.force_authenticate(self.admin)
+        self.category = ItemCategory.objects.create(name="Boards", base_price_per_kg=1000)
+        self.today = date.today()
+        self.transactions = {
+            buyer_name: Transaction.objects.create(
+                category=self.category,
+                weight_kg="2",
+                sale_price=Decimal("100.00"),
+                buyer_name=buyer_name,
+                status=status_value,
+                date_sold=self.today - timedelta(days=days_ago) if days_ago is not None else None,
+            )
+            for buyer_name, status_value, days_ago in [
+                ("Acme Metals", "sold", 3),
+                ("Acme Recycling", "sold", 1),
+                ("acme lowercase", "stocked", None),
+                ("Abacus", "stocked", None),
+            ]
+        }
+
+    def buyers(self, params):
+        response = self.client.get("/transactions/", params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return [row["buyer_name"] for row in response.data["results"]]
+
+    def test_buyer_prefix_is_a_case_sensitive_range(self):
+        self.assertEqual(self.buyers({"buyer_name": "Acme"}), ["Acme Metals", "Acme Recycling"])
+        self.assertEqual(
+            self.buyers({"buyer_name": "Acme", "ordering": "-buyer_name"}),
+            ["Acme Recycling", "Acme Metals"],
+        )
+        self.assertEqual(self.buyers({"buyer_name": "Ab"}), ["Abacus"])
+        self.assertEqual(self.buyers({"buyer_name": "Z"}), [])
+
+    def test_status_and_date_window(self):
+        self.assertEqual(
+            self.buyers({"status": "stocked", "ordering": "created_at"}),
+            ["acme lowercase", "Abacus"],
+        )
+        window = {"date_from": (self.today - timedelta(days=7)).isoformat()}
+        # A dated window is ordered newest sale first, like the dated export.
+        self.assertEqual(self.buyers(window), ["Acme Recycling", "Acme Metals"])
+        self.assertEqual(
+            self.buyers({"ordering": "date_sold", **window}), ["Acme Metals", "Acme Recycling"]
+        )
+        response = self.client.get("/transactions/", {"status": "refunded"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_date_sold_ordering_needs_a_date_window(self):
+        # Without a window it would silently leave out the stocked transactions.
+        for path in ("/transactions/", "/transactions/export/"):
+            for ordering in ("date_sold", "-date_sold"):
+                with self.subTest(path=path, ordering=ordering):
+                    response = self.client.get(path, {"ordering": ordering})
+                    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                    self.assertIn("date_from or date_to", str(response.data["ordering"]))
@@ -0,0 +1,163 @@
+import json
+import os
+import tempfile
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models import Sum
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from analytics.models import DailyCollectionRollup
+from catalog.models import ItemCategory
+from ewaste_api.imports import CSVImport
+from items.models import EWasteItem, ImportCheckpoint
+from suppliers.models import Supplier
+from transactions.models import Transaction
+
+
+class HistoryImportTestCase(TestCase):
+    def setUp(self):
+        self.boards = ItemCategory.objects.create(name="Boards", base_price_per_kg=5000)
+        self.ram = ItemCategory.objects.create(name="RAM", base_price_per_kg=7500)
+        self.supplier = Supplier.objects.create(supplier_name="Depot Supplier")
+        self.collector = get_user_model().objects.create_user(
+            username="collector", password="collectorpass123", role="collector"
+        )
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "history.csv")
+
+    def write_csv(self, header, rows, mode="w"):
+        with open(self.path, mode, encoding="utf-8") as handle:
+            if mode == "w":
+                handle.write(",".join(header) + "\n")
+            for row in rows:
+                handle.write(",".join(str(value) for value in row) + "\n")
+
+    def item_rows(self, count, start=0):
+        return [
+            (
+                self.boards.id if index % 2 else self.ram.id,
+                "1.5",
+                "fair",
+                self.supplier.id if index % 3 else "",
+                f"2019-01-{index % 28 + 1:02d}",
+            )
+            for index in range(start, start + count)
+        ]
+
+    def run_import(self, *args, **options):
+        stdout, stderr = StringIO(), StringIO()
+        call_command("import_history", *args, stdout=stdout, stderr=stderr, **options)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_items_are_priced_rolled_up_and_checkpointed(self):
+        header = ("category", "weight_kg", "condition", "source_supplier", "date_collected")
+        self.write_csv(header, self.item_rows(7))
+        stdout, _ = self.run_import(
+            "items", self.path, chunk_size=3, created_by=self.collector.username
+        )
+        self.assertIn("rows/s", stdout)
+        self.assertEqual(EWasteItem.objects.count(), 7)
+        for item in EWasteItem.objects.all():
+            self.assertEqual(item.estimated_value, item.compute_estimated_value())
+            self.assertEqual(item.created_by, self.collector)
+        self.assertEqual(EWasteItem.objects.filter(source_supplier=None).count(), 3)
+        self.assertEqual(
+            DailyCollectionRollup.objects.aggregate(total=Sum("item_count"))["total"], 7
+        )
+        self.supplier.refresh_from_db()
+        self.assertEqual(self.supplier.item_count, 4)
+        self.assertEqual(ImportCheckpoint.objects.get(kind="items").rows, 7)
+        with open(f"{self.path}.checkpoint", encoding="utf-8") as handle:
+            self.assertEqual(json.load(handle)["rows"], 7)
+
+    def test_chunk_queries_do_not_grow_with_rows_or_keys(self):
+        header = ("category", "weight_kg", "condition", "source_supplier", "date_collected")
+        queries = []
+        # The first run also creates the rollup rows and loads the price table.
+        for count in (5, 10, 40):
+            # Spread over dates, categories and with or without the supplier,
+            # so every added row brings new rollup keys.
+            self.write_csv(header, self.item_rows(count))
+            with CaptureQueriesContext(connection) as captured:
+                self.run_import("items", self.path, chunk_size=50, restart=True)
+            queries.append(len(captured))
+        self.assertEqual(queries[1], queries[2])
+        self.assertEqual(EWasteItem.objects.count(), 55)
+        self.assertGreater(DailyCollectionRollup.objects.count(), 28)
+
+    def test_invalid_row_stops_and_rerun_resumes_after_fix(self):
+        header = ("category", "weight_kg", "condition", "source_supplier", "date_collected")
+        rows = self.item_rows(6)
+        rows[4] = (self.boards.id, "-1", "fair", "", "2019-01-05")
+        self.write_csv(header, rows)
+        with self.assertRaisesMessage(CommandError, "after row 3"):
+            self.run_import("items", self.path, chunk_size=3)
+        self.assertEqual(EWasteItem.objects.count(), 3)
+
+        rows[4] = (self.boards.id, "1", "fair", "", "2019-01-05")
+        self.write_csv(header, rows)
+        self.run_import("items", self.path, chunk_size=3)
+        self.assertEqual(EWasteItem.objects.count(), 6)
+
+        stdout, _ = self.run_import("items", self.path, chunk_size=3)
+        self.assertIn("No new rows", stdout)
+        self.run_import("items", self.path, chunk_size=3, restart=True)
+        self.assertEqual(EWasteItem.objects.count(), 12)
+
+    def test_a_failed_checkpoint_write_rolls_back_its_chunk(self):
+        header = ("category", "weight_kg", "condition", "source_supplier", "date_collected")
+        self.write_csv(header, self.item_rows(6))
+        save_checkpoint = CSVImport.save_checkpoint
+        calls = []
+
+        def crash_on_second_chunk(csv_import, state):
+            calls.append(state["rows"])
+            if len(calls) == 2:
+                raise RuntimeError("lost the database connection")
+            save_checkpoint(csv_import, state)
+
+        with mock.patch.object(CSVImport, "save_checkpoint", crash_on_second_chunk):
+            with self.assertRaisesMessage(RuntimeError, "lost the database connection"):
+                self.run_import("items", self.path, chunk_size=3)
+        # The second chunk's rows went with its checkpoint, so nothing repeats.
+        self.assertEqual(EWasteItem.objects.count(), 3)
+        self.assertEqual(ImportCheckpoint.objects.get().rows, 3)
+
+        os.remove(f"{self.path}.checkpoint")  # the mirror is never read back
+        self.run_import("items", self.path, chunk_size=3)
+        self.assertEqual(EWasteItem.objects.count(), 6)
+        self.assertEqual(
+            DailyCollectionRollup.objects.aggregate(total=Sum("item_count"))["total"], 6
+        )
+
+    def test_transactions_follow_serializer_rules_and_skip_invalid_rows(self):
+        header = ("category", "weight_kg", "sale_price", "buyer_name", "date_sold", "status")
+        rows = [
+            (self.boards.id, "2", "100.00", "Buyer A", "2018-06-01", "sold"),
+            (self.ram.id, "1", "50.00", "Buyer B", "", "sold"),
+            (self.boards.id, "3", "75.00", "Buyer C", "", ""),
+            (9999, "1", "10.00", "Buyer D", "", "stocked"),
+        ]
+        self.write_csv(header, rows)
+        _, stderr = self.run_import("transactions", self.path, skip_invalid=True)
+        self.assertIn("Skipped line 3", stderr)
+        self.assertIn("Skipped line 5", stderr)
+        self.assertEqual(
+            sorted(Transaction.objects.values_list("buyer_name", "status")),
+            [("Buyer A", "sold"), ("Buyer C", "stocked")],
+        )
+        self.assertEqual(
+            Transaction.objects.get(buyer_name="Buyer A").sale_price, Decimal("100.00")
+        )
+
+    def test_unknown_columns_are_rejected(self):
+        self.write_csv(("category", "weight", "sale_price", "buyer_name"), [])
+        with self.assertRaisesMessage(CommandError, "Unknown columns: weight"):
+            self.run_import("transactions", self.path)
@@ -0,0 +1,158 @@
+from datetime import date, timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from catalog.models import ItemCategory
+from items.models import EWasteItem
+from items.views import EWasteItemPagination
+from suppliers.models import Supplier
+from transactions.models import Transaction
+
+
+class KeysetPaginationTestCase(APITestCase):
+    def setUp(self):
+        self.User = get_user_model()
+        self.admin = self.User.objects.create_user(
+            username="admin",
+            password="adminpass123",
+            role="admin",
+            is_staff=True,
+        )
+        self.category = ItemCategory.objects.create(name="Circuits", base_price_per_kg=5000)
+        today = date.today()
+        for offset in range(4):
+            for _ in range(3):
+                EWasteItem.objects.create(
+                    category=self.category,
+                    weight_kg="1.5",
+                    condition=EWasteItem.ConditionChoices.GOOD,
+                    date_collected=today - timedelta(days=offset),
+                    created_by=self.admin,
+                )
+        response = self.client.post(
+            reverse("login"), {"username": "admin", "password": "adminpass123"}, format="json"
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    def collect_pages(self, url):
+        ids = []
+        pages = 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(row["id"] for row in response.data["results"])
+            url = response.data["next"]
+            pages += 1
+        return ids, pages
+
+    def test_items_pages_follow_model_ordering_without_gaps(self):
+        ids, pages = self.collect_pages("/items/?page_size=5")
+        expected = list(EWasteItem.objects.values_list("id", flat=True))
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 3)
+
+    def test_new_rows_do_not_shift_following_pages(self):
+        first = self.client.get("/items/?page_size=5")
+        EWasteItem.objects.create(
+            category=self.category,
+            weight_kg="2",
+            condition=EWasteItem.ConditionChoices.FAIR,
+            date_collected=date.today() + timedelta(days=1),
+            created_by=self.admin,
+        )
+        second = self.client.get(first.data["next"])
+        expected = list(EWasteItem.objects.values_list("id", flat=True))
+        seen = [row["id"] for row in first.data["results"] + second.data["results"]]
+        self.assertEqual(seen, expected[1:11])
+
+    def test_previous_link_returns_prior_page(self):
+        first = self.client.get("/items/?page_size=4")
+        second = self.client.get(first.data["next"])
+        self.assertIsNone(first.data["previous"])
+        back = self.client.get(second.data["previous"])
+        self.assertEqual(
+            [row["id"] for row in back.data["results"]],
+            [row["id"] for row in first.data["results"]],
+        )
+
+    def test_default_page_size_applies_without_param(self):
+        response = self.client.get("/items/")
+        self.assertEqual(len(response.data["results"]), 12)
+        self.assertIsNone(response.data["next"])
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get("/items/?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_transactions_are_paginated(self):
+        for index in range(3):
+            Transaction.objects.create(
+                category=self.category,
+                weight_kg="1",
+                sale_price="100",
+                buyer_name=f"Buyer {index}",
+            )
+        ids, pages = self.collect_pages("/transactions/?page_size=2")
+        self.assertEqual(ids, list(Transaction.objects.values_list("id", flat=True)))
+        self.assertEqual(pages, 2)
+
+    def test_single_page_list_is_counted_exactly(self):
+        response = self.client.get("/items/")
+        self.assertEqual(response.data["count"], 12)
+        self.assertFalse(response.data["count_approximate"])
+
+    def test_count_below_threshold_is_exact_on_every_page(self):
+        first = self.client.get("/items/?page_size=5")
+        second = self.client.get(first.data["next"])
+        for page in (first, second):
+            self.assertEqual(page.data["count"], 12)
+            self.assertFalse(page.data["count_approximate"])
+
+    @mock.patch.object(EWasteItemPagination, "exact_count_threshold", 5)
+    def test_count_above_threshold_is_estimated_from_rollups(self):
+        response = self.client.get("/items/?page_size=5")
+        self.assertEqual(response.data["count"], 12)
+        self.assertTrue(response.data["count_approximate"])
+
+        today = date.today()
+        last_month = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
+        month_end = (today.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+        response = self.client.get(
+            f"/items/?page_size=5&date_from={last_month}&date_to={month_end}"
+        )
+        self.assertEqual(response.data["count"], 12)
+        self.assertTrue(response.data["count_approximate"])
+
+    @mock.patch.object(EWasteItemPagination, "exact_count_threshold", 5)
+    @mock.patch("ewaste_api.pagination.planner_row_estimate", return_value=7)
+    def test_count_within_a_month_or_supplier_uses_the_planner_estimate(self, estimate):
+        since = (date.today() - timedelta(days=1)).isoformat()
+        supplier = Supplier.objects.create(supplier_name="Depot")
+        EWasteItem.objects.update(source_supplier=supplier)
+        for query in (f"date_from={since}", f"source_supplier={supplier.id}"):
+            with self.subTest(query=query):
+                response = self.client.get(f"/items/?page_size=5&{query}")
+                self.assertEqual(response.data["count"], 7)
+                self.assertTrue(response.data["count_approximate"])
+        self.assertEqual(estimate.call_count, 2)
+
+    @mock.patch.object(EWasteItemPagination, "exact_count_threshold", 5)
+    def test_exact_count_can_be_requested(self):
+        response = self.client.get("/items/?page_size=5&count=exact")
+        self.assertEqual(response.data["count"], 12)
+        self.assertFalse(response.data["count_approximate"])
+
+    @mock.patch.object(EWasteItemPagination, "exact_count_threshold", 5)
+    def test_count_without_an_estimate_falls_back_to_exact(self):
+        collector = self.User.objects.create_user(
+            username="collector", password="collectorpass123", role="collector"
+        )
+        EWasteItem.objects.filter(created_by=self.admin).update(created_by=collector)
+        self.client.force_authenticate(collector)
+        response = self.client.get("/items/?page_size=5")
+        self.assertEqual(response.data["count"], 12)
+        self.assertFalse(response.data["count_approximate"])
@@ -0,0 +1,53 @@
+import copy
+from unittest import skipUnless
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, connections
+from django.test import SimpleTestCase
+
+from ewaste_api.db.postgresql.base import DatabaseWrapper
+
+try:
+    import psycopg_pool
+except ImportError:  # pragma: no cover - psycopg-pool is in requirements.txt
+    psycopg_pool = None
+
+
+@skipUnless(
+    connection.vendor == "postgresql" and psycopg_pool, "needs Postgres and psycopg-pool"
+)
+class PooledPostgresTestCase(SimpleTestCase):
+    def setUp(self):
+        config = copy.deepcopy(connections.settings["default"])
+        config.update(ENGINE="ewaste_api.db.postgresql", CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=True)
+        config["OPTIONS"] = {"pool": {"min_size": 1, "max_size": 2, "max_lifetime": 60}}
+        connections.settings["pooled"] = config
+        self.addCleanup(connections.settings.pop, "pooled")
+        self.addCleanup(self.discard)
+
+    def discard(self):
+        pooled = connections["pooled"]
+        pooled.close()
+        pooled.close_pool()
+        del connections["pooled"]
+
+    def test_connections_are_checked_out_and_returned(self):
+        pooled = connections["pooled"]
+        for _ in range(5):
+            with pooled.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            pool = pooled.pool
+            self.assertIs(pooled.connection._pool, pool)
+            pooled.close()
+            self.assertIsNone(pooled.connection)
+        stats = pool.get_stats()
+        self.assertEqual(stats["pool_available"], stats["pool_size"])
+        self.assertLessEqual(stats["connections_num"], 2)
+        self.assertEqual(pool.max_size, 2)
+        self.assertIsNotNone(pool._check)
+
+    def test_persistent_connections_are_rejected(self):
+        config = copy.deepcopy(connections.settings["pooled"])
+        config["CONN_MAX_AGE"] = 60
+        with self.assertRaises(ImproperlyConfigured):
+            DatabaseWrapper(config, alias="persistent").pool
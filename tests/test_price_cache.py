@@ -0,0 +1,88 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from catalog.models import ItemCategory
+from catalog.prices import category_prices, get_base_price, price_version
+from ewaste_api.cache import check_shared_cache
+from items.models import EWasteItem
+
+
+class CategoryPriceTableTestCase(TestCase):
+    def setUp(self):
+        self.category = ItemCategory.objects.create(name="Boards", base_price_per_kg=5000)
+
+    def test_pricing_needs_no_catalog_query_once_loaded(self):
+        get_base_price(self.category.id)
+        item = EWasteItem(category_id=self.category.id, weight_kg=Decimal("2"), condition="fair")
+        with self.assertNumQueries(0):
+            self.assertEqual(item.compute_estimated_value(), Decimal("9000.00"))
+
+    def test_model_writes_invalidate_the_table(self):
+        self.assertEqual(get_base_price(self.category.id), Decimal("5000"))
+        self.category.base_price_per_kg = Decimal("6000.00")
+        self.category.save()
+        self.assertEqual(get_base_price(self.category.id), Decimal("6000.00"))
+        new_category = ItemCategory.objects.create(name="RAM", base_price_per_kg="7500.00")
+        self.assertEqual(get_base_price(new_category.id), Decimal("7500.00"))
+
+    @override_settings(SHARED_VERSION_CHECK_SECONDS=0)
+    def test_version_bump_from_another_worker_triggers_reload(self):
+        get_base_price(self.category.id)
+        ItemCategory.objects.filter(pk=self.category.pk).update(base_price_per_kg="4200.00")
+        self.assertEqual(get_base_price(self.category.id), Decimal("5000"))
+        cache.incr(price_version.key)
+        with self.assertNumQueries(1):
+            self.assertEqual(get_base_price(self.category.id), Decimal("4200.00"))
+
+    def test_unknown_category_raises_does_not_exist(self):
+        with self.assertRaises(ItemCategory.DoesNotExist):
+            category_prices.get(self.category.id + 1000)
+
+
+class SharedCacheCheckTestCase(TestCase):
+    LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    SHARED = {"default": {"BACKEND": "django.core.cache.backends.db.DatabaseCache", "LOCATION": "t"}}
+
+    @override_settings(CACHES=LOCMEM, WEB_CONCURRENCY=1)
+    def test_local_cache_is_fine_for_one_worker(self):
+        self.assertEqual(check_shared_cache(), [])
+
+    @override_settings(CACHES=LOCMEM, WEB_CONCURRENCY=2)
+    def test_local_cache_is_rejected_for_several_workers(self):
+        self.assertEqual([error.id for error in check_shared_cache()], ["ewaste_api.E001"])
+        self.assertEqual(check_shared_cache(workers=1), [])
+
+    @override_settings(CACHES=SHARED, WEB_CONCURRENCY=4)
+    def test_shared_cache_passes_with_several_workers(self):
+        self.assertEqual(check_shared_cache(), [])
+
+
+class CategoryPriceApiTestCase(APITestCase):
+    def setUp(self):
+        self.admin = get_user_model().objects.create_user(
+            username="admin", password="adminpass123", role="admin", is_staff=True
+        )
+        self.category = ItemCategory.objects.create(name="Boards", base_price_per_kg=5000)
+        response = self.client.post(
+            reverse("login"), {"username": "admin", "password": "adminpass123"}, format="json"
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    def test_price_update_through_api_applies_to_next_item(self):
+        item = EWasteItem.objects.create(
+            category=self.category, weight_kg="1", condition="good", date_collected=date.today()
+        )
+        self.assertEqual(item.estimated_value, Decimal("5000.00"))
+        response = self.client.patch(
+            f"/categories/{self.category.id}/", {"base_price_per_kg": "5500.00"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        estimate = self.client.get(f"/items/{item.id}/estimate_price/")
+        self.assertEqual(estimate.data["estimated_value"], Decimal("5500.00"))
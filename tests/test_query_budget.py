@@ -0,0 +1,171 @@
+from datetime import date, timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from rest_framework.test import APITestCase
+
+from catalog.models import ItemCategory
+from catalog.serializers import ItemCategorySerializer
+from ewaste_api.middleware import QueryRecorder, query_shape
+from ewaste_api.testing import QueryBudgetMixin
+from items.models import EWasteItem
+from suppliers.models import Supplier
+from transactions.models import Transaction
+
+
+class QueryRecorderTestCase(TestCase):
+    def test_in_lists_of_any_length_share_a_shape(self):
+        self.assertEqual(
+            query_shape('SELECT 1 FROM "t" WHERE "id" IN (%s, %s, %s)'),
+            query_shape('SELECT 1 FROM "t" WHERE "id" IN (%s,%s)'),
+        )
+
+    def test_recorder_counts_repeated_shapes(self):
+        categories = [ItemCategory.objects.create(name=f"Category {i}") for i in range(3)]
+        recorder = QueryRecorder()
+        with recorder.capture():
+            for category in categories:
+                ItemCategory.objects.get(pk=category.pk)
+        self.assertEqual(recorder.count, 3)
+        self.assertEqual(len(recorder.repeated(3)), 1)
+        self.assertGreater(recorder.duration, 0)
+
+
+class EndpointQueryBudgetTestCase(QueryBudgetMixin, APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = get_user_model().objects.create_user(
+            username="admin", password="adminpass123", role="admin", is_staff=True
+        )
+        self.client.force_authenticate(self.admin)
+        self.add_rows(3)
+
+    def add_rows(self, count):
+        for _ in range(count):
+            category = ItemCategory.objects.create(
+                name=f"Category {ItemCategory.objects.count()}", base_price_per_kg=1000
+            )
+            supplier = Supplier.objects.create(supplier_name="Supplier")
+            EWasteItem.objects.create(
+                category=category,
+                source_supplier=supplier,
+                weight_kg="1",
+                condition="good",
+                date_collected=date.today(),
+                created_by=self.admin,
+            )
+            Transaction.objects.create(
+                category=category, weight_kg="1", sale_price="10", buyer_name="Buyer"
+            )
+
+    def test_list_endpoints_stay_within_budget_as_rows_grow(self):
+        budgets = {
+            "/items/": 1,
+            "/transactions/": 1,
+            "/suppliers/": 1,
+            "/categories/": 1,
+            "/analytics/today/": 1,
+            "/analytics/monthly/": 1,
+            "/analytics/summary/": 2,
+            "/analytics/supplier-ranking/": 1,
+        }
+        for rows in (3, 30):
+            cache.clear()
+            if rows > 3:
+                self.add_rows(rows - 3)
+            for path, budget in budgets.items():
+                with self.subTest(path=path, rows=rows):
+                    with self.assertQueryBudget(budget, max_repeats=1):
+                        self.client.get(path)
+
+    def test_bulk_intake_stays_within_budget_as_keys_grow(self):
+        categories = list(ItemCategory.objects.all())
+        suppliers = list(Supplier.objects.all())
+        self.client.post("/items/bulk/", [], format="json")  # loads the price table
+
+        def rows(spread):
+            # 120 rows fit one SQLite insert batch, so only the key spread varies.
+            return [
+                {
+                    "category": categories[i * spread % len(categories)].id,
+                    "weight_kg": "1.5",
+                    "condition": ("good", "poor")[i * spread % 2],
+                    "source_supplier": suppliers[i * spread % len(suppliers)].id,
+                    "date_collected": (date.today() - timedelta(days=i * spread)).isoformat(),
+                }
+                for i in range(120)
+            ]
+
+        for spread in (0, 1):
+            with self.subTest(spread=spread):
+                # categories, suppliers, savepoint, items, daily and monthly
+                # rollups, supplier totals, release
+                with self.assertQueryBudget(8, max_repeats=1):
+                    response = self.client.post("/items/bulk/", rows(spread), format="json")
+                self.assertEqual(response.status_code, 201)
+
+    def test_budget_failure_lists_query_shapes(self):
+        with self.assertRaisesMessage(AssertionError, "budget is 0"):
+            with self.assertQueryBudget(0):
+                self.client.get("/categories/")
+
+
+@override_settings(QUERY_BUDGET_ENABLED=True, QUERY_BUDGET_REPEAT_THRESHOLD=3)
+class QueryBudgetMiddlewareTestCase(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="collector", password="collectorpass123", role="collector"
+        )
+        self.client.force_authenticate(self.user)
+        self.categories = [
+            ItemCategory.objects.create(name=f"Category {i}", base_price_per_kg=1000)
+            for i in range(4)
+        ]
+
+    def test_response_carries_server_timing_and_log_line(self):
+        with self.assertLogs("ewaste_api.queries", "INFO") as logs:
+            response = self.client.get("/categories/")
+        self.assertRegex(response["Server-Timing"], r'^db;dur=[\d.]+;desc="1 queries"$')
+        record = logs.records[0]
+        self.assertEqual(record.levelname, "INFO")
+        self.assertEqual(record.query_budget["path"], "/categories/")
+        self.assertEqual(record.query_budget["queries"], 1)
+
+    def test_repeated_sql_shapes_are_logged_as_warning(self):
+        def lookup_each(serializer, instance):
+            return {"id": ItemCategory.objects.get(pk=instance.pk).pk}
+
+        with mock.patch.object(ItemCategorySerializer, "to_representation", lookup_each):
+            with self.assertLogs("ewaste_api.queries", "INFO") as logs:
+                self.client.get("/categories/")
+        record = logs.records[0]
+        self.assertEqual(record.levelname, "WARNING")
+        self.assertEqual(record.query_budget["repeated"][0]["count"], 4)
+        self.assertIn("catalog_itemcategory", record.query_budget["repeated"][0]["sql"])
+
+    def test_bulk_intake_has_no_repeated_shapes(self):
+        rows = [
+            {
+                "category": category.id,
+                "weight_kg": "1",
+                "condition": condition,
+                "date_collected": (date.today() - timedelta(days=days_ago)).isoformat(),
+            }
+            for category in self.categories
+            for condition in ("good", "fair", "poor")
+            for days_ago in range(0, 60, 7)
+        ]
+        with self.assertLogs("ewaste_api.queries", "INFO") as logs:
+            self.client.post("/items/bulk/", rows, format="json")
+        record = logs.records[0]
+        self.assertEqual(record.levelname, "INFO")
+        self.assertEqual(record.query_budget["repeated"], [])
+
+    @override_settings(QUERY_BUDGET_ENABLED=False)
+    def test_disabled_middleware_adds_nothing(self):
+        response = self.client.get("/categories/")
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(connection.execute_wrappers, [])
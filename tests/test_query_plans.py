@@ -0,0 +1,219 @@
+import re
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import cycle
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from analytics.rollups import rebuild_rollups
+from catalog.models import ItemCategory
+from items.models import EWasteItem
+from suppliers.models import Supplier
+from transactions.models import Transaction
+
+# "SCAN subquery" walks the at most threshold + 1 ids a bounded list count
+# already read through an index, not a table.
+FULL_SCAN = re.compile(r"\bSCAN (?!subquery\b)(\w+)(?!\w| USING)")
+TEMP_SORT = re.compile(r"USE TEMP B-TREE FOR (?:ORDER BY|(?:LAST TERM|RIGHT PART) OF ORDER BY)")
+# An admin's large item list with no date window estimates its count by
+# folding every monthly rollup row, a scan over months x categories x
+# conditions, like the monthly history, never over items or days.
+MONTHLY_COUNT = ["SCAN analytics_monthlycollectionrollup"]
+
+
+def explain(sql):
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+        return [row[-1] for row in cursor.fetchall()]
+
+
+@skipUnless(connection.vendor == "sqlite", "reads SQLite's EXPLAIN QUERY PLAN")
+class QueryPlanTestCase(APITestCase):
+    """
+    Run every list, export and analytics endpoint against a seeded SQLite
+    database and check the plan of each ``SELECT`` it issues.
+
+    A plan fails when it scans a table without an index or sorts through a
+    temporary B-tree. ``allowed`` names the exceptions, each for a stated reason.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.admin = User.objects.create_user(
+            username="admin", password="adminpass123", role="admin", is_staff=True
+        )
+        cls.collectors = [
+            User.objects.create_user(username=f"collector{i}", password="pass12345", role="collector")
+            for i in range(5)
+        ]
+        categories = [
+            ItemCategory.objects.create(name=f"Category {i}", base_price_per_kg=1000 + i)
+            for i in range(8)
+        ]
+        suppliers = Supplier.objects.bulk_create(
+            Supplier(supplier_name=f"Supplier {i}") for i in range(40)
+        )
+        today = date.today()
+        owners = cycle([cls.admin, *cls.collectors])
+        supplier_cycle = cycle([*suppliers, None])
+        conditions = cycle(EWasteItem.ConditionChoices.values)
+        EWasteItem.objects.bulk_create(
+            EWasteItem(
+                category=categories[i % len(categories)],
+                weight_kg=Decimal("1.5"),
+                condition=next(conditions),
+                source_supplier=next(supplier_cycle),
+                date_collected=today - timedelta(days=i % 365),
+                estimated_value=Decimal("1500.00"),
+                created_by=next(owners),
+            )
+            for i in range(3000)
+        )
+        statuses = cycle(Transaction.StatusChoices.values)
+        Transaction.objects.bulk_create(
+            Transaction(
+                category=categories[i % len(categories)],
+                weight_kg=Decimal("2"),
+                sale_price=Decimal("100.00"),
+                buyer_name=f"Buyer {i % 50}",
+                status=(status := next(statuses)),
+                date_sold=today - timedelta(days=i % 200) if status == "sold" else None,
+            )
+            for i in range(1000)
+        )
+        rebuild_rollups()
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def setUp(self):
+        cache.clear()
+        self.today = date.today()
+
+    def plans_for(self, user, path, params=None):
+        self.client.force_authenticate(user)
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(path, params or {})
+            if response.streaming:
+                b"".join(response.streaming_content)
+        self.assertLess(response.status_code, 400, path)
+        selects = [query["sql"] for query in captured if query["sql"].startswith("SELECT")]
+        self.assertTrue(selects, path)
+        return [(sql, explain(sql)) for sql in selects]
+
+    def assertIndexed(self, user, path, params=None, allowed=()):
+        for sql, plan in self.plans_for(user, path, params):
+            for line in plan:
+                if any(pattern in line for pattern in allowed):
+                    continue
+                self.assertIsNone(FULL_SCAN.search(line), f"{path}: {line}\n{sql}")
+                self.assertIsNone(TEMP_SORT.search(line), f"{path}: {line}\n{sql}")
+
+    def assertSeeks(self, user, path, params, table, allowed=()):
+        """Like ``assertIndexed``, but ``table`` must be read by an index seek, not a walk."""
+        self.assertIndexed(user, path, params, allowed)
+        for sql, plan in self.plans_for(user, path, params):
+            for line in plan:
+                self.assertFalse(line.startswith(f"SCAN {table}"), f"{path} {params}: {line}\n{sql}")
+
+    def test_item_list_and_pages(self):
+        for user in (self.admin, self.collectors[0]):
+            self.assertIndexed(user, "/items/", allowed=MONTHLY_COUNT)
+            self.client.force_authenticate(user)
+            next_page = self.client.get("/items/").data["next"]
+            self.assertIndexed(user, next_page, allowed=MONTHLY_COUNT)
+
+    def test_item_filters(self):
+        category = ItemCategory.objects.first()
+        supplier = Supplier.objects.first()
+        window = {"date_from": (self.today - timedelta(days=30)).isoformat()}
+        months = {"date_from": (self.today - timedelta(days=90)).replace(day=1).isoformat()}
+        combinations = [
+            {"category": category.id},
+            months,
+            {"condition": "fair"},
+            {"source_supplier": supplier.id},
+            window,
+            {"category": category.id, **window},
+            {"condition": "good", "source_supplier": supplier.id},
+            {"category": category.id, "ordering": "date_collected"},
+            {"source_supplier": supplier.id, "ordering": "date_collected", **window},
+        ]
+        for user in (self.admin, self.collectors[0]):
+            self.client.force_authenticate(user)
+            for params in combinations:
+                self.assertSeeks(user, "/items/", params, "items_ewasteitem")
+                next_page = self.client.get("/items/", params).data["next"]
+                if next_page:
+                    self.assertSeeks(user, next_page, None, "items_ewasteitem")
+        self.assertIndexed(
+            self.admin, "/items/", {"ordering": "date_collected"}, allowed=MONTHLY_COUNT
+        )
+
+    def test_transaction_filters(self):
+        category = ItemCategory.objects.first()
+        window = {
+            "date_from": (self.today - timedelta(days=30)).isoformat(),
+            "date_to": self.today.isoformat(),
+        }
+        combinations = [
+            {"category": category.id},
+            {"status": "stocked"},
+            {"buyer_name": "Buyer 1"},
+            window,
+            {"status": "sold", **window},
+            {"category": category.id, "ordering": "created_at"},
+            {"buyer_name": "Buyer 4", "ordering": "-buyer_name"},
+        ]
+        self.client.force_authenticate(self.admin)
+        for params in combinations:
+            self.assertSeeks(self.admin, "/transactions/", params, "transactions_transaction")
+            next_page = self.client.get("/transactions/", params).data["next"]
+            if next_page:
+                self.assertSeeks(self.admin, next_page, None, "transactions_transaction")
+        for ordering in ("created_at", "buyer_name"):
+            self.assertIndexed(self.admin, "/transactions/", {"ordering": ordering})
+        for ordering in ("-date_sold", "date_sold"):
+            self.assertIndexed(self.admin, "/transactions/", {"ordering": ordering, **window})
+
+    def test_item_exports(self):
+        window = {"date_from": (self.today - timedelta(days=30)).isoformat()}
+        for user in (self.admin, self.collectors[0]):
+            self.assertIndexed(user, "/items/export/", {"format": "ndjson", **window})
+
+    def test_transaction_list_and_export(self):
+        self.assertIndexed(self.admin, "/transactions/")
+        window = {
+            "format": "csv",
+            "date_from": (self.today - timedelta(days=30)).isoformat(),
+            "date_to": self.today.isoformat(),
+        }
+        self.assertIndexed(self.admin, "/transactions/export/", window)
+
+    def test_catalog_and_suppliers(self):
+        self.assertIndexed(self.collectors[0], "/categories/")
+        self.assertIndexed(self.collectors[0], "/suppliers/")
+
+    def test_analytics(self):
+        self.assertIndexed(self.admin, "/analytics/today/")
+        # Monthly history and the summary's all-time window fold every monthly
+        # rollup row by design, so the scan is over months x categories x
+        # conditions. The daily rollup is only read through a date range seek.
+        for path in ("/analytics/monthly/", "/analytics/summary/"):
+            self.assertIndexed(
+                self.admin, path, allowed=["SCAN analytics_monthlycollectionrollup"]
+            )
+        self.assertIndexed(self.admin, "/analytics/supplier-ranking/")
+        # A windowed ranking orders by sums over the window, which no index can
+        # hold; the rollup rows themselves must still come from a date range seek.
+        self.assertIndexed(
+            self.admin,
+            "/analytics/supplier-ranking/",
+            {"date_from": (self.today - timedelta(days=30)).isoformat()},
+            allowed=["USE TEMP B-TREE FOR ORDER BY"],
+        )
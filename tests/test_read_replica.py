@@ -0,0 +1,154 @@
+import asyncio
+import os
+import tempfile
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.db import connections, router
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.authentication import add_user_claims
+from accounts.models import RevokedToken
+from accounts.revocation import revocations
+from catalog.models import ItemCategory
+from catalog.prices import CategoryPriceTable
+from ewaste_api.middleware import ReadReplicaMiddleware
+from ewaste_api.routers import REPLICA_DB_ALIAS, use_primary, use_replica
+
+
+class ReplicaTestMixin:
+    """
+    Registers a temporary SQLite file with the current schema as the ``replica`` database.
+
+    It is added after the test case's own setup, so it is neither wrapped in
+    the per-test transaction nor blocked; ``replica_create`` removes what it
+    adds after each test.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.replica_directory = tempfile.TemporaryDirectory()
+        connections.settings[REPLICA_DB_ALIAS] = connections.configure_settings(
+            {
+                "default": {
+                    "ENGINE": "ewaste_api.db.sqlite3",
+                    "NAME": os.path.join(cls.replica_directory.name, "replica.sqlite3"),
+                }
+            }
+        )["default"]
+        # A streaming replica copies the primary's schema rather than running
+        # migrations, so create the tables directly from the models.
+        with connections[REPLICA_DB_ALIAS].schema_editor() as editor:
+            for model in apps.get_models():
+                editor.create_model(model)
+
+    @classmethod
+    def tearDownClass(cls):
+        connections[REPLICA_DB_ALIAS].close()
+        del connections[REPLICA_DB_ALIAS]
+        del connections.settings[REPLICA_DB_ALIAS]
+        cls.replica_directory.cleanup()
+        super().tearDownClass()
+
+    def replica_create(self, model, **fields):
+        instance = model.objects.using(REPLICA_DB_ALIAS).create(**fields)
+        self.addCleanup(instance.delete, using=REPLICA_DB_ALIAS)
+        return instance
+
+
+class ReplicaRoutingTestCase(ReplicaTestMixin, APITestCase):
+    def setUp(self):
+        cache.clear()
+        revocations.sync()
+        self.admin = get_user_model().objects.create_user(
+            username="admin", password="adminpass123", role="admin"
+        )
+        token = add_user_claims(AccessToken.for_user(self.admin), self.admin)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        ItemCategory.objects.create(name="Primary Boards", base_price_per_kg=1000)
+        self.replica_create(ItemCategory, name="Replica Boards", base_price_per_kg=1000)
+
+    def category_names(self, **headers):
+        response = self.client.get("/categories/", **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {category["name"] for category in response.data}
+
+    def test_safe_requests_read_from_the_replica(self):
+        self.assertEqual(self.category_names(), {"Replica Boards"})
+
+    def test_writes_pin_the_client_to_the_primary(self):
+        response = self.client.post(
+            "/categories/", {"name": "RAM", "base_price_per_kg": "7500"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(ItemCategory.objects.using(REPLICA_DB_ALIAS).filter(name="RAM").exists())
+        self.assertEqual(self.category_names(), {"Primary Boards", "RAM"})
+
+        cache.clear()  # the pin expires
+        self.assertEqual(self.category_names(), {"Replica Boards"})
+
+    def test_async_writes_pin_the_client_without_blocking(self):
+        async def get_response(request):
+            return HttpResponse()
+
+        def set_off_the_event_loop(*args, **kwargs):
+            with self.assertRaises(RuntimeError):
+                asyncio.get_running_loop()
+            return real_set(*args, **kwargs)
+
+        real_set = cache.set
+        middleware = ReadReplicaMiddleware(get_response)
+        request = RequestFactory().post("/categories/", HTTP_AUTHORIZATION="Bearer token")
+        with mock.patch.object(cache, "set", side_effect=set_off_the_event_loop) as cache_set:
+            async_to_sync(middleware)(request)
+        cache_set.assert_called_once()
+        self.assertTrue(cache.get(middleware.pin_key(request)))
+
+    def test_clients_can_ask_for_strong_consistency(self):
+        self.assertEqual(
+            self.category_names(HTTP_X_READ_CONSISTENCY="strong"), {"Primary Boards"}
+        )
+
+    def test_analytics_and_streamed_exports_run_on_the_replica(self):
+        replica = CaptureQueriesContext(connections[REPLICA_DB_ALIAS])
+        with self.assertNumQueries(0), replica:
+            self.assertEqual(self.client.get("/analytics/summary/").status_code, 200)
+            response = self.client.get("/items/export/?format=csv")
+            b"".join(response.streaming_content)
+        self.assertTrue(any("rollup" in query["sql"] for query in replica.captured_queries))
+        self.assertTrue(any("items_ewasteitem" in query["sql"] for query in replica.captured_queries))
+
+
+class ReadReplicaRouterTestCase(ReplicaTestMixin, TestCase):
+    def test_reads_route_inside_blocks_and_writes_go_to_the_primary(self):
+        category = self.replica_create(
+            ItemCategory, name="Replica Boards", base_price_per_kg=1000
+        )
+        with use_replica():
+            self.assertEqual(router.db_for_read(ItemCategory), REPLICA_DB_ALIAS)
+            self.assertEqual(router.db_for_write(ItemCategory, instance=category), "default")
+            for model in (Session, RevokedToken):
+                self.assertEqual(router.db_for_read(model), "default")
+            with use_primary():
+                self.assertEqual(router.db_for_read(ItemCategory), "default")
+        self.assertEqual(router.db_for_read(ItemCategory), "default")
+
+    def test_price_table_reloads_from_the_primary(self):
+        category = ItemCategory.objects.create(name="Boards", base_price_per_kg=2000)
+        # The replica still holds the category's old price.
+        self.replica_create(ItemCategory, id=category.id, name="Boards", base_price_per_kg=1000)
+        table = CategoryPriceTable()
+        with use_replica():
+            self.assertEqual(router.db_for_read(ItemCategory), REPLICA_DB_ALIAS)
+            table.reload()
+            self.assertEqual(table.get(category.id), 2000)
@@ -0,0 +1,133 @@
+import io
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+from zoneinfo import ZoneInfo
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from catalog.models import ItemCategory
+from ewaste_api import renderers
+from ewaste_api.renderers import ORJSONParser, ORJSONRenderer
+from items.models import EWasteItem
+from suppliers.models import Supplier
+from transactions.models import Transaction
+
+SAMPLE = OrderedDict(
+    count=3,
+    weight_kg="12.500",
+    estimated_value=Decimal("68750.25"),
+    total=6000.0,
+    date_collected=date(2026, 10, 14),
+    created_at=datetime(2026, 10, 14, 9, 30, 1, 123456, tzinfo=ZoneInfo("Africa/Nairobi")),
+    synced_at=datetime(2026, 10, 14, 6, 30, tzinfo=dt_timezone.utc),
+    elapsed=timedelta(seconds=90),
+    reference=uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    label=gettext_lazy("Sold"),
+    buyer_name="Mũthoni\u2028Électronique",
+    tags={"boards"},
+    by_id={1: "one"},
+    results=[{"supplier_detail": None, "ok": True}],
+)
+
+
+class ORJSONRendererTestCase(SimpleTestCase):
+    def test_output_matches_the_stdlib_renderer(self):
+        self.assertEqual(ORJSONRenderer().render(SAMPLE), JSONRenderer().render(SAMPLE))
+
+    def test_indent_and_unsupported_values_fall_back(self):
+        for data, media_type in (
+            (SAMPLE, "application/json; indent=4"),
+            ({"big": 2**70}, None),
+        ):
+            with self.subTest(media_type=media_type):
+                self.assertEqual(
+                    ORJSONRenderer().render(data, media_type),
+                    JSONRenderer().render(data, media_type),
+                )
+
+    def test_floats_match_the_stdlib_renderer(self):
+        data = {"values": [1e16, -1.2345678901234568e17, 2.5e-7, 0.00001, 0.0001, 6000.0, 0.1 + 0.2]}
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_non_finite_floats_raise_like_the_stdlib_renderer(self):
+        for value in (float("nan"), float("inf"), float("-inf")):
+            payloads = [
+                {"total_weight_kg": value, "total_estimated_value": 1.5},
+                {"total_weight_kg": value},
+                {"results": [{"id": 1, "scores": (2, value)}], "next": None},
+                [value],
+            ]
+            for data in payloads:
+                with self.subTest(data=data):
+                    with self.assertRaisesMessage(ValueError, "Out of range float values"):
+                        JSONRenderer().render(data)
+                    with self.assertRaisesMessage(ValueError, "Out of range float values"):
+                        ORJSONRenderer().render(data)
+
+    def test_works_without_orjson(self):
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertEqual(ORJSONRenderer().render(SAMPLE), JSONRenderer().render(SAMPLE))
+            self.assertEqual(ORJSONParser().parse(io.BytesIO(b'{"a": [1]}')), {"a": [1]})
+
+
+class ORJSONParserTestCase(SimpleTestCase):
+    def parse_both(self, body, encoding="utf-8"):
+        context = {"encoding": encoding}
+        return (
+            ORJSONParser().parse(io.BytesIO(body), parser_context=context),
+            JSONParser().parse(io.BytesIO(body), parser_context=context),
+        )
+
+    def test_parses_like_the_stdlib_parser(self):
+        for body, encoding in (
+            ('{"weight_kg": "1.5", "items": [1, 2.5, null, "Mũthoni"]}'.encode(), "utf-8"),
+            (b'{"id": 1208925819614629174706176}', "utf-8"),
+            ('{"buyer": "É"}'.encode("utf-16"), "utf-16"),
+        ):
+            with self.subTest(body=body):
+                fast, stdlib = self.parse_both(body, encoding)
+                self.assertEqual(fast, stdlib)
+
+    def test_errors_match_the_stdlib_parser(self):
+        for body in (b'{"a": ', b'{"a": NaN}'):
+            with self.subTest(body=body):
+                with self.assertRaises(ParseError) as fast:
+                    ORJSONParser().parse(io.BytesIO(body))
+                with self.assertRaises(ParseError) as stdlib:
+                    JSONParser().parse(io.BytesIO(body))
+                self.assertEqual(str(fast.exception), str(stdlib.exception))
+
+
+class ORJSONResponseTestCase(APITestCase):
+    def test_api_responses_are_rendered_identically(self):
+        admin = get_user_model().objects.create_user(
+            username="admin", password="adminpass123", role="admin", is_staff=True
+        )
+        self.client.force_authenticate(admin)
+        category = ItemCategory.objects.create(name="Boards", base_price_per_kg="5500.00")
+        supplier = Supplier.objects.create(supplier_name="Gikomba")
+        for index in range(3):
+            EWasteItem.objects.create(
+                category=category,
+                source_supplier=supplier if index else None,
+                weight_kg=f"{index + 1}.250",
+                condition="good",
+                date_collected=date(2026, 10, index + 1),
+            )
+            Transaction.objects.create(
+                category=category, weight_kg="2", sale_price="99.95", buyer_name="Buyer"
+            )
+        for path in ("/items/", "/transactions/", "/analytics/supplier-ranking/"):
+            with self.subTest(path=path):
+                response = self.client.get(path)
+                self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+                self.assertEqual(response.content, JSONRenderer().render(response.data))
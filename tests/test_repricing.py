@@ -0,0 +1,96 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from catalog.models import ItemCategory
+from items.models import EWasteItem
+from items.pricing import reprice_category
+
+
+class RepricingTestCase(APITestCase):
+    def setUp(self):
+        self.User = get_user_model()
+        self.admin = self.User.objects.create_user(
+            username="admin", password="adminpass123", role="admin", is_staff=True
+        )
+        self.collector = self.User.objects.create_user(
+            username="collector", password="collectorpass123", role="collector"
+        )
+        self.category = ItemCategory.objects.create(name="Boards", base_price_per_kg="1.50")
+        self.other = ItemCategory.objects.create(name="RAM", base_price_per_kg="7500.00")
+        weights = ["0.010", "0.003", "0.005", "1.234", "12.345", "250.000"]
+        for weight in weights:
+            for condition in EWasteItem.ConditionChoices.values:
+                EWasteItem.objects.create(
+                    category=self.category,
+                    weight_kg=weight,
+                    condition=condition,
+                    date_collected=date.today(),
+                )
+        self.untouched = EWasteItem.objects.create(
+            category=self.other, weight_kg="1", condition="good", date_collected=date.today()
+        )
+
+    def change_price(self, price):
+        self.category.base_price_per_kg = Decimal(price)
+        self.category.save()
+
+    def assert_matches_model_pricing(self):
+        for item in EWasteItem.objects.select_related("category"):
+            self.assertEqual(item.estimated_value, item.compute_estimated_value(), item.weight_kg)
+
+    def test_reprice_matches_compute_estimated_value_including_ties(self):
+        for price in ["0.50", "2.50", "6123.47", "0.01"]:
+            self.change_price(price)
+            reprice_category(self.category, chunk_size=4)
+            self.assert_matches_model_pricing()
+
+    def test_dry_run_reports_delta_without_writing(self):
+        before = {item.pk: item.estimated_value for item in EWasteItem.objects.all()}
+        self.change_price("3.10")
+        expected_delta = sum(
+            item.compute_estimated_value() - item.estimated_value
+            for item in EWasteItem.objects.filter(category=self.category).select_related("category")
+        )
+        summary = reprice_category(self.category, chunk_size=5, dry_run=True)
+        self.assertEqual(summary["value_delta"], expected_delta)
+        self.assertEqual(summary["items"], 18)
+        self.assertEqual(summary["chunks"], 4)
+        self.assertEqual({item.pk: item.estimated_value for item in EWasteItem.objects.all()}, before)
+        summary = reprice_category(self.category, chunk_size=5)
+        self.assertEqual(summary["value_delta"], expected_delta)
+        self.assertEqual(EWasteItem.objects.get(pk=self.untouched.pk).estimated_value, Decimal("7500.00"))
+
+    def test_management_command_reprices_named_category(self):
+        self.change_price("9.99")
+        out = StringIO()
+        call_command("reprice_items", "Boards", "--chunk-size", "3", stdout=out)
+        self.assertIn("Repriced Boards: 18/18 items changed", out.getvalue())
+        self.assert_matches_model_pricing()
+
+    def test_reprice_action_is_admin_only(self):
+        self.change_price("4.00")
+        url = f"/categories/{self.category.pk}/reprice/"
+        token = self.client.post(
+            reverse("login"), {"username": "collector", "password": "collectorpass123"}, format="json"
+        ).data["access"]
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.assertEqual(self.client.post(url, format="json").status_code, status.HTTP_403_FORBIDDEN)
+
+        token = self.client.post(
+            reverse("login"), {"username": "admin", "password": "adminpass123"}, format="json"
+        ).data["access"]
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        response = self.client.post(url, {"dry_run": True}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["dry_run"])
+        self.assertEqual(response.data["items"], 18)
+        response = self.client.post(url, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assert_matches_model_pricing()
@@ -0,0 +1,104 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from analytics.models import DailyCollectionRollup, MonthlyCollectionRollup
+from analytics.rollups import rebuild_rollups
+from catalog.models import ItemCategory
+from items.bulk import create_items
+from items.models import EWasteItem
+from items.pricing import reprice_category
+from suppliers.models import Supplier
+
+
+class DailyCollectionRollupTestCase(TestCase):
+    def setUp(self):
+        self.boards = ItemCategory.objects.create(name="Boards", base_price_per_kg=5000)
+        self.ram = ItemCategory.objects.create(name="RAM", base_price_per_kg=7500)
+        self.supplier = Supplier.objects.create(supplier_name="Supplier One")
+        self.today = date.today()
+
+    def create_item(self, **overrides):
+        values = {
+            "category": self.boards,
+            "weight_kg": Decimal("2.000"),
+            "condition": EWasteItem.ConditionChoices.GOOD,
+            "source_supplier": self.supplier,
+            "date_collected": self.today,
+        }
+        values.update(overrides)
+        return EWasteItem.objects.create(**values)
+
+    def snapshot(self):
+        totals = ("total_weight_kg", "total_estimated_value", "item_count")
+        daily = DailyCollectionRollup.objects.values_list(
+            "date", "category_id", "condition", "supplier_id", *totals
+        )
+        monthly = MonthlyCollectionRollup.objects.values_list(
+            "month", "category_id", "condition", *totals
+        )
+        return sorted(daily, key=repr), sorted(monthly, key=repr)
+
+    def assert_matches_rebuild(self):
+        incremental = self.snapshot()
+        rebuild_rollups()
+        self.assertEqual(incremental, self.snapshot())
+
+    def test_create_update_and_delete_maintain_rollup(self):
+        item = self.create_item()
+        self.create_item(weight_kg=Decimal("1.500"))
+        row = DailyCollectionRollup.objects.get()
+        self.assertEqual(row.item_count, 2)
+        self.assertEqual(row.total_weight_kg, Decimal("3.500"))
+        self.assertEqual(row.total_estimated_value, Decimal("17500.00"))
+        self.assertEqual(MonthlyCollectionRollup.objects.get().item_count, 2)
+
+        item.category = self.ram
+        item.date_collected = self.today - timedelta(days=1)
+        item.save()
+        self.assertEqual(DailyCollectionRollup.objects.count(), 2)
+        self.assert_matches_rebuild()
+
+        item.delete()
+        self.assertEqual(DailyCollectionRollup.objects.count(), 1)
+        self.assert_matches_rebuild()
+
+    def test_supplier_deletion_merges_into_unassigned_rows(self):
+        self.create_item()
+        self.create_item(source_supplier=None)
+        self.supplier.delete()
+        row = DailyCollectionRollup.objects.get()
+        self.assertIsNone(row.supplier_id)
+        self.assertEqual(row.item_count, 2)
+        self.assert_matches_rebuild()
+
+    def test_bulk_intake_and_repricing_keep_rollup_in_sync(self):
+        self.create_item()
+        create_items(
+            [
+                {
+                    "category": self.boards,
+                    "weight_kg": Decimal("0.333"),
+                    "condition": condition,
+                    "source_supplier": None,
+                    "date_collected": self.today,
+                }
+                for condition in EWasteItem.ConditionChoices.values
+            ]
+        )
+        self.assert_matches_rebuild()
+        self.boards.base_price_per_kg = Decimal("5123.45")
+        self.boards.save()
+        reprice_category(self.boards, chunk_size=2)
+        self.assert_matches_rebuild()
+
+    def test_rebuild_command_regenerates_table(self):
+        self.create_item()
+        DailyCollectionRollup.objects.all().delete()
+        out = StringIO()
+        call_command("rebuild_rollups", stdout=out)
+        self.assertIn("Rebuilt 1 daily rollup rows", out.getvalue())
+        self.assertEqual(DailyCollectionRollup.objects.get().item_count, 1)
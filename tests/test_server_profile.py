@@ -0,0 +1,86 @@
+import os
+import runpy
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from items.management.commands.benchmark_server import PROFILES, drive
+
+CONFIG = os.path.join(settings.BASE_DIR, "gunicorn.conf.py")
+
+
+def load_config(**env):
+    with mock.patch.dict(os.environ):
+        for name in list(os.environ):
+            if name.startswith("GUNICORN_") or name == "WEB_CONCURRENCY":
+                del os.environ[name]
+        os.environ.update(env)
+        return runpy.run_path(CONFIG)
+
+
+class GunicornConfigTestCase(SimpleTestCase):
+    def test_defaults_preload_and_recycle_sync_workers(self):
+        config = load_config()
+        self.assertEqual(config["worker_class"], "sync")
+        self.assertEqual(config["workers"], 2 * config["cpu_count"] + 1)
+        self.assertEqual(config["threads"], 1)
+        self.assertTrue(config["preload_app"])
+        self.assertEqual((config["max_requests"], config["max_requests_jitter"]), (1000, 100))
+        self.assertEqual(PROFILES["tuned"], CONFIG)
+
+    def test_environment_overrides(self):
+        config = load_config(
+            GUNICORN_WORKER_CLASS="gthread",
+            WEB_CONCURRENCY="3",
+            GUNICORN_PRELOAD="false",
+            GUNICORN_MAX_REQUESTS="0",
+        )
+        self.assertEqual((config["worker_class"], config["workers"]), ("gthread", 3))
+        self.assertEqual(config["threads"], 4)
+        self.assertFalse(config["preload_app"])
+        self.assertEqual(config["max_requests"], 0)
+
+    def test_post_fork_closes_inherited_connections(self):
+        config = load_config()
+        database, cache = mock.Mock(), mock.Mock()
+        with mock.patch("django.db.connections.all", return_value=[database]), mock.patch(
+            "django.core.cache.caches.all", return_value=[cache]
+        ):
+            config["post_fork"](mock.Mock(), mock.Mock())
+        database.close.assert_called_once_with()
+        cache.close.assert_called_once_with()
+
+
+class DriveTestCase(SimpleTestCase):
+    def test_reports_throughput_latency_and_errors(self):
+        seen = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                seen.append(self.headers["Authorization"])
+                self.send_response(200 if self.path == "/ok/" else 500)
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+
+        result = drive(f"{base}/ok/", {"Authorization": "Bearer t"}, 2, 0.2)
+        self.assertGreater(result["requests"], 0)
+        self.assertEqual(result["errors"], 0)
+        self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+        self.assertEqual(set(seen), {"Bearer t"})
+
+        result = drive(f"{base}/broken/", {}, 1, 0.1)
+        self.assertEqual(result["requests"], 0)
+        self.assertGreater(result["errors"], 0)
+        self.assertIsNone(result["p50_ms"])
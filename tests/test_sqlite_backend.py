@@ -0,0 +1,88 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import skipUnless
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection, connections, transaction
+from django.test import SimpleTestCase, TestCase
+
+from ewaste_api.db.sqlite3.base import DatabaseWrapper
+from items.management.commands.benchmark_sqlite_writers import (
+    register_database,
+    unregister_database,
+)
+
+
+class TunedSQLiteBackendTestCase(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        register_database(
+            "tuned",
+            "ewaste_api.db.sqlite3",
+            settings.SQLITE_OPTIONS,
+            os.path.join(directory.name, "tuned.sqlite3"),
+        )
+        self.addCleanup(unregister_database, "tuned")
+
+    def pragma(self, name):
+        with connections["tuned"].cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+
+    def test_new_connections_apply_the_profile(self):
+        self.assertEqual(self.pragma("journal_mode"), "wal")
+        self.assertEqual(self.pragma("synchronous"), 1)  # NORMAL
+        self.assertEqual(self.pragma("busy_timeout"), 20000)
+        self.assertEqual(self.pragma("temp_store"), 2)  # MEMORY
+        self.assertEqual(self.pragma("cache_size"), -65536)
+        self.assertEqual(self.pragma("foreign_keys"), 1)
+
+    def test_atomic_blocks_begin_immediate(self):
+        statements = []
+        tuned = connections["tuned"]
+        with tuned.execute_wrapper(
+            lambda execute, sql, *args: statements.append(sql) or execute(sql, *args)
+        ):
+            with transaction.atomic(using="tuned"):
+                self.pragma("user_version")
+        self.assertEqual(statements[0], "BEGIN IMMEDIATE")
+
+    def test_rejects_unknown_transaction_modes(self):
+        config = connections.configure_settings(
+            {"default": {"ENGINE": "ewaste_api.db.sqlite3", "NAME": ":memory:"}}
+        )["default"]
+        config["OPTIONS"] = {"transaction_mode": "lazy"}
+        with self.assertRaises(ImproperlyConfigured):
+            DatabaseWrapper(config)
+
+
+@skipUnless(connection.vendor == "sqlite", "SQLite only")
+class DefaultDatabaseTestCase(TestCase):
+    def test_the_sqlite_fallback_uses_the_tuned_backend(self):
+        self.assertIsInstance(connections["default"], DatabaseWrapper)
+        self.assertEqual(connections["default"].transaction_mode, "IMMEDIATE")
+
+
+class WriterBenchmarkTestCase(SimpleTestCase):
+    def test_reports_commits_and_sustained_writers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "writers.json")
+            call_command(
+                "benchmark_sqlite_writers",
+                writers="1,4",
+                duration=0.2,
+                output=path,
+                stdout=StringIO(),
+            )
+            with open(path) as handle:
+                report = json.load(handle)
+        self.assertEqual(set(report["profiles"]), {"stock", "tuned"})
+        for run in report["profiles"]["tuned"]:
+            self.assertGreater(run["commits"], 0)
+            self.assertEqual(run["errors"], 0)
+        self.assertEqual(report["sustained_writers"]["tuned"], 4)
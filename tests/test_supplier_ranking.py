@@ -0,0 +1,143 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from analytics.rollups import rebuild_rollups
+from catalog.models import ItemCategory
+from items.models import EWasteItem
+from suppliers.models import Supplier
+
+
+def add_item(category, supplier, weight="1", collected=None):
+    return EWasteItem.objects.create(
+        category=category,
+        source_supplier=supplier,
+        weight_kg=weight,
+        condition=EWasteItem.ConditionChoices.GOOD,
+        date_collected=collected or date.today(),
+    )
+
+
+class SupplierTotalsTestCase(TestCase):
+    def setUp(self):
+        self.category = ItemCategory.objects.create(name="Boards", base_price_per_kg=1000)
+        self.first = Supplier.objects.create(supplier_name="First")
+        self.second = Supplier.objects.create(supplier_name="Second")
+        self.today = date.today()
+
+    def totals(self, supplier):
+        supplier.refresh_from_db()
+        return (
+            supplier.item_count,
+            supplier.total_weight_kg,
+            supplier.total_estimated_value,
+            supplier.last_collected,
+        )
+
+    def test_item_writes_keep_supplier_totals_current(self):
+        older = add_item(self.category, self.first, "2", self.today - timedelta(days=5))
+        newer = add_item(self.category, self.first, "1", self.today)
+        self.assertEqual(
+            self.totals(self.first), (2, Decimal("3.000"), Decimal("3000.00"), self.today)
+        )
+
+        newer.source_supplier = self.second
+        newer.save()
+        self.assertEqual(
+            self.totals(self.first),
+            (1, Decimal("2.000"), Decimal("2000.00"), self.today - timedelta(days=5)),
+        )
+        self.assertEqual(
+            self.totals(self.second), (1, Decimal("1.000"), Decimal("1000.00"), self.today)
+        )
+
+        older.delete()
+        self.assertEqual(self.totals(self.first), (0, Decimal("0.000"), Decimal("0.00"), None))
+
+    def test_rebuild_recomputes_drifted_totals(self):
+        add_item(self.category, self.first, "2")
+        add_item(self.category, self.second, "4", self.today - timedelta(days=1))
+        Supplier.objects.update(item_count=99, total_estimated_value=0, last_collected=None)
+        rebuild_rollups()
+        self.assertEqual(
+            self.totals(self.first), (1, Decimal("2.000"), Decimal("2000.00"), self.today)
+        )
+        self.assertEqual(
+            self.totals(self.second),
+            (1, Decimal("4.000"), Decimal("4000.00"), self.today - timedelta(days=1)),
+        )
+
+
+class SupplierRankingApiTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            username="collector", password="collectorpass123", role="collector"
+        )
+        self.client.force_authenticate(self.user)
+        self.category = ItemCategory.objects.create(name="Boards", base_price_per_kg=1000)
+        self.today = date.today()
+        self.suppliers = []
+        for index, weight in enumerate(["5", "3", "3", "1"]):
+            supplier = Supplier.objects.create(supplier_name=f"Supplier {index}")
+            add_item(self.category, supplier, weight, self.today - timedelta(days=index * 10))
+            self.suppliers.append(supplier)
+        add_item(self.category, self.suppliers[3], "9", self.today - timedelta(days=60))
+
+    def test_ranking_orders_by_total_value_and_pages_with_cursor(self):
+        url = reverse("analytics-suppliers")
+        response = self.client.get(url, {"limit": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ranking = response.data["ranking"]
+        self.assertEqual(
+            [entry["supplier_id"] for entry in ranking],
+            [self.suppliers[3].id, self.suppliers[0].id],
+        )
+        self.assertEqual(ranking[0]["item_count"], 2)
+        self.assertEqual(ranking[0]["total_estimated_value"], 10000.0)
+        self.assertEqual(ranking[0]["last_collected"], self.today - timedelta(days=30))
+        self.assertIsNone(response.data["previous"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(
+            [entry["supplier_id"] for entry in response.data["ranking"]],
+            [self.suppliers[1].id, self.suppliers[2].id],
+        )
+        self.assertIsNone(response.data["next"])
+
+    def test_top_page_query_count_does_not_depend_on_item_count(self):
+        url = reverse("analytics-suppliers")
+        with self.assertNumQueries(1):
+            self.client.get(url)
+        for _ in range(20):
+            add_item(self.category, self.suppliers[1])
+        cache.clear()
+        with self.assertNumQueries(1):
+            self.client.get(url)
+
+    def test_date_window_ranks_on_rollup_within_range(self):
+        url = reverse("analytics-suppliers")
+        response = self.client.get(
+            url, {"date_from": (self.today - timedelta(days=30)).isoformat(), "limit": 1}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["ranking"][0]["supplier_id"], self.suppliers[0].id)
+        response = self.client.get(response.data["next"])
+        response = self.client.get(response.data["next"])
+        self.assertEqual(response.data["ranking"][0]["supplier_id"], self.suppliers[2].id)
+        response = self.client.get(response.data["next"])
+        entry = response.data["ranking"][0]
+        self.assertEqual(entry["supplier_id"], self.suppliers[3].id)
+        self.assertEqual(entry["item_count"], 1)
+        self.assertEqual(entry["total_weight_kg"], 1.0)
+        self.assertIsNone(response.data["next"])
+
+    def test_invalid_window_is_rejected(self):
+        response = self.client.get(reverse("analytics-suppliers"), {"date_to": "soon"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,89 @@
+import json
+import os
+import tempfile
+from collections import Counter
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db.models import Sum
+from django.test import TestCase
+
+from analytics.models import DailyCollectionRollup
+from catalog.models import ItemCategory
+from items.models import EWasteItem
+from items.synthetic import SyntheticDataGenerator
+from suppliers.models import Supplier
+from transactions.models import Transaction
+
+
+class SyntheticDataTestCase(TestCase):
+    def test_generator_creates_skewed_priced_history(self):
+        summary = SyntheticDataGenerator(years=2, batch_size=100, seed=7).generate(
+            users=5, suppliers=20, categories=4, items=600, transactions=150
+        )
+        self.assertEqual(summary["items"], 600)
+        self.assertEqual(EWasteItem.objects.count(), 600)
+        self.assertEqual(Transaction.objects.count(), 150)
+        self.assertEqual(ItemCategory.objects.count(), 4)
+
+        for item in EWasteItem.objects.all()[:50]:
+            self.assertEqual(item.estimated_value, item.compute_estimated_value())
+        suppliers = Counter(
+            EWasteItem.objects.exclude(source_supplier=None).values_list("source_supplier", flat=True)
+        )
+        counts = sorted(suppliers.values(), reverse=True)
+        self.assertGreater(counts[0], 3 * counts[len(counts) // 2])
+
+        rollup_total = DailyCollectionRollup.objects.aggregate(total=Sum("item_count"))["total"]
+        self.assertEqual(rollup_total, 600)
+        top = Supplier.objects.order_by("-item_count").first()
+        self.assertEqual(top.item_count, counts[0])
+
+    def test_generator_is_repeatable_per_seed(self):
+        def snapshot():
+            return list(
+                EWasteItem.objects.order_by("id").values_list(
+                    "category__name", "weight_kg", "condition", "date_collected"
+                )
+            )
+
+        options = {"users": 2, "suppliers": 3, "items": 50, "transactions": 5}
+        SyntheticDataGenerator(seed=3).generate(**options)
+        first = snapshot()
+        EWasteItem.objects.all().delete()
+        Transaction.objects.all().delete()
+        Supplier.objects.all().delete()
+        get_user_model().objects.all().delete()
+        SyntheticDataGenerator(seed=3).generate(**options)
+        self.assertEqual(snapshot(), first)
+
+
+class BenchmarkCommandTestCase(TestCase):
+    def test_benchmark_reports_latency_and_queries_as_json(self):
+        get_user_model().objects.create_user(
+            username="admin", password="adminpass123", role="admin", is_staff=True
+        )
+        call_command(
+            "generate_synthetic_data",
+            items=40,
+            transactions=10,
+            suppliers=5,
+            users=2,
+            categories=3,
+            stdout=StringIO(),
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "report.json")
+            call_command("benchmark_endpoints", requests=2, warmup=0, output=path, stdout=StringIO())
+            with open(path) as handle:
+                report = json.load(handle)
+        names = {endpoint["name"] for endpoint in report["endpoints"]}
+        self.assertTrue(
+            {"item-list", "item-detail", "transaction-export", "analytics-suppliers"} <= names
+        )
+        self.assertEqual(report["dataset"]["items"], 40)
+        for endpoint in report["endpoints"]:
+            self.assertEqual(endpoint["status"], [200], endpoint["name"])
+            self.assertLessEqual(endpoint["p50_ms"], endpoint["p99_ms"])
+            self.assertIsNotNone(endpoint["queries"])
@@ -0,0 +1,133 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from accounts.authentication import user_claims_cache
+from accounts.models import RevocationCounter, RevokedToken
+from accounts.revocation import (
+    BloomFilter,
+    RevocationList,
+    RevocationVersion,
+    revocation_version,
+    revocations,
+)
+
+
+class TokenRevocationTestCase(APITestCase):
+    def setUp(self):
+        user_claims_cache.clear()
+        revocations.reset()
+        User = get_user_model()
+        self.collector = User.objects.create_user(username="collector", password="collectorpass123")
+        self.other = User.objects.create_user(username="other", password="otherpass123")
+        self.admin = User.objects.create_user(
+            username="admin", password="adminpass123", role="admin"
+        )
+
+    def login(self, username, password):
+        response = self.client.post(
+            reverse("login"), {"username": username, "password": password}, format="json"
+        )
+        return response.data
+
+    def use(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_revoked_access_token_is_rejected(self):
+        access = self.login("collector", "collectorpass123")["access"]
+        self.use(access)
+        response = self.client.post(reverse("token_revoke"))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertTrue(RevokedToken.objects.filter(user=self.collector).exists())
+
+        response = self.client.get("/items/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_unrevoked_tokens_skip_the_revocation_query(self):
+        self.use(self.login("collector", "collectorpass123")["access"])
+        self.client.get("/items/")
+        with self.assertNumQueries(1):  # the item page only
+            self.client.get("/items/")
+
+    def test_revoked_refresh_token_cannot_be_refreshed(self):
+        tokens = self.login("collector", "collectorpass123")
+        self.use(tokens["access"])
+        self.client.post(reverse("token_revoke"), {"token": tokens["refresh"]}, format="json")
+        response = self.client.post(
+            reverse("token_refresh"), {"refresh": tokens["refresh"]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_only_admins_revoke_other_users_tokens(self):
+        refresh = str(RefreshToken.for_user(self.other))
+        self.use(self.login("collector", "collectorpass123")["access"])
+        response = self.client.post(reverse("token_revoke"), {"token": refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.use(self.login("admin", "adminpass123")["access"])
+        response = self.client.post(reverse("token_revoke"), {"token": refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertTrue(RevokedToken.objects.filter(user=self.other).exists())
+
+    def test_invalid_token_is_a_validation_error(self):
+        self.use(self.login("collector", "collectorpass123")["access"])
+        response = self.client.post(reverse("token_revoke"), {"token": "garbage"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("token", response.data)
+
+    def test_revoking_prunes_expired_rows(self):
+        RevokedToken.objects.create(
+            jti="expired", user=self.collector, expires_at=timezone.now() - timedelta(minutes=1)
+        )
+        revocations.revoke(AccessToken.for_user(self.collector))
+        self.assertFalse(RevokedToken.objects.filter(jti="expired").exists())
+        self.assertEqual(RevokedToken.objects.count(), 1)
+
+
+class RevocationListTestCase(TestCase):
+    @override_settings(SHARED_VERSION_CHECK_SECONDS=0)
+    def test_other_workers_pick_up_revocations_after_a_version_bump(self):
+        worker = RevocationList()
+        token = AccessToken()
+        self.assertFalse(worker.is_revoked(token["jti"]))
+
+        # Revoked by another process: only the row and the counter change.
+        RevokedToken.objects.create(jti=token["jti"], expires_at=timezone.now() + timedelta(hours=1))
+        self.assertFalse(worker.is_revoked(token["jti"]))
+        revocation_version.bump()
+        self.assertTrue(worker.is_revoked(token["jti"]))
+
+    def test_revoking_bumps_the_counter_in_the_database(self):
+        # The counter is read from the table, so no cache has to be shared.
+        worker_version = RevocationVersion()
+        before = worker_version.current()
+        revocations.revoke(AccessToken())
+        self.assertEqual(RevocationCounter.objects.get().value, before + 1)
+        with override_settings(SHARED_VERSION_CHECK_SECONDS=0):
+            self.assertEqual(worker_version.current(), before + 1)
+
+    def test_a_missing_counter_row_is_recreated(self):
+        RevocationCounter.objects.all().delete()
+        self.assertEqual(RevocationVersion().current(), 0)
+        revocation_version.bump()
+        self.assertEqual(RevocationCounter.objects.get().value, 1)
+
+
+class BloomFilterTestCase(SimpleTestCase):
+    def test_no_false_negatives_and_few_false_positives(self):
+        bloom = BloomFilter(1000, 0.01)
+        members = [f"jti-{index}" for index in range(1000)]
+        for member in members:
+            bloom.add(member)
+        self.assertTrue(all(member in bloom for member in members))
+        false_positives = sum(f"other-{index}" in bloom for index in range(10000))
+        self.assertLess(false_positives, 300)
+
+    def test_empty_filter_contains_nothing(self):
+        self.assertNotIn("jti", BloomFilter(10, 0.01))
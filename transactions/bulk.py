@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.db import transaction
+
+from catalog.models import ItemCategory
+from ewaste_api.fields import preload_instances
+
+from .models import Transaction
+from .serializers import TransactionBulkSerializer
+
+
+def build_bulk_context(rows, context=None):
+    """Preload every category referenced by ``rows`` with one query."""
+    mappings = [row for row in rows if isinstance(row, dict)]
+    bulk_context = dict(context or {})
+    bulk_context["categories"] = preload_instances(
+        ItemCategory, (row.get("category") for row in mappings)
+    )
+    return bulk_context
+
+
+def validate_transaction_rows(rows, context=None):
+    """
+    Validate a batch of transaction payloads in one pass.
+
+    Returns ``(validated_rows, errors)`` like ``items.bulk.validate_item_rows``.
+    """
+    serializer = TransactionBulkSerializer(
+        data=rows, many=True, context=build_bulk_context(rows, context)
+    )
+    if serializer.is_valid():
+        return serializer.validated_data, []
+    errors = [
+        {"index": index, "errors": row_errors}
+        for index, row_errors in enumerate(serializer.errors)
+        if row_errors
+    ]
+    return [], errors
+
+
+def create_transactions(validated_rows):
+    """Insert a validated batch with ``bulk_create``."""
+    transactions = [Transaction(**data) for data in validated_rows]
+    with transaction.atomic():
+        Transaction.objects.bulk_create(
+            transactions, batch_size=settings.ITEMS_BULK_BATCH_SIZE
+        )
+    return transactions
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.10 on 2026-10-18 11:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0002_remove_transaction_transaction_ewaste__61e880_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='transaction',
+            options={'ordering': ['-created_at', 'id']},
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['-created_at', 'id'], name='transaction_created_0fdf85_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.10 on 2026-10-18 12:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0003_keyset_ordering'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='transaction',
+            name='transaction_date_so_4a9e3f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(condition=models.Q(('date_sold__isnull', False)), fields=['-date_sold', '-created_at', 'id'], name='transaction_sold_date_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.10 on 2026-10-18 13:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0004_sold_date_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='transaction',
+            name='transaction_categor_e3f163_idx',
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['category', '-created_at', 'id'], name='transaction_categor_83e184_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['status', '-created_at', 'id'], name='transaction_status_014ad7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['buyer_name', 'id'], name='transaction_buyer_n_d62867_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations
+
+INDEX_NAME = 'transaction_buyer_pattern_idx'
+
+
+def create_pattern_index(apps, schema_editor):
+    # Only Postgres can seek ``LIKE 'prefix%'`` on a non-C collation, and only
+    # with a pattern_ops index; the other backends use the range on buyer_name.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {INDEX_NAME} '
+        'ON transactions_transaction (buyer_name varchar_pattern_ops)'
+    )
+
+
+def drop_pattern_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0005_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_pattern_index, drop_pattern_index),
+    ]
@@ -23,10 +23,17 @@ class Transaction(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        ordering = ["-created_at"]
+        ordering = ["-created_at", "id"]
         indexes = [
-            models.Index(fields=["category"]),
-            models.Index(fields=["date_sold"]),
+            models.Index(fields=["-created_at", "id"]),
+            models.Index(fields=["category", "-created_at", "id"]),
+            models.Index(fields=["status", "-created_at", "id"]),
+            models.Index(fields=["buyer_name", "id"]),
+            models.Index(
+                fields=["-date_sold", "-created_at", "id"],
+                condition=models.Q(date_sold__isnull=False),
+                name="transaction_sold_date_idx",
+            ),
         ]
         constraints = [
             models.CheckConstraint(
@@ -1,8 +1,17 @@
 from rest_framework import serializers
 
+from catalog.models import ItemCategory
+from ewaste_api.fields import PreloadedPrimaryKeyRelatedField
+
 from .models import Transaction
 
 
+def ewaste_item_detail(category_id, category_name, weight_kg):
+    if not category_id or not weight_kg:
+        return None
+    return f"#{category_id} | {category_name} ({weight_kg} kgs)"
+
+
 class TransactionSerializer(serializers.ModelSerializer):
     ewaste_item_detail = serializers.SerializerMethodField(read_only=True)
     category_name = serializers.CharField(source="category.name", read_only=True)
@@ -30,9 +39,9 @@ class TransactionSerializer(serializers.ModelSerializer):
         )
 
     def get_ewaste_item_detail(self, obj):
-        if not obj.category or not obj.weight_kg:
+        if not obj.category_id:
             return None
-        return f"#{obj.category_id} | {obj.category.name} ({obj.weight_kg} kgs)"
+        return ewaste_item_detail(obj.category_id, obj.category.name, obj.weight_kg)
 
     def validate(self, attrs):
         status_value = attrs.get("status") or getattr(self.instance, "status", None)
@@ -42,3 +51,9 @@ class TransactionSerializer(serializers.ModelSerializer):
         if status_value == Transaction.StatusChoices.STOCKED and not attrs.get("date_sold"):
             attrs["date_sold"] = None
         return attrs
+
+
+class TransactionBulkSerializer(TransactionSerializer):
+    category = PreloadedPrimaryKeyRelatedField(
+        "categories", queryset=ItemCategory.objects.all()
+    )
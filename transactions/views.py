@@ -1,12 +1,63 @@
-from rest_framework import viewsets
+from rest_framework import decorators, viewsets
+from rest_framework.settings import api_settings
+
+from ewaste_api.exports import EXPORT_RENDERERS, streaming_export
+from ewaste_api.filters import (
+    DateRangeFilter,
+    ExactFilter,
+    KeysetOrderingFilter,
+    PrefixFilter,
+    QueryFilterBackend,
+)
+from ewaste_api.pagination import CountedKeysetPagination
+from ewaste_api.serialization import ValuesListMixin
 
 from .models import Transaction
-from .serializers import TransactionSerializer
+from .serializers import TransactionSerializer, ewaste_item_detail
+
+
+class TransactionPagination(CountedKeysetPagination):
+    ordering = ("-created_at", "id")
 
 
-class TransactionViewSet(viewsets.ModelViewSet):
+class TransactionViewSet(ValuesListMixin, viewsets.ModelViewSet):
     serializer_class = TransactionSerializer
+    pagination_class = TransactionPagination
     queryset = Transaction.objects.select_related("category")
+    filter_backends = [QueryFilterBackend, KeysetOrderingFilter]
+    query_filters = (
+        DateRangeFilter("date_sold"),
+        ExactFilter("category"),
+        ExactFilter("status"),
+        PrefixFilter("buyer_name"),
+    )
+    ordering_fields = {
+        "-created_at": ("-created_at", "id"),
+        "created_at": ("created_at", "-id"),
+        "-date_sold": ("-date_sold", "-created_at", "id"),
+        "date_sold": ("date_sold", "created_at", "-id"),
+        "buyer_name": ("buyer_name", "id"),
+        "-buyer_name": ("-buyer_name", "-id"),
+    }
+    # Unsold transactions have no date_sold; a date window excludes them on purpose.
+    ordering_requires = {
+        "-date_sold": ("date_from", "date_to"),
+        "date_sold": ("date_from", "date_to"),
+    }
+    list_computed_fields = {
+        "ewaste_item_detail": (ewaste_item_detail, ("category", "category__name", "weight_kg")),
+    }
+    export_columns = (
+        ("id", "id"),
+        ("category", "category_id"),
+        ("category_name", "category__name"),
+        ("weight_kg", "weight_kg"),
+        ("sale_price", "sale_price"),
+        ("buyer_name", "buyer_name"),
+        ("date_sold", "date_sold"),
+        ("status", "status"),
+        ("created_at", "created_at"),
+    )
 
     def get_queryset(self):
         user = self.request.user
@@ -15,3 +66,24 @@ class TransactionViewSet(viewsets.ModelViewSet):
         if user.is_staff or getattr(user, "role", "") == "admin":
             return self.queryset
         return self.queryset
+
+    def get_default_ordering(self, request):
+        # Order by the filtered column, so a date window or buyer prefix is a
+        # range seek on the index that also yields the rows in order.
+        params = request.query_params
+        if params.get("date_from") or params.get("date_to"):
+            return "-date_sold"
+        if params.get("buyer_name"):
+            return "buyer_name"
+        return "-created_at"
+
+    @decorators.action(
+        detail=False,
+        methods=["get"],
+        renderer_classes=[*api_settings.DEFAULT_RENDERER_CLASSES, *EXPORT_RENDERERS],
+    )
+    def export(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        return streaming_export(
+            queryset, self.export_columns, request.accepted_renderer.format, "transactions"
+        )